@@ -1,3 +1,10 @@
-from app.api import document_router, course_router, validation_router, report_router
+from app.api import document_router, course_router, validation_router, report_router, job_router, admin_router
 
-__all__ = ["document_router", "course_router", "validation_router", "report_router"]
+__all__ = [
+    "document_router",
+    "course_router",
+    "validation_router",
+    "report_router",
+    "job_router",
+    "admin_router"
+]
@@ -0,0 +1,69 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.schemas import JobResponse
+from app.services import job_service
+from app.services.ocr_cache import get_ocr_cache
+from app.services.reparse_service import ReparseService, REPARSE_CHUNK_SIZE
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/ocr-cache")
+def get_ocr_cache_stats():
+    """
+    Estatísticas do cache de OCR (acertos, falhas, tamanho, despejos)
+    Rota síncrona: a leitura do disco/banco roda no threadpool, fora do event loop
+    """
+    cache = get_ocr_cache()
+    if not cache:
+        return {"backend": "none", "enabled": False}
+    
+    return {"enabled": True, **cache.stats()}
+
+
+@router.delete("/ocr-cache", status_code=status.HTTP_204_NO_CONTENT)
+def clear_ocr_cache():
+    """
+    Limpar o cache de OCR
+    Rota síncrona: a remoção dos arquivos/registros roda no threadpool, fora do event loop
+    """
+    cache = get_ocr_cache()
+    if not cache:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cache de OCR desativado"
+        )
+    
+    cache.clear()
+    return None
+
+
+@router.post("/reparse", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reparse_extractions(
+    parser_version: Optional[str] = Query(None),
+    force: bool = Query(False),
+    chunk_size: int = Query(REPARSE_CHUNK_SIZE, ge=1, le=10000),
+    use_process_pool: bool = Query(True)
+):
+    """
+    Reprocessar as extrações a partir do texto já armazenado, sem OCR
+    Documentos extraídos com outra versão do parser (ou todos, com force) têm as extrações
+    substituídas; acompanhe o progresso (documentos) em GET /jobs/{job_id}
+    """
+    try:
+        service = ReparseService(
+            parser_version=parser_version,
+            chunk_size=chunk_size,
+            use_process_pool=use_process_pool,
+            force=force
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    job = job_service.submit("reparse", service.run)
+    return job.to_dict()
+
@@ -1,9 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.repositories import CourseRepository
+from app.core.database import get_async_db
+from app.repositories import AsyncCourseRepository
+from app.services import RevalidationService, job_service
+from app.services.eligibility_service import invalidate_catalog_index
+from app.services.pagination import decode_cursor, keyset_page, total_count_cache
 from app.schemas import (
     CourseCreate,
     CourseUpdate,
@@ -17,55 +20,71 @@ router = APIRouter(prefix="/courses", tags=["courses"])
 @router.post("/", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
 async def create_course(
     course_data: CourseCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Criar novo curso técnico
     """
-    repo = CourseRepository(db)
+    repo = AsyncCourseRepository(db)
     
     # Verificar se código já existe
-    existing = repo.get_course_by_code(course_data.code)
+    existing = await repo.get_course_by_code(course_data.code)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Curso com código '{course_data.code}' já existe"
         )
     
-    course = repo.create_course(course_data)
+    course = await repo.create_course(course_data)
+    total_count_cache.invalidate("courses")
+    invalidate_catalog_index()
     return course
 
 
 @router.get("/", response_model=CourseListResponse)
 async def list_courses(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1),
     active_only: bool = False,
-    db: Session = Depends(get_db)
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Listar todos os cursos
+    Listar todos os cursos por ID
+    Próxima página: repetir a chamada com o next_cursor da resposta (None na última)
     """
-    repo = CourseRepository(db)
-    courses = repo.get_all_courses(skip=skip, limit=limit, active_only=active_only)
-    total = repo.count_courses()
+    repo = AsyncCourseRepository(db)
+    filters = {"active_only": active_only}
+    try:
+        after_id = decode_cursor(cursor, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    courses = await repo.get_all_courses(skip=skip, limit=limit + 1, active_only=active_only, after_id=after_id)
+    courses, next_cursor = keyset_page(courses, limit, filters)
+    total = await total_count_cache.get_or_count(
+        "courses",
+        filters,
+        lambda: repo.count_courses(active_only=active_only)
+    )
     
     return {
         "courses": courses,
-        "total": total
+        "total": total,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/{course_id}", response_model=CourseResponse)
 async def get_course(
     course_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Buscar curso por ID
     """
-    repo = CourseRepository(db)
-    course = repo.get_course(course_id)
+    repo = AsyncCourseRepository(db)
+    course = await repo.get_course(course_id)
     
     if not course:
         raise HTTPException(
@@ -80,15 +99,18 @@ async def get_course(
 async def update_course(
     course_id: int,
     course_data: CourseUpdate,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Atualizar curso existente
+    Se os requisitos do curso mudarem (nova revisão), agenda a revalidação dos documentos já validados para ele;
+    o ID do job vai no cabeçalho X-Revalidation-Job (progresso em GET /jobs/{job_id})
     """
-    repo = CourseRepository(db)
+    repo = AsyncCourseRepository(db)
     
     # Verificar se curso existe
-    existing = repo.get_course(course_id)
+    existing = await repo.get_course(course_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,27 +119,40 @@ async def update_course(
     
     # Verificar se novo código já existe em outro curso
     if course_data.code:
-        code_exists = repo.get_course_by_code(course_data.code)
+        code_exists = await repo.get_course_by_code(course_data.code)
         if code_exists and code_exists.id != course_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Código '{course_data.code}' já está em uso"
             )
     
-    course = repo.update_course(course_id, course_data)
+    previous_revision = existing.revision
+    course = await repo.update_course(course_id, course_data)
+    invalidate_catalog_index()
+    if course_data.is_active is not None:
+        total_count_cache.invalidate("courses")
+    
+    if course.revision != previous_revision:
+        job = job_service.submit(
+            "revalidation",
+            RevalidationService().run,
+            course_id=course.id
+        )
+        response.headers["X-Revalidation-Job"] = job.id
+    
     return course
 
 
 @router.delete("/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_course(
     course_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Deletar curso
     """
-    repo = CourseRepository(db)
-    course = repo.get_course(course_id)
+    repo = AsyncCourseRepository(db)
+    course = await repo.get_course(course_id)
     
     if not course:
         raise HTTPException(
@@ -125,5 +160,7 @@ async def delete_course(
             detail="Curso não encontrado"
         )
     
-    repo.delete_course(course_id)
+    await repo.delete_course(course_id)
+    total_count_cache.invalidate("courses")
+    invalidate_catalog_index()
     return None
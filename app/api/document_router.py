@@ -1,16 +1,20 @@
 import os
 import shutil
-from typing import List
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.config import settings
-from app.repositories import DocumentRepository
-from app.services import OCRService
+from app.repositories import AsyncDocumentRepository, AsyncCourseRepository
+from app.services import ExtractionService, job_service
+from app.services.pagination import decode_cursor, keyset_page, total_count_cache
+from app.services.text_storage import decompress_text, page_text
 from app.schemas import (
     DocumentUploadResponse,
-    DocumentExtractionResponse
+    DocumentExtractionResponse,
+    DocumentRawTextResponse,
+    JobResponse
 )
 
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -19,7 +23,7 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 @router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload de documento (imagem ou PDF) para extração de dados
@@ -57,26 +61,44 @@ async def upload_document(
     file_type = "pdf" if file_extension == ".pdf" else "image"
     
     # Salvar no banco de dados
-    repo = DocumentRepository(db)
-    document = repo.create_document(
+    repo = AsyncDocumentRepository(db)
+    document = await repo.create_document(
         filename=file.filename,
         file_path=file_path,
         file_type=file_type
     )
+    total_count_cache.invalidate("documents")
     
     return document
 
 
-@router.post("/{document_id}/extract", response_model=List[DocumentExtractionResponse])
+@router.post(
+    "/{document_id}/extract",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def extract_document_data(
     document_id: int,
-    db: Session = Depends(get_db)
+    first_page: Optional[int] = Query(None, ge=1),
+    last_page: Optional[int] = Query(None, ge=1),
+    course_id: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Extrair dados de um documento usando OCR
+    Enfileirar extração de dados de um documento usando OCR
+    Retorna o job criado; acompanhe o progresso em GET /jobs/{job_id}
+    first_page/last_page (PDF) limitam o OCR às páginas relevantes
+    course_id ativa a extração incremental: o OCR para assim que
+    as experiências lidas já aprovam o documento no curso
     """
-    repo = DocumentRepository(db)
-    document = repo.get_document(document_id)
+    if first_page and last_page and first_page > last_page:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="first_page deve ser menor ou igual a last_page"
+        )
+    
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
     
     if not document:
         raise HTTPException(
@@ -91,53 +113,36 @@ async def extract_document_data(
             detail="Arquivo do documento não encontrado"
         )
     
-    # Extrair texto usando OCR
-    ocr_service = OCRService()
-    raw_text = ocr_service.extract_text(document.file_path, document.file_type)
-    
-    if not raw_text:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Não foi possível extrair texto do documento"
-        )
-    
-    # Parsear experiências profissionais
-    experiences = ocr_service.parse_work_experience(raw_text)
-    
-    if not experiences:
+    if course_id is not None and not await AsyncCourseRepository(db).get_course(course_id):
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Não foi possível identificar experiências profissionais no documento"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Curso não encontrado"
         )
     
-    # Salvar extrações no banco
-    extractions = []
-    for exp in experiences:
-        extraction = repo.create_extraction(
-            document_id=document.id,
-            company_name=exp.get('company_name'),
-            position=exp.get('position'),
-            start_date=exp.get('start_date'),
-            end_date=exp.get('end_date'),
-            months_worked=exp.get('months_worked'),
-            raw_text=raw_text,
-            extracted_data=exp
-        )
-        extractions.append(extraction)
+    # Executar OCR no pool de workers
+    extraction_service = ExtractionService()
+    job = job_service.submit(
+        "extraction",
+        extraction_service.run_extraction,
+        document_id=document.id,
+        first_page=first_page,
+        last_page=last_page,
+        course_id=course_id
+    )
     
-    return extractions
+    return job.to_dict()
 
 
 @router.get("/{document_id}", response_model=DocumentUploadResponse)
 async def get_document(
     document_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Buscar informações de um documento
     """
-    repo = DocumentRepository(db)
-    document = repo.get_document(document_id)
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
     
     if not document:
         raise HTTPException(
@@ -151,13 +156,13 @@ async def get_document(
 @router.get("/{document_id}/extractions", response_model=List[DocumentExtractionResponse])
 async def get_document_extractions(
     document_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Buscar todas as extrações de um documento
     """
-    repo = DocumentRepository(db)
-    document = repo.get_document(document_id)
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
     
     if not document:
         raise HTTPException(
@@ -165,34 +170,105 @@ async def get_document_extractions(
             detail="Documento não encontrado"
         )
     
-    extractions = repo.get_extractions_by_document(document_id)
+    extractions = await repo.get_extractions_by_document(document_id)
     return extractions
 
 
+@router.get("/{document_id}/raw-text", response_model=DocumentRawTextResponse)
+async def get_document_raw_text(
+    document_id: int,
+    page: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Buscar o texto completo extraído do documento (armazenado comprimido, uma vez por documento)
+    page retorna apenas o texto de uma página
+    """
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Documento não encontrado"
+        )
+    
+    document_text = await repo.get_document_text(document_id)
+    if document_text:
+        text = decompress_text(document_text.codec, document_text.compressed_text)
+        page_offsets = document_text.page_offsets or []
+        codec = document_text.codec
+        original_size = document_text.original_size
+        compressed_size = len(document_text.compressed_text)
+    else:
+        # Extração anterior ao armazenamento por documento
+        text = await repo.get_legacy_raw_text(document_id)
+        if text is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Documento não possui texto extraído. Execute a extração primeiro."
+            )
+        page_offsets, codec, compressed_size = [], None, None
+        original_size = len(text.encode("utf-8"))
+    
+    if page is not None:
+        text = page_text(text, page_offsets, page)
+        if text is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Página não encontrada no texto extraído"
+            )
+    
+    return {
+        "document_id": document_id,
+        "codec": codec,
+        "original_size": original_size,
+        "compressed_size": compressed_size,
+        "pages": [number for number, _ in page_offsets],
+        "page": page,
+        "text": text
+    }
+
+
 @router.get("/", response_model=List[DocumentUploadResponse])
 async def list_documents(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Listar todos os documentos
+    Listar todos os documentos por ID
+    Total no cabeçalho X-Total-Count; próxima página: repetir a chamada com o
+    cursor do cabeçalho X-Next-Cursor (ausente na última página)
     """
-    repo = DocumentRepository(db)
-    documents = repo.get_all_documents(skip=skip, limit=limit)
+    repo = AsyncDocumentRepository(db)
+    try:
+        after_id = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    documents = await repo.get_all_documents(skip=skip, limit=limit + 1, after_id=after_id)
+    documents, next_cursor = keyset_page(documents, limit)
+    total = await total_count_cache.get_or_count("documents", None, repo.count_documents)
+    
+    response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return documents
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
     document_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Deletar um documento e seus dados relacionados
     """
-    repo = DocumentRepository(db)
-    document = repo.get_document(document_id)
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
     
     if not document:
         raise HTTPException(
@@ -205,6 +281,7 @@ async def delete_document(
         os.remove(document.file_path)
     
     # Deletar do banco
-    repo.delete_document(document_id)
+    await repo.delete_document(document_id)
+    total_count_cache.invalidate("documents")
     
     return None
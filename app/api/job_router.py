@@ -0,0 +1,66 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.repositories import AsyncDocumentRepository
+from app.services import job_service
+from app.schemas import JobResponse, DocumentExtractionResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/", response_model=List[JobResponse])
+async def list_jobs(document_id: Optional[int] = None):
+    """
+    Listar jobs em memória (mais recentes primeiro)
+    """
+    return [job.to_dict() for job in job_service.list_jobs(document_id=document_id)]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Consultar status, progresso e resultado de um job
+    """
+    job = job_service.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job não encontrado"
+        )
+    
+    job_data = job.to_dict()
+    if job.status == job.COMPLETED:
+        repo = AsyncDocumentRepository(db)
+        job_data["extractions"] = await repo.get_extractions_by_ids(job_data["extraction_ids"])
+    
+    return job_data
+
+
+@router.get("/{job_id}/extractions", response_model=List[DocumentExtractionResponse])
+async def get_job_extractions(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Buscar as extrações geradas por um job concluído
+    """
+    job = job_service.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job não encontrado"
+        )
+    
+    if job.status != job.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job ainda não concluído (status: {job.status})"
+        )
+    
+    repo = AsyncDocumentRepository(db)
+    return await repo.get_extractions_by_ids(job.extraction_ids)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.services import ReportService
+from app.core.database import get_async_db
+from app.services import AsyncReportService
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -10,14 +10,14 @@ router = APIRouter(prefix="/reports", tags=["reports"])
 @router.get("/document/{document_id}")
 async def get_document_report(
     document_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Gerar relatório completo de um documento
     Inclui: informações do documento, extrações e validações
     """
-    report_service = ReportService()
-    report = report_service.generate_document_report(document_id, db)
+    report_service = AsyncReportService()
+    report = await report_service.generate_document_report(document_id, db)
     
     if "error" in report:
         raise HTTPException(
@@ -31,13 +31,13 @@ async def get_document_report(
 @router.get("/course/{course_id}/statistics")
 async def get_course_statistics(
     course_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Gerar estatísticas de validações de um curso
     """
-    report_service = ReportService()
-    statistics = report_service.generate_course_statistics(course_id, db)
+    report_service = AsyncReportService()
+    statistics = await report_service.generate_course_statistics(course_id, db)
     
     if "error" in statistics:
         raise HTTPException(
@@ -1,14 +1,18 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.repositories import DocumentRepository, CourseRepository
-from app.services import ValidationService, ReportService
+from app.core.database import get_async_db, run_with_session
+from app.repositories import AsyncDocumentRepository, AsyncCourseRepository
+from app.services import ValidationService, AsyncReportService, EligibilityService, BatchValidationService
 from app.schemas import (
     ValidationRequest,
     ValidationResponse,
-    ReportResponse
+    BatchValidationRequest,
+    BatchValidationResponse,
+    ReportResponse,
+    EligibilityResponse
 )
 
 router = APIRouter(prefix="/validations", tags=["validations"])
@@ -17,16 +21,19 @@ router = APIRouter(prefix="/validations", tags=["validations"])
 @router.post("/", response_model=ValidationResponse, status_code=status.HTTP_201_CREATED)
 async def validate_document(
     validation_request: ValidationRequest,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Validar experiência profissional de um documento para um curso específico
+    Idempotente: se as extrações e a revisão do curso não mudaram, retorna (200)
+    a validação já existente em vez de recalcular e gravar outra
     """
-    doc_repo = DocumentRepository(db)
-    course_repo = CourseRepository(db)
+    doc_repo = AsyncDocumentRepository(db)
+    course_repo = AsyncCourseRepository(db)
     
     # Verificar se documento existe
-    document = doc_repo.get_document(validation_request.document_id)
+    document = await doc_repo.get_document(validation_request.document_id)
     if not document:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +41,7 @@ async def validate_document(
         )
     
     # Verificar se curso existe
-    course = course_repo.get_course(validation_request.course_id)
+    course = await course_repo.get_course(validation_request.course_id)
     if not course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,41 +49,74 @@ async def validate_document(
         )
     
     # Buscar extrações do documento
-    extractions = doc_repo.get_extractions_by_document(validation_request.document_id)
+    extractions = await doc_repo.get_extractions_by_document(validation_request.document_id)
     if not extractions:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Documento não possui dados extraídos. Execute a extração primeiro."
         )
     
-    # Validar primeira extração (pode ser expandido para validar todas)
+    # Mesma entrada já validada: reaproveitar o resultado
     validation_service = ValidationService()
-    validation_result = validation_service.validate_experience(extractions[0], course)
+    input_hash = validation_service.input_hash(extractions, course)
+    existing = await doc_repo.get_validation_by_input_hash(document.id, course.id, input_hash)
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        return existing
+    
+    # Validar o documento com todas as experiências (períodos sobrepostos contam uma vez)
+    validation_result = validation_service.validate_multiple_experiences(extractions, course)
     
     # Salvar validação no banco
-    validation = doc_repo.create_validation(
+    validation = await doc_repo.create_validation(
         document_id=validation_request.document_id,
         course_id=validation_request.course_id,
         status=validation_result["status"],
         required_months=validation_result["required_months"],
         found_months=validation_result["found_months"],
         position_match=validation_result.get("position_match"),
-        validation_details=validation_result.get("details")
+        validation_details=validation_result.get("details"),
+        input_hash=input_hash
     )
     
     return validation
 
 
+@router.post("/batch", response_model=BatchValidationResponse, status_code=status.HTTP_201_CREATED)
+async def validate_documents_batch(
+    batch_request: BatchValidationRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Validar vários documentos (ex.: uma turma inteira) para um curso
+    Retorna o resultado de cada documento e a contagem por status;
+    documentos inexistentes ou sem extração aparecem com status "error"
+    """
+    course = await AsyncCourseRepository(db).get_course(batch_request.course_id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Curso não encontrado"
+        )
+    
+    # Serviço em lote (síncrono, CPU: n-gramas, hashes, NumPy) no threadpool com sessão síncrona
+    # própria; em run_sync ele rodaria na thread do event loop e o bloquearia
+    return await run_in_threadpool(
+        run_with_session,
+        lambda session: BatchValidationService().validate_documents(course, batch_request.document_ids, session)
+    )
+
+
 @router.get("/{validation_id}", response_model=ValidationResponse)
 async def get_validation(
     validation_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Buscar validação por ID
     """
-    repo = DocumentRepository(db)
-    validation = repo.get_validation(validation_id)
+    repo = AsyncDocumentRepository(db)
+    validation = await repo.get_validation(validation_id)
     
     if not validation:
         raise HTTPException(
@@ -90,13 +130,13 @@ async def get_validation(
 @router.get("/document/{document_id}", response_model=List[ValidationResponse])
 async def get_document_validations(
     document_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Buscar todas as validações de um documento
     """
-    repo = DocumentRepository(db)
-    document = repo.get_document(document_id)
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
     
     if not document:
         raise HTTPException(
@@ -104,20 +144,59 @@ async def get_document_validations(
             detail="Documento não encontrado"
         )
     
-    validations = repo.get_validations_by_document(document_id)
+    validations = await repo.get_validations_by_document(document_id)
     return validations
 
 
+@router.get("/document/{document_id}/eligibility", response_model=EligibilityResponse)
+async def get_document_eligibility(
+    document_id: int,
+    include_rejected: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Avaliar o documento contra todos os cursos ativos de uma vez
+    Retorna os cursos para os quais o candidato é elegível (aprovados primeiro);
+    só os cursos com cargo ou código CBO em comum com o documento são avaliados
+    """
+    repo = AsyncDocumentRepository(db)
+    document = await repo.get_document(document_id)
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Documento não encontrado"
+        )
+    
+    extractions = await repo.get_extractions_by_document(document_id)
+    if not extractions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Documento não possui dados extraídos. Execute a extração primeiro."
+        )
+    
+    # Avaliação síncrona (CPU) no threadpool, fora do event loop
+    eligibility = await run_in_threadpool(
+        run_with_session,
+        lambda session: EligibilityService().evaluate_document(
+            extractions,
+            session,
+            include_rejected=include_rejected
+        )
+    )
+    return {"document_id": document_id, **eligibility}
+
+
 @router.get("/{validation_id}/summary")
 async def get_validation_summary(
     validation_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Gerar resumo detalhado de uma validação
     """
-    report_service = ReportService()
-    summary = report_service.generate_validation_summary(validation_id, db)
+    report_service = AsyncReportService()
+    summary = await report_service.generate_validation_summary(validation_id, db)
     
     if "error" in summary:
         raise HTTPException(
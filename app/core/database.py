@@ -1,8 +1,20 @@
+from typing import Callable, TypeVar
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
+T = TypeVar("T")
+
+# Driver assíncrono equivalente ao driver síncrono da DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
 # Criar engine do SQLAlchemy
 engine = create_engine(
     settings.DATABASE_URL,
@@ -14,6 +26,27 @@ engine = create_engine(
 # Criar sessão local
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_database_url(database_url: str) -> str:
+    """URL do banco com o driver assíncrono (postgresql:// → postgresql+asyncpg://)"""
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)).render_as_string(
+        hide_password=False
+    )
+
+
+# Engine assíncrona: usada pelas rotas (async def) para não bloquear o event loop;
+# jobs em background (threads) continuam com a engine síncrona
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20
+)
+
+# Objetos continuam acessíveis após o commit (sem recarregar atributos de forma implícita)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base para os modelos
 Base = declarative_base()
 
@@ -27,10 +60,34 @@ def get_db():
         db.close()
 
 
+def run_with_session(func: Callable[[Session], T]) -> T:
+    """
+    Executar func com uma sessão síncrona própria, fechada ao final
+    Para serviços síncronos chamados das rotas via run_in_threadpool (CPU fora do event loop)
+    """
+    db = SessionLocal()
+    try:
+        return func(db)
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Dependency para obter sessão assíncrona do banco de dados"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
-    """Inicializar banco de dados criando todas as tabelas"""
+    """Inicializar banco de dados criando as tabelas e aplicando as migrações pendentes"""
     # Importar modelos aqui para garantir que sejam registrados no Base.metadata
     from app.models.document import Document
     from app.models.course import Course
+    from app.models.ocr_cache import OCRCacheEntry
+    from app.core.migrations import migration_lock, run_migrations
     
-    Base.metadata.create_all(bind=engine)
+    # Um processo por vez (vários workers iniciando juntos)
+    with migration_lock(engine):
+        Base.metadata.create_all(bind=engine)
+        # Tabelas já existentes recebem colunas e índices novos pelas migrações
+        run_migrations(engine)
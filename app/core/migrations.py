@@ -0,0 +1,240 @@
+"""
+Migrações versionadas do esquema
+
+init_db cria as tabelas que não existem (create_all), mas não altera tabelas já
+criadas: colunas, restrições e índices adicionados aos modelos depois chegam aos
+bancos existentes por aqui. Cada migração é idempotente (verifica o esquema antes
+de alterar), roda na sua própria transação e fica registrada em schema_migrations.
+Vários workers iniciando juntos não disputam as migrações: no PostgreSQL elas rodam
+sob um advisory lock (obtido por tentativas, sem transação aberta enquanto espera);
+índices em tabelas grandes são criados com CONCURRENTLY (fora de transação, sem
+bloquear escritas) e, se uma criação anterior falhou (índice INVALID), recriados.
+
+Uso (também executado por init_db):
+    python -m app.core.migrations
+"""
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator, List, NamedTuple, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+# Tabela de controle (fora do Base: não é um modelo da aplicação)
+migrations_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migrations_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow)
+)
+
+
+# Chave do advisory lock das migrações (PostgreSQL)
+MIGRATION_LOCK_KEY = 0x76616C6D  # "valm"
+# Intervalo entre tentativas de obter o lock
+MIGRATION_LOCK_POLL_SECONDS = 0.5
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+    # False: roda em autocommit (ex.: CREATE INDEX CONCURRENTLY não aceita transação)
+    transactional: bool = True
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return column in {c["name"] for c in inspect(conn).get_columns(table)}
+
+
+def _index_names(conn: Connection, table: str) -> set:
+    """Índices e restrições UNIQUE válidos da tabela"""
+    inspector = inspect(conn)
+    names = {index["name"] for index in inspector.get_indexes(table)} - _invalid_index_names(conn, table)
+    names.update(constraint["name"] for constraint in inspector.get_unique_constraints(table))
+    return names
+
+
+def _invalid_index_names(conn: Connection, table: str) -> set:
+    """Índices INVALID (PostgreSQL: CREATE INDEX CONCURRENTLY que falhou; o planner não os usa)"""
+    return {
+        index["name"]
+        for index in inspect(conn).get_indexes(table)
+        if index.get("dialect_options", {}).get("postgresql_invalid")
+    }
+
+
+def _add_column(conn: Connection, table, column_name: str, server_default: str = None):
+    """Adicionar a coluna do modelo à tabela existente (ALTER TABLE ... ADD COLUMN)"""
+    if _has_column(conn, table.name, column_name):
+        return
+    column = table.columns[column_name]
+    quote = conn.dialect.identifier_preparer.quote
+    ddl = f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column.type.compile(dialect=conn.dialect)}"
+    if server_default is not None:
+        ddl += f" DEFAULT {server_default}"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    conn.exec_driver_sql(ddl)
+
+
+def _create_model_indexes(conn: Connection, table, names: Sequence[str], concurrently: bool = False):
+    """
+    Criar os índices declarados no modelo que ainda não existem no banco
+    concurrently: no PostgreSQL, CREATE INDEX CONCURRENTLY (conexão em autocommit)
+    """
+    existing = _index_names(conn, table.name)
+    invalid = _invalid_index_names(conn, table.name)
+    concurrently = concurrently and conn.dialect.name == "postgresql"
+    quote = conn.dialect.identifier_preparer.quote
+    for index in sorted(table.indexes, key=lambda i: i.name):
+        if index.name not in names or index.name in existing:
+            continue
+        if index.name in invalid:
+            # Sobra de uma criação interrompida: descartar e criar de novo
+            conn.exec_driver_sql(f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}{quote(index.name)}")
+        if not concurrently:
+            index.create(conn)
+            continue
+        conn.exec_driver_sql(
+            f"CREATE {'UNIQUE ' if index.unique else ''}INDEX CONCURRENTLY {quote(index.name)} "
+            f"ON {quote(table.name)} ({', '.join(quote(c.name) for c in index.columns)})"
+        )
+
+
+def _create_unique_index(conn: Connection, table, name: str, columns: Sequence[str]):
+    """
+    Restrição UNIQUE em tabela existente, como índice único com o mesmo nome
+    (SQLite não aceita ALTER TABLE ... ADD CONSTRAINT)
+    """
+    if name in _index_names(conn, table.name):
+        return
+    quote = conn.dialect.identifier_preparer.quote
+    conn.exec_driver_sql(
+        f"CREATE UNIQUE INDEX {quote(name)} ON {quote(table.name)} ({', '.join(quote(c) for c in columns)})"
+    )
+
+
+def _extraction_columns(conn: Connection):
+    from app.models import DocumentExtraction
+    table = DocumentExtraction.__table__
+    _add_column(conn, table, "cbo_code")
+    _add_column(conn, table, "parser_version")
+    _create_model_indexes(conn, table, ["ix_document_extractions_cbo_code", "ix_document_extractions_parser_version"])
+
+
+def _course_columns(conn: Connection):
+    from app.models import Course
+    table = Course.__table__
+    _add_column(conn, table, "accepted_cbo_codes")
+    _add_column(conn, table, "revision", server_default="1")
+
+
+def _validation_input_hash(conn: Connection):
+    from app.models import Validation
+    table = Validation.__table__
+    _add_column(conn, table, "input_hash")
+    _create_unique_index(conn, table, "uq_validations_input", ["document_id", "course_id", "input_hash"])
+
+
+def _storage_tables(conn: Connection):
+    from app.models import DocumentText, OCRCacheEntry
+    OCRCacheEntry.__table__.create(conn, checkfirst=True)
+    DocumentText.__table__.create(conn, checkfirst=True)
+
+
+def _query_indexes(conn: Connection):
+    from app.models import DocumentExtraction, Validation
+    _create_model_indexes(
+        conn,
+        DocumentExtraction.__table__,
+        ["ix_document_extractions_document_id"],
+        concurrently=True
+    )
+    _create_model_indexes(
+        conn,
+        Validation.__table__,
+        ["ix_validations_course_status", "ix_validations_course_document"],
+        concurrently=True
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Extrações: cbo_code e parser_version", _extraction_columns),
+    Migration(2, "Cursos: accepted_cbo_codes e revision", _course_columns),
+    Migration(3, "Validações: input_hash e uq_validations_input", _validation_input_hash),
+    Migration(4, "Tabelas ocr_cache_entries e document_texts", _storage_tables),
+    Migration(5, "Índices das consultas de relatórios e validações", _query_indexes, transactional=False),
+    # Bancos que registraram a 5 com um índice INVALID (criação concorrente interrompida)
+    Migration(6, "Recriar índices INVALID das consultas", _query_indexes, transactional=False),
+]
+
+
+def current_version(engine: Engine) -> int:
+    """Última migração aplicada no banco (0 se nenhuma)"""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table(schema_migrations.name):
+            return 0
+        return conn.scalar(select(func.max(schema_migrations.c.version))) or 0
+
+
+@contextmanager
+def migration_lock(engine: Engine) -> Iterator[None]:
+    """
+    Serializar a criação do esquema entre processos (workers iniciando juntos)
+    PostgreSQL: advisory lock de sessão; os demais bancos não precisam (uso local)
+    Quem espera tenta de novo após uma pausa, em autocommit: bloqueado em pg_advisory_lock,
+    o worker manteria um snapshot aberto, e o CREATE INDEX CONCURRENTLY de quem tem o lock
+    esperaria por ele (deadlock)
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        while not conn.scalar(text(f"SELECT pg_try_advisory_lock({MIGRATION_LOCK_KEY})")):
+            time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            conn.exec_driver_sql(f"SELECT pg_advisory_unlock({MIGRATION_LOCK_KEY})")
+
+
+def run_migrations(engine: Engine) -> List[Migration]:
+    """
+    Aplicar as migrações pendentes, em ordem; retorna as aplicadas
+    Chamar sob migration_lock (init_db já faz isso)
+    """
+    migrations_metadata.create_all(bind=engine)
+    version = current_version(engine)
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= version:
+            continue
+        if migration.transactional:
+            with engine.begin() as conn:
+                _apply(conn, migration)
+        else:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                _apply(conn, migration)
+        applied.append(migration)
+    return applied
+
+
+def _apply(conn: Connection, migration: Migration):
+    """Aplicar uma migração e registrá-la em schema_migrations"""
+    migration.apply(conn)
+    conn.execute(schema_migrations.insert().values(
+        version=migration.version,
+        description=migration.description
+    ))
+
+
+if __name__ == "__main__":
+    from app.core.database import engine, init_db
+    
+    before = current_version(engine)
+    init_db()
+    print(f"Esquema: versão {before} → {current_version(engine)}")
@@ -2,7 +2,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.database import init_db
-from app.api import document_router, course_router, validation_router, report_router
+from app.api import document_router, course_router, validation_router, report_router, job_router, admin_router
+from app.services import job_service
+from app.services.ocr_service import shutdown_process_pool
+from app.services.ocr_engines import close_ocr_engines
 
 # Criar aplicação FastAPI
 app = FastAPI(
@@ -18,6 +21,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cabeçalhos de resposta lidos pelo frontend (paginação, revalidação)
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "X-Revalidation-Job"],
 )
 
 # Incluir routers
@@ -25,6 +30,8 @@ app.include_router(document_router.router)
 app.include_router(course_router.router)
 app.include_router(validation_router.router)
 app.include_router(report_router.router)
+app.include_router(job_router.router)
+app.include_router(admin_router.router)
 
 
 @app.on_event("startup")
@@ -35,6 +42,15 @@ async def startup_event():
     print("✅ Banco de dados inicializado")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Evento de encerramento da aplicação"""
+    # Encerrar pool de workers de jobs
+    job_service.shutdown(wait=False)
+    shutdown_process_pool()
+    close_ocr_engines()
+
+
 @app.get("/")
 async def root():
     """Rota raiz da API"""
@@ -1,4 +1,5 @@
-from app.models.document import Document, DocumentExtraction, Validation
+from app.models.document import Document, DocumentExtraction, DocumentText, Validation
 from app.models.course import Course
+from app.models.ocr_cache import OCRCacheEntry
 
-__all__ = ["Document", "DocumentExtraction", "Validation", "Course"]
+__all__ = ["Document", "DocumentExtraction", "DocumentText", "Validation", "Course", "OCRCacheEntry"]
@@ -7,6 +7,9 @@ class Course(Base):
     """Modelo para cursos técnicos"""
     __tablename__ = "courses"
     
+    # Campos que definem o resultado das validações (alterá-los gera nova revisão)
+    REQUIREMENT_FIELDS = ("minimum_months", "accepted_positions", "accepted_cbo_codes")
+    
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, unique=True)
     code = Column(String(50), nullable=False, unique=True)
@@ -15,9 +18,11 @@ class Course(Base):
     # Requisitos de experiência
     minimum_months = Column(Integer, nullable=False, default=12)
     accepted_positions = Column(JSON)  # Lista de cargos aceitos
+    accepted_cbo_codes = Column(JSON)  # Códigos CBO (ou prefixos, ex.: família "3171") aceitos
     
     # Configurações
     is_active = Column(Boolean, default=True)
+    revision = Column(Integer, nullable=False, default=1)  # Incrementada quando os requisitos mudam
     
     # Relacionamento
     validations = relationship("Validation", back_populates="course")
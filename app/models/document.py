@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, ForeignKey, Index, LargeBinary, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -17,11 +17,31 @@ class Document(Base):
     # Relacionamento com extrações
     extractions = relationship("DocumentExtraction", back_populates="document", cascade="all, delete-orphan")
     validations = relationship("Validation", back_populates="document", cascade="all, delete-orphan")
+    text = relationship("DocumentText", back_populates="document", uselist=False, cascade="all, delete-orphan")
+
+
+class DocumentText(Base):
+    """Texto completo extraído do documento (OCR/camada de texto), comprimido, um por documento"""
+    __tablename__ = "document_texts"
+    
+    document_id = Column(Integer, ForeignKey("documents.id"), primary_key=True)
+    codec = Column(String(10), nullable=False)  # zlib, zstd
+    compressed_text = Column(LargeBinary, nullable=False)
+    page_offsets = Column(JSON)  # [[página, início no texto], ...]
+    original_size = Column(Integer, nullable=False)  # Bytes do texto em UTF-8
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relacionamento
+    document = relationship("Document", back_populates="text")
 
 
 class DocumentExtraction(Base):
     """Modelo para dados extraídos do documento"""
     __tablename__ = "document_extractions"
+    __table_args__ = (
+        # Extrações de um documento, já na ordem de inserção
+        Index("ix_document_extractions_document_id", "document_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
@@ -29,13 +49,15 @@ class DocumentExtraction(Base):
     # Dados extraídos
     company_name = Column(String(255))
     position = Column(String(255))
+    cbo_code = Column(String(10), index=True)  # Código CBO da ocupação (somente dígitos)
     start_date = Column(String(50))
     end_date = Column(String(50))
     months_worked = Column(Integer)
     
-    # OCR raw data
+    # OCR raw data (texto completo agora fica em DocumentText; preenchido só em extrações antigas)
     raw_text = Column(Text)
     extracted_data = Column(JSON)
+    parser_version = Column(String(20), index=True)  # Versão do parser que gerou a extração
     
     extracted_at = Column(DateTime, default=datetime.utcnow)
     
@@ -46,6 +68,15 @@ class DocumentExtraction(Base):
 class Validation(Base):
     """Modelo para validações realizadas"""
     __tablename__ = "validations"
+    __table_args__ = (
+        # Mesma entrada (extrações + revisão do curso) gera uma única validação
+        # (também atende as consultas por document_id)
+        UniqueConstraint("document_id", "course_id", "input_hash", name="uq_validations_input"),
+        # Estatísticas do curso por status
+        Index("ix_validations_course_status", "course_id", "status", "validated_at"),
+        # Validação mais recente de cada documento do curso (revalidação, lotes)
+        Index("ix_validations_course_document", "course_id", "document_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
@@ -59,6 +90,7 @@ class Validation(Base):
     
     # Detalhes
     validation_details = Column(JSON)
+    input_hash = Column(String(64))  # Hash das extrações + curso/revisão (ver ValidationService.input_hash)
     validated_at = Column(DateTime, default=datetime.utcnow)
     
     # Relacionamentos
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from datetime import datetime
+from app.core.database import Base
+
+
+class OCRCacheEntry(Base):
+    """Modelo para cache de resultados de OCR (backend em banco de dados)"""
+    __tablename__ = "ocr_cache_entries"
+    
+    cache_key = Column(String(64), primary_key=True)
+    text = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -1,4 +1,6 @@
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.course_repository import CourseRepository
+from app.repositories.async_document_repository import AsyncDocumentRepository
+from app.repositories.async_course_repository import AsyncCourseRepository
 
-__all__ = ["DocumentRepository", "CourseRepository"]
+__all__ = ["DocumentRepository", "CourseRepository", "AsyncDocumentRepository", "AsyncCourseRepository"]
@@ -0,0 +1,95 @@
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Course
+from app.schemas import CourseCreate, CourseUpdate
+
+
+class AsyncCourseRepository:
+    """Repositório assíncrono para operações com cursos (mesma interface de CourseRepository)"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_course(self, course_data: CourseCreate) -> Course:
+        """Criar novo curso"""
+        course = Course(
+            name=course_data.name,
+            code=course_data.code,
+            description=course_data.description,
+            minimum_months=course_data.minimum_months,
+            accepted_positions=course_data.accepted_positions,
+            accepted_cbo_codes=course_data.accepted_cbo_codes,
+            is_active=course_data.is_active
+        )
+        self.db.add(course)
+        await self.db.commit()
+        await self.db.refresh(course)
+        return course
+    
+    async def get_course(self, course_id: int) -> Optional[Course]:
+        """Buscar curso por ID"""
+        return await self.db.get(Course, course_id)
+    
+    async def get_course_by_code(self, code: str) -> Optional[Course]:
+        """Buscar curso por código"""
+        result = await self.db.execute(select(Course).where(Course.code == code).limit(1))
+        return result.scalars().first()
+    
+    async def get_all_courses(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = False,
+        after_id: Optional[int] = None
+    ) -> List[Course]:
+        """Listar todos os cursos por ID (after_id: continuar após esse curso)"""
+        query = select(Course)
+        if active_only:
+            query = query.where(Course.is_active == True)
+        if after_id is not None:
+            query = query.where(Course.id > after_id)
+        result = await self.db.execute(query.order_by(Course.id).offset(skip).limit(limit))
+        return list(result.scalars())
+    
+    async def update_course(
+        self,
+        course_id: int,
+        course_data: CourseUpdate
+    ) -> Optional[Course]:
+        """Atualizar curso"""
+        course = await self.get_course(course_id)
+        if not course:
+            return None
+        
+        update_data = course_data.model_dump(exclude_unset=True)
+        requirements_changed = False
+        for field, value in update_data.items():
+            if getattr(course, field) != value:
+                setattr(course, field, value)
+                requirements_changed |= field in Course.REQUIREMENT_FIELDS
+        
+        # Nova revisão invalida as validações calculadas com a anterior
+        # (nome, código, descrição e is_active não mudam o resultado)
+        if requirements_changed:
+            course.revision = (course.revision or 1) + 1
+        
+        await self.db.commit()
+        await self.db.refresh(course)
+        return course
+    
+    async def delete_course(self, course_id: int) -> bool:
+        """Deletar curso"""
+        course = await self.get_course(course_id)
+        if course:
+            await self.db.delete(course)
+            await self.db.commit()
+            return True
+        return False
+    
+    async def count_courses(self, active_only: bool = False) -> int:
+        """Contar total de cursos"""
+        query = select(func.count()).select_from(Course)
+        if active_only:
+            query = query.where(Course.is_active == True)
+        return await self.db.scalar(query)
@@ -0,0 +1,161 @@
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Document, DocumentExtraction, DocumentText, Validation
+
+
+class AsyncDocumentRepository:
+    """
+    Repositório assíncrono para operações com documentos (usado pelas rotas)
+    Mesma interface de DocumentRepository; as operações em lote (jobs em background
+    e serviços síncronos executados no threadpool) ficam só na versão síncrona
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_document(
+        self,
+        filename: str,
+        file_path: str,
+        file_type: str
+    ) -> Document:
+        """Criar novo documento"""
+        document = Document(
+            filename=filename,
+            file_path=file_path,
+            file_type=file_type
+        )
+        self.db.add(document)
+        await self.db.commit()
+        await self.db.refresh(document)
+        return document
+    
+    async def get_document(self, document_id: int) -> Optional[Document]:
+        """Buscar documento por ID"""
+        return await self.db.get(Document, document_id)
+    
+    async def get_all_documents(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[Document]:
+        """Listar todos os documentos por ID (after_id: continuar após esse documento)"""
+        query = select(Document)
+        if after_id is not None:
+            query = query.where(Document.id > after_id)
+        result = await self.db.execute(query.order_by(Document.id).offset(skip).limit(limit))
+        return list(result.scalars())
+    
+    async def count_documents(self) -> int:
+        """Contar total de documentos"""
+        return await self.db.scalar(select(func.count(Document.id)))
+    
+    async def delete_document(self, document_id: int) -> bool:
+        """Deletar documento"""
+        document = await self.get_document(document_id)
+        if document:
+            # Extrações e validações removidas em cascata
+            await self.db.delete(document)
+            await self.db.commit()
+            return True
+        return False
+    
+    async def get_extractions_by_document(self, document_id: int) -> List[DocumentExtraction]:
+        """Buscar todas as extrações de um documento"""
+        result = await self.db.execute(
+            select(DocumentExtraction).where(
+                DocumentExtraction.document_id == document_id
+            ).order_by(DocumentExtraction.id)
+        )
+        return list(result.scalars())
+    
+    async def get_extractions_by_ids(self, extraction_ids: List[int]) -> List[DocumentExtraction]:
+        """Buscar extrações por uma lista de IDs"""
+        if not extraction_ids:
+            return []
+        result = await self.db.execute(
+            select(DocumentExtraction).where(
+                DocumentExtraction.id.in_(extraction_ids)
+            ).order_by(DocumentExtraction.id)
+        )
+        return list(result.scalars())
+    
+    async def get_document_text(self, document_id: int) -> Optional[DocumentText]:
+        """Buscar o texto completo comprimido de um documento"""
+        return await self.db.get(DocumentText, document_id)
+    
+    async def get_legacy_raw_text(self, document_id: int) -> Optional[str]:
+        """Texto completo de extrações antigas (gravado em cada extração, antes do DocumentText)"""
+        return await self.db.scalar(
+            select(DocumentExtraction.raw_text).where(
+                DocumentExtraction.document_id == document_id,
+                DocumentExtraction.raw_text.isnot(None)
+            ).limit(1)
+        )
+    
+    async def create_validation(
+        self,
+        document_id: int,
+        course_id: int,
+        status: str,
+        required_months: Optional[int],
+        found_months: Optional[int],
+        position_match: Optional[str],
+        validation_details: Optional[dict],
+        input_hash: Optional[str] = None
+    ) -> Validation:
+        """
+        Criar nova validação
+        Se outra requisição gravou a mesma entrada (input_hash) ao mesmo tempo, retorna a existente
+        """
+        validation = Validation(
+            document_id=document_id,
+            course_id=course_id,
+            status=status,
+            required_months=required_months,
+            found_months=found_months,
+            position_match=position_match,
+            validation_details=validation_details,
+            input_hash=input_hash
+        )
+        self.db.add(validation)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            existing = input_hash and await self.get_validation_by_input_hash(document_id, course_id, input_hash)
+            if not existing:
+                raise
+            return existing
+        await self.db.refresh(validation)
+        return validation
+    
+    async def get_validation_by_input_hash(
+        self,
+        document_id: int,
+        course_id: int,
+        input_hash: str
+    ) -> Optional[Validation]:
+        """Buscar validação já calculada para a mesma entrada"""
+        result = await self.db.execute(
+            select(Validation).where(
+                Validation.document_id == document_id,
+                Validation.course_id == course_id,
+                Validation.input_hash == input_hash
+            ).limit(1)
+        )
+        return result.scalars().first()
+    
+    async def get_validations_by_document(self, document_id: int) -> List[Validation]:
+        """Buscar todas as validações de um documento"""
+        result = await self.db.execute(
+            select(Validation).where(Validation.document_id == document_id)
+        )
+        return list(result.scalars())
+    
+    async def get_validation(self, validation_id: int) -> Optional[Validation]:
+        """Buscar validação por ID"""
+        return await self.db.get(Validation, validation_id)
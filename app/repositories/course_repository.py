@@ -18,6 +18,7 @@ class CourseRepository:
             description=course_data.description,
             minimum_months=course_data.minimum_months,
             accepted_positions=course_data.accepted_positions,
+            accepted_cbo_codes=course_data.accepted_cbo_codes,
             is_active=course_data.is_active
         )
         self.db.add(course)
@@ -37,13 +38,16 @@ class CourseRepository:
         self,
         skip: int = 0,
         limit: int = 100,
-        active_only: bool = False
+        active_only: bool = False,
+        after_id: Optional[int] = None
     ) -> List[Course]:
-        """Listar todos os cursos"""
+        """Listar todos os cursos por ID (after_id: continuar após esse curso)"""
         query = self.db.query(Course)
         if active_only:
             query = query.filter(Course.is_active == True)
-        return query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            query = query.filter(Course.id > after_id)
+        return query.order_by(Course.id).offset(skip).limit(limit).all()
     
     def update_course(
         self,
@@ -56,8 +60,16 @@ class CourseRepository:
             return None
         
         update_data = course_data.model_dump(exclude_unset=True)
+        requirements_changed = False
         for field, value in update_data.items():
-            setattr(course, field, value)
+            if getattr(course, field) != value:
+                setattr(course, field, value)
+                requirements_changed |= field in Course.REQUIREMENT_FIELDS
+        
+        # Nova revisão invalida as validações calculadas com a anterior
+        # (nome, código, descrição e is_active não mudam o resultado)
+        if requirements_changed:
+            course.revision = (course.revision or 1) + 1
         
         self.db.commit()
         self.db.refresh(course)
@@ -72,6 +84,9 @@ class CourseRepository:
             return True
         return False
     
-    def count_courses(self) -> int:
+    def count_courses(self, active_only: bool = False) -> int:
         """Contar total de cursos"""
-        return self.db.query(Course).count()
+        query = self.db.query(Course)
+        if active_only:
+            query = query.filter(Course.is_active == True)
+        return query.count()
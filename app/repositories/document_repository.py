@@ -1,6 +1,9 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from sqlalchemy import func, insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.models import Document, DocumentExtraction, Validation
+from app.models import Document, DocumentExtraction, DocumentText, Validation
 
 
 class DocumentRepository:
@@ -30,9 +33,21 @@ class DocumentRepository:
         """Buscar documento por ID"""
         return self.db.query(Document).filter(Document.id == document_id).first()
     
-    def get_all_documents(self, skip: int = 0, limit: int = 100) -> List[Document]:
-        """Listar todos os documentos"""
-        return self.db.query(Document).offset(skip).limit(limit).all()
+    def get_all_documents(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[Document]:
+        """Listar todos os documentos por ID (after_id: continuar após esse documento)"""
+        query = self.db.query(Document)
+        if after_id is not None:
+            query = query.filter(Document.id > after_id)
+        return query.order_by(Document.id).offset(skip).limit(limit).all()
+    
+    def count_documents(self) -> int:
+        """Contar total de documentos"""
+        return self.db.query(func.count(Document.id)).scalar()
     
     def delete_document(self, document_id: int) -> bool:
         """Deletar documento"""
@@ -43,38 +58,106 @@ class DocumentRepository:
             return True
         return False
     
-    def create_extraction(
+    def get_extractions_by_document(self, document_id: int) -> List[DocumentExtraction]:
+        """Buscar todas as extrações de um documento"""
+        return self.db.query(DocumentExtraction).filter(
+            DocumentExtraction.document_id == document_id
+        ).order_by(DocumentExtraction.id).all()
+    
+    def bulk_create_extractions(
         self,
         document_id: int,
-        company_name: Optional[str],
-        position: Optional[str],
-        start_date: Optional[str],
-        end_date: Optional[str],
-        months_worked: Optional[int],
-        raw_text: Optional[str],
-        extracted_data: Optional[dict]
-    ) -> DocumentExtraction:
-        """Criar nova extração de dados"""
-        extraction = DocumentExtraction(
-            document_id=document_id,
-            company_name=company_name,
-            position=position,
-            start_date=start_date,
-            end_date=end_date,
-            months_worked=months_worked,
-            raw_text=raw_text,
-            extracted_data=extracted_data
+        experiences: List[dict],
+        parser_version: Optional[str],
+        commit: bool = True
+    ) -> List[int]:
+        """
+        Inserir as experiências de um documento numa única instrução
+        O texto completo não é repetido nas extrações (fica em DocumentText)
+        Retorna os IDs na mesma ordem das experiências
+        """
+        if not experiences:
+            return []
+        rows = [
+            {
+                "document_id": document_id,
+                "company_name": exp.get('company_name'),
+                "position": exp.get('position'),
+                "cbo_code": exp.get('cbo_code'),
+                "start_date": exp.get('start_date'),
+                "end_date": exp.get('end_date'),
+                "months_worked": exp.get('months_worked'),
+                "extracted_data": exp,
+                "parser_version": parser_version
+            }
+            for exp in experiences
+        ]
+        result = self.db.execute(
+            insert(DocumentExtraction).returning(DocumentExtraction.id, sort_by_parameter_order=True),
+            rows
         )
-        self.db.add(extraction)
-        self.db.commit()
-        self.db.refresh(extraction)
-        return extraction
+        ids = list(result.scalars())
+        if commit:
+            self.db.commit()
+        return ids
     
-    def get_extractions_by_document(self, document_id: int) -> List[DocumentExtraction]:
-        """Buscar todas as extrações de um documento"""
-        return self.db.query(DocumentExtraction).filter(
+    def replace_extractions(
+        self,
+        document_id: int,
+        experiences: List[dict],
+        parser_version: Optional[str],
+        commit: bool = True
+    ) -> List[int]:
+        """
+        Substituir as extrações de um documento pelas experiências informadas (uma transação)
+        Com commit=False, a troca fica na transação (ou savepoint) do chamador
+        Retorna os IDs das novas extrações
+        """
+        self.db.query(DocumentExtraction).filter(
             DocumentExtraction.document_id == document_id
-        ).all()
+        ).delete(synchronize_session=False)
+        return self.bulk_create_extractions(
+            document_id,
+            experiences,
+            parser_version,
+            commit=commit
+        )
+    
+    def save_document_text(
+        self,
+        document_id: int,
+        codec: str,
+        compressed_text: bytes,
+        original_size: int,
+        page_offsets: Optional[List[List[int]]],
+        commit: bool = True
+    ) -> DocumentText:
+        """Gravar (ou substituir) o texto completo comprimido de um documento"""
+        document_text = self.db.get(DocumentText, document_id)
+        if document_text is None:
+            document_text = DocumentText(document_id=document_id)
+            self.db.add(document_text)
+        document_text.codec = codec
+        document_text.compressed_text = compressed_text
+        document_text.original_size = original_size
+        document_text.page_offsets = page_offsets
+        document_text.created_at = datetime.utcnow()
+        self.db.flush()
+        if commit:
+            self.db.commit()
+        return document_text
+    
+    def get_document_text(self, document_id: int) -> Optional[DocumentText]:
+        """Buscar o texto completo comprimido de um documento"""
+        return self.db.get(DocumentText, document_id)
+    
+    def get_extractions_by_ids(self, extraction_ids: List[int]) -> List[DocumentExtraction]:
+        """Buscar extrações por uma lista de IDs"""
+        if not extraction_ids:
+            return []
+        return self.db.query(DocumentExtraction).filter(
+            DocumentExtraction.id.in_(extraction_ids)
+        ).order_by(DocumentExtraction.id).all()
     
     def create_validation(
         self,
@@ -84,9 +167,13 @@ class DocumentRepository:
         required_months: Optional[int],
         found_months: Optional[int],
         position_match: Optional[str],
-        validation_details: Optional[dict]
+        validation_details: Optional[dict],
+        input_hash: Optional[str] = None
     ) -> Validation:
-        """Criar nova validação"""
+        """
+        Criar nova validação
+        Se outra requisição gravou a mesma entrada (input_hash) ao mesmo tempo, retorna a existente
+        """
         validation = Validation(
             document_id=document_id,
             course_id=course_id,
@@ -94,13 +181,124 @@ class DocumentRepository:
             required_months=required_months,
             found_months=found_months,
             position_match=position_match,
-            validation_details=validation_details
+            validation_details=validation_details,
+            input_hash=input_hash
         )
         self.db.add(validation)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            existing = input_hash and self.get_validation_by_input_hash(document_id, course_id, input_hash)
+            if not existing:
+                raise
+            return existing
         self.db.refresh(validation)
         return validation
     
+    def get_validation_by_input_hash(
+        self,
+        document_id: int,
+        course_id: int,
+        input_hash: str
+    ) -> Optional[Validation]:
+        """Buscar validação já calculada para a mesma entrada"""
+        return self.db.query(Validation).filter(
+            Validation.document_id == document_id,
+            Validation.course_id == course_id,
+            Validation.input_hash == input_hash
+        ).first()
+    
+    def get_validations_by_input_hashes(
+        self,
+        course_id: int,
+        input_hashes: Dict[int, str]
+    ) -> Dict[int, Validation]:
+        """Validações já calculadas de um curso para vários documentos ({document_id: input_hash})"""
+        if not input_hashes:
+            return {}
+        validations = self.db.query(Validation).filter(
+            Validation.course_id == course_id,
+            Validation.document_id.in_(list(input_hashes)),
+            Validation.input_hash.in_(list(set(input_hashes.values())))
+        ).all()
+        return {
+            validation.document_id: validation
+            for validation in validations
+            if input_hashes.get(validation.document_id) == validation.input_hash
+        }
+    
+    def get_existing_document_ids(self, document_ids: List[int]) -> Set[int]:
+        """IDs da lista que correspondem a documentos existentes"""
+        if not document_ids:
+            return set()
+        rows = self.db.query(Document.id).filter(Document.id.in_(document_ids)).all()
+        return {row.id for row in rows}
+    
+    def get_extractions_by_documents(self, document_ids: List[int]) -> Dict[int, List[DocumentExtraction]]:
+        """Buscar extrações de vários documentos numa única consulta, agrupadas por documento"""
+        grouped: Dict[int, List[DocumentExtraction]] = {document_id: [] for document_id in document_ids}
+        if not document_ids:
+            return grouped
+        extractions = self.db.query(DocumentExtraction).filter(
+            DocumentExtraction.document_id.in_(document_ids)
+        ).order_by(DocumentExtraction.document_id, DocumentExtraction.id).all()
+        for extraction in extractions:
+            grouped[extraction.document_id].append(extraction)
+        return grouped
+    
+    def bulk_create_validations(self, rows: List[dict]) -> List[int]:
+        """
+        Inserir várias validações numa única instrução (uma transação)
+        Retorna os IDs na mesma ordem das linhas
+        """
+        if not rows:
+            return []
+        result = self.db.execute(
+            insert(Validation).returning(Validation.id, sort_by_parameter_order=True),
+            rows
+        )
+        ids = list(result.scalars())
+        self.db.commit()
+        return ids
+    
+    def count_validated_documents(self, course_id: int) -> int:
+        """Número de documentos com validação para o curso"""
+        return self.db.query(func.count(func.distinct(Validation.document_id))).filter(
+            Validation.course_id == course_id
+        ).scalar()
+    
+    def get_latest_validations_for_course(
+        self,
+        course_id: int,
+        after_document_id: int = 0,
+        limit: int = 200
+    ) -> List[Validation]:
+        """
+        Validação mais recente de cada documento para o curso, paginada por document_id
+        (validações mais antigas do mesmo documento ficam como histórico)
+        """
+        latest_ids = self.db.query(func.max(Validation.id)).filter(
+            Validation.course_id == course_id,
+            Validation.document_id > after_document_id
+        ).group_by(
+            Validation.document_id
+        ).order_by(
+            Validation.document_id
+        ).limit(limit).all()
+        if not latest_ids:
+            return []
+        return self.db.query(Validation).filter(
+            Validation.id.in_([row[0] for row in latest_ids])
+        ).order_by(Validation.document_id).all()
+    
+    def bulk_update_validations(self, rows: List[dict], commit: bool = True):
+        """Atualizar várias validações numa instrução (cada linha com "id" e os campos alterados)"""
+        if rows:
+            self.db.execute(update(Validation), rows)
+        if commit:
+            self.db.commit()
+    
     def get_validations_by_document(self, document_id: int) -> List[Validation]:
         """Buscar todas as validações de um documento"""
         return self.db.query(Validation).filter(
@@ -2,8 +2,12 @@ from app.schemas.document_schema import (
     DocumentUploadResponse,
     ExtractionData,
     DocumentExtractionResponse,
+    DocumentRawTextResponse,
     ValidationRequest,
     ValidationResponse,
+    BatchValidationRequest,
+    BatchValidationItem,
+    BatchValidationResponse,
     ReportResponse
 )
 from app.schemas.course_schema import (
@@ -13,17 +17,26 @@ from app.schemas.course_schema import (
     CourseResponse,
     CourseListResponse
 )
+from app.schemas.job_schema import JobResponse
+from app.schemas.eligibility_schema import CourseEligibility, EligibilityResponse
 
 __all__ = [
     "DocumentUploadResponse",
     "ExtractionData",
     "DocumentExtractionResponse",
+    "DocumentRawTextResponse",
     "ValidationRequest",
     "ValidationResponse",
+    "BatchValidationRequest",
+    "BatchValidationItem",
+    "BatchValidationResponse",
     "ReportResponse",
     "CourseBase",
     "CourseCreate",
     "CourseUpdate",
     "CourseResponse",
-    "CourseListResponse"
+    "CourseListResponse",
+    "JobResponse",
+    "CourseEligibility",
+    "EligibilityResponse"
 ]
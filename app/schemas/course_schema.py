@@ -1,7 +1,20 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 
 
+def _normalize_cbo_codes(codes: Optional[List[str]]) -> Optional[List[str]]:
+    """Manter só os dígitos dos códigos CBO ("3171-10" → "317110")"""
+    if codes is None:
+        return None
+    normalized = []
+    for code in codes:
+        digits = "".join(c for c in code if c.isdigit())
+        if not 1 <= len(digits) <= 6:
+            raise ValueError(f"Código CBO inválido: {code}")
+        normalized.append(digits)
+    return normalized
+
+
 class CourseBase(BaseModel):
     """Schema base para curso"""
     name: str = Field(..., min_length=1, max_length=255)
@@ -9,7 +22,13 @@ class CourseBase(BaseModel):
     description: Optional[str] = None
     minimum_months: int = Field(default=12, ge=1)
     accepted_positions: List[str] = Field(default_factory=list)
+    accepted_cbo_codes: List[str] = Field(default_factory=list)
     is_active: bool = True
+    
+    @field_validator("accepted_cbo_codes")
+    @classmethod
+    def normalize_cbo_codes(cls, codes):
+        return _normalize_cbo_codes(codes)
 
 
 class CourseCreate(CourseBase):
@@ -24,12 +43,20 @@ class CourseUpdate(BaseModel):
     description: Optional[str] = None
     minimum_months: Optional[int] = Field(None, ge=1)
     accepted_positions: Optional[List[str]] = None
+    accepted_cbo_codes: Optional[List[str]] = None
     is_active: Optional[bool] = None
+    
+    @field_validator("accepted_cbo_codes")
+    @classmethod
+    def normalize_cbo_codes(cls, codes):
+        return _normalize_cbo_codes(codes)
 
 
 class CourseResponse(CourseBase):
     """Schema de resposta de curso"""
     id: int
+    accepted_cbo_codes: Optional[List[str]] = None
+    revision: int = 1
     
     class Config:
         from_attributes = True
@@ -38,4 +65,5 @@ class CourseResponse(CourseBase):
 class CourseListResponse(BaseModel):
     """Schema de resposta de lista de cursos"""
     courses: List[CourseResponse]
-    total: int
+    total: int  # Considera os filtros; pode estar defasado em até LIST_TOTAL_CACHE_SECONDS
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
@@ -19,6 +19,7 @@ class ExtractionData(BaseModel):
     """Dados extraídos de um documento"""
     company_name: Optional[str] = None
     position: Optional[str] = None
+    cbo_code: Optional[str] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     months_worked: Optional[int] = None
@@ -30,23 +31,61 @@ class DocumentExtractionResponse(BaseModel):
     document_id: int
     company_name: Optional[str]
     position: Optional[str]
+    cbo_code: Optional[str] = None
     start_date: Optional[str]
     end_date: Optional[str]
     months_worked: Optional[int]
-    raw_text: Optional[str]
     extracted_data: Optional[Dict[str, Any]]
+    parser_version: Optional[str] = None
     extracted_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class DocumentRawTextResponse(BaseModel):
+    """Texto completo extraído de um documento (ou de uma página dele)"""
+    document_id: int
+    codec: Optional[str] = None  # zlib, zstd; None = texto antigo, gravado nas extrações
+    original_size: int  # bytes do texto completo (UTF-8)
+    compressed_size: Optional[int] = None
+    pages: List[int]  # páginas presentes no texto (vazio se não registradas)
+    page: Optional[int] = None  # página retornada; None = texto completo
+    text: str
+
+
 class ValidationRequest(BaseModel):
     """Requisição de validação"""
     document_id: int
     course_id: int
 
 
+class BatchValidationRequest(BaseModel):
+    """Requisição de validação em lote (vários documentos para um curso)"""
+    course_id: int
+    document_ids: List[int] = Field(..., min_length=1, max_length=10000)
+
+
+class BatchValidationItem(BaseModel):
+    """Resultado de um documento na validação em lote"""
+    document_id: int
+    status: str  # approved, rejected, manual_review, error
+    validation_id: Optional[int] = None
+    required_months: Optional[int] = None
+    found_months: Optional[int] = None
+    position_match: Optional[str] = None
+    reused: bool = False  # validação existente com a mesma entrada
+    error: Optional[str] = None
+
+
+class BatchValidationResponse(BaseModel):
+    """Resposta da validação em lote"""
+    course_id: int
+    total: int
+    counts: Dict[str, int]  # documentos por status
+    results: List[BatchValidationItem]
+
+
 class ValidationResponse(BaseModel):
     """Resposta da validação"""
     id: int
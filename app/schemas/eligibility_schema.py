@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+
+class CourseEligibility(BaseModel):
+    """Resultado de um curso na busca de elegibilidade"""
+    course_id: int
+    course_name: str
+    course_code: str
+    status: str  # approved, rejected, manual_review
+    required_months: Optional[int] = None
+    found_months: Optional[int] = None
+    position_match: Optional[str] = None
+    similarity_score: Optional[float] = None
+    match_method: Optional[str] = None  # cbo_code, fuzzy
+    position_found: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class EligibilityResponse(BaseModel):
+    """Cursos para os quais um documento é elegível, ranqueados"""
+    document_id: int
+    courses_evaluated: int
+    candidates_scored: int
+    results: List[CourseEligibility] = Field(default_factory=list)
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+
+from app.schemas.document_schema import DocumentExtractionResponse
+
+
+class JobResponse(BaseModel):
+    """Estado de um job de processamento em background"""
+    id: str
+    job_type: str
+    document_id: Optional[int] = None
+    status: str  # pending, running, completed, failed
+    pages_done: int = 0
+    pages_total: int = 0
+    result: Dict[str, Any] = Field(default_factory=dict)
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    extractions: List[DocumentExtractionResponse] = Field(default_factory=list)
@@ -1,5 +1,22 @@
 from app.services.ocr_service import OCRService
 from app.services.validation_service import ValidationService
-from app.services.report_service import ReportService
+from app.services.report_service import ReportService, AsyncReportService
+from app.services.job_service import Job, JobService, job_service
+from app.services.extraction_service import ExtractionService
+from app.services.eligibility_service import EligibilityService
+from app.services.batch_validation_service import BatchValidationService
+from app.services.revalidation_service import RevalidationService
 
-__all__ = ["OCRService", "ValidationService", "ReportService"]
+__all__ = [
+    "OCRService",
+    "ValidationService",
+    "ReportService",
+    "AsyncReportService",
+    "Job",
+    "JobService",
+    "job_service",
+    "ExtractionService",
+    "EligibilityService",
+    "BatchValidationService",
+    "RevalidationService"
+]
@@ -0,0 +1,143 @@
+from collections import Counter
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import Course, DocumentExtraction
+from app.repositories import DocumentRepository
+from app.services.validation_service import ValidationService
+
+# Documentos por consulta de extrações / instrução de inserção
+BATCH_CHUNK_SIZE = 500
+
+
+class BatchValidationService:
+    """
+    Validação de uma turma inteira (milhares de documentos) para um curso
+    O curso é carregado uma vez; extrações e validações trafegam em lotes
+    """
+    
+    def __init__(self, chunk_size: int = BATCH_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.validation_service = ValidationService()
+    
+    def validate_documents(
+        self,
+        course: Course,
+        document_ids: List[int],
+        db: Session
+    ) -> Dict[str, Any]:
+        """
+        Validar vários documentos para o curso, com as mesmas regras de POST /validations/
+        Documentos inexistentes ou sem extração entram no resultado com status "error";
+        documentos já validados com a mesma entrada reaproveitam a validação existente
+        
+        Returns:
+            Dict com total, contagem por status e resultado de cada documento (na ordem pedida)
+        """
+        repo = DocumentRepository(db)
+        # Remover repetidos mantendo a ordem
+        document_ids = list(dict.fromkeys(document_ids))
+        results: List[Dict[str, Any]] = []
+        
+        for start in range(0, len(document_ids), self.chunk_size):
+            chunk = document_ids[start:start + self.chunk_size]
+            existing = repo.get_existing_document_ids(chunk)
+            extractions_by_document = repo.get_extractions_by_documents(list(existing))
+            
+            # Chave de cada documento com extrações; validações com a mesma chave são reaproveitadas
+            input_hashes = {
+                document_id: self.validation_service.input_hash(extractions_by_document[document_id], course)
+                for document_id in chunk
+                if extractions_by_document.get(document_id)
+            }
+            saved = self._save_new_validations(repo, course, input_hashes, extractions_by_document)
+            
+            for document_id in chunk:
+                if document_id not in existing:
+                    results.append({"document_id": document_id, "status": "error", "error": "Documento não encontrado"})
+                elif document_id not in saved:
+                    results.append({
+                        "document_id": document_id,
+                        "status": "error",
+                        "error": "Documento não possui dados extraídos. Execute a extração primeiro."
+                    })
+                else:
+                    results.append(saved[document_id])
+        
+        return {
+            "course_id": course.id,
+            "total": len(results),
+            "counts": dict(Counter(item["status"] for item in results)),
+            "results": results
+        }
+    
+    def _save_new_validations(
+        self,
+        repo: DocumentRepository,
+        course: Course,
+        input_hashes: Dict[int, str],
+        extractions_by_document: Dict[int, List[DocumentExtraction]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Validar os documentos ainda sem resultado para a entrada atual e inseri-los num lote
+        Se outra requisição gravar parte do lote ao mesmo tempo, os existentes são relidos
+        """
+        for attempt in range(2):
+            reused = repo.get_validations_by_input_hashes(course.id, input_hashes)
+            results = {
+                document_id: {
+                    "document_id": document_id,
+                    "validation_id": validation.id,
+                    "status": validation.status,
+                    "required_months": validation.required_months,
+                    "found_months": validation.found_months,
+                    "position_match": validation.position_match,
+                    "reused": True
+                }
+                for document_id, validation in reused.items()
+            }
+            
+            # Mesma regra da validação individual, com a união dos períodos calculada para o lote todo
+            validation_results = self.validation_service.validate_documents(
+                {
+                    document_id: extractions_by_document[document_id]
+                    for document_id in input_hashes
+                    if document_id not in reused
+                },
+                course
+            )
+            rows = []
+            for document_id, validation_result in validation_results.items():
+                rows.append({
+                    "document_id": document_id,
+                    "course_id": course.id,
+                    "status": validation_result["status"],
+                    "required_months": validation_result["required_months"],
+                    "found_months": validation_result["found_months"],
+                    "position_match": validation_result.get("position_match"),
+                    "validation_details": validation_result.get("details"),
+                    "input_hash": input_hashes[document_id]
+                })
+            
+            # Uma inserção (e um commit) por lote
+            try:
+                validation_ids = repo.bulk_create_validations(rows)
+            except IntegrityError:
+                repo.db.rollback()
+                if attempt:
+                    raise
+                continue
+            
+            for row, validation_id in zip(rows, validation_ids):
+                results[row["document_id"]] = {
+                    "document_id": row["document_id"],
+                    "validation_id": validation_id,
+                    "status": row["status"],
+                    "required_months": row["required_months"],
+                    "found_months": row["found_months"],
+                    "position_match": row["position_match"],
+                    "reused": False
+                }
+            return results
@@ -0,0 +1,68 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Union
+
+from dateutil import parser as date_parser
+
+# Datas distintas mantidas em memória (o mesmo documento repete datas e o
+# reprocessamento em lote repete documentos)
+DATE_CACHE_SIZE = 65536
+
+# dd/mm/aaaa, dd-mm-aa... (mesmo separador nas duas posições)
+DATE_SHAPE = re.compile(r'\s*(\d{1,2})([/\-])(\d{1,2})\2(\d{4}|\d{2})\s*')
+
+
+def _pivot_year(two_digit_year: int) -> int:
+    """Ano com dois dígitos, mesma regra do %y do strptime (69-99 → 1900, 00-68 → 2000)"""
+    return two_digit_year + (1900 if two_digit_year >= 69 else 2000)
+
+
+def _parse_shape(value: str) -> Optional[datetime]:
+    """Parsear formatos dd/mm/aaaa e dd-mm-aa pela regex (None se não casar ou inválida)"""
+    match = DATE_SHAPE.fullmatch(value)
+    if not match:
+        return None
+    day, _, month, year = match.groups()
+    year_number = int(year)
+    if len(year) == 2:
+        year_number = _pivot_year(year_number)
+    try:
+        return datetime(year_number, int(month), int(day))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> Optional[datetime]:
+    """
+    Parsear data extraída do documento
+    Formatos comuns pela regex; os demais pelo parser automático do dateutil (dia primeiro)
+    (os parsers só extraem datas com dígitos, então não há confusões do OCR a corrigir aqui)
+    """
+    parsed = _parse_shape(value)
+    if parsed:
+        return parsed
+    
+    try:
+        return date_parser.parse(value, dayfirst=True)
+    except Exception:
+        return None
+
+
+def months_between(start: Union[date, datetime], end: Union[date, datetime]) -> int:
+    """Diferença em meses de calendário (o dia não é considerado)"""
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
+def months_worked(start_date: str, end_date: Optional[str] = None) -> Optional[int]:
+    """
+    Meses trabalhados entre duas datas extraídas
+    Sem data de saída (contrato em aberto) conta até hoje, sem formatar e re-parsear a data atual
+    Retorna None se alguma das datas não puder ser interpretada
+    """
+    start = parse_date(start_date)
+    end = parse_date(end_date) if end_date is not None else date.today()
+    if not start or not end:
+        return None
+    return max(0, months_between(start, end))
@@ -0,0 +1,176 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Course, DocumentExtraction
+from app.services.position_matcher import char_ngrams, fold_text
+from app.services.validation_service import ValidationService
+
+# N-gramas do índice: os trigramas que o PositionMatcher também compara
+INDEX_NGRAM_SIZES = (3,)
+
+# Palavras que não distinguem cargos (não entram no índice)
+STOPWORDS = frozenset({"de", "da", "do", "das", "dos", "em", "e", "a", "o", "na", "no", "para"})
+
+# Ordem de exibição dos resultados
+STATUS_RANK = {"approved": 0, "manual_review": 1, "rejected": 2}
+
+
+def position_grams(text: Optional[str]) -> Set[str]:
+    """
+    Trigramas de caracteres (sem acentos, minúsculas) que identificam um cargo
+    Mesmos n-gramas do matcher: um cargo com erro de OCR ("Eletrlcista") ainda
+    compartilha trigramas com o aceito ("Eletricista")
+    """
+    if not text:
+        return set()
+    folded = " ".join(token for token in fold_text(text).split() if token not in STOPWORDS)
+    return set(char_ngrams(folded, INDEX_NGRAM_SIZES))
+
+
+class CourseCatalogIndex:
+    """
+    Índice invertido do catálogo de cursos ativos
+    Trigramas dos cargos aceitos e códigos CBO aceitos apontam para os IDs dos cursos; um cargo
+    extraído só é avaliado contra os cursos que compartilham ao menos um trigrama ou código
+    (o matcher não aprova cargos sem n-gramas em comum)
+    """
+    
+    def __init__(self, courses: List[Course]):
+        self.course_count = len(courses)
+        self.course_ids: Set[int] = {course.id for course in courses}
+        self.gram_index: Dict[str, Set[int]] = defaultdict(set)
+        self.cbo_index: Dict[str, Set[int]] = defaultdict(set)
+        for course in courses:
+            for position in course.accepted_positions or []:
+                for gram in position_grams(position):
+                    self.gram_index[gram].add(course.id)
+            for code in course.accepted_cbo_codes or []:
+                self.cbo_index[code].add(course.id)
+        self.cbo_prefix_lengths = sorted({len(code) for code in self.cbo_index})
+    
+    def candidates(self, extraction: DocumentExtraction) -> Set[int]:
+        """Cursos plausíveis para uma experiência (trigrama do cargo ou prefixo CBO em comum)"""
+        course_ids: Set[int] = set()
+        if extraction.position and len(fold_text(extraction.position)) < 3:
+            # Cargo curto demais para trigramas (ex.: "TI"): pode estar contido em qualquer aceito
+            course_ids |= self.course_ids
+        for gram in position_grams(extraction.position):
+            course_ids |= self.gram_index.get(gram, set())
+        if extraction.cbo_code:
+            for length in self.cbo_prefix_lengths:
+                course_ids |= self.cbo_index.get(extraction.cbo_code[:length], set())
+        return course_ids
+
+
+def catalog_version(db: Session) -> Tuple[int, int, int]:
+    """
+    Sinal barato de mudança no catálogo ativo: quantidade, soma dos IDs e soma das revisões
+    Criar, excluir, ativar/desativar um curso ou alterar seus requisitos muda o resultado
+    """
+    count, id_sum, revision_sum = db.query(
+        func.count(Course.id),
+        func.coalesce(func.sum(Course.id), 0),
+        func.coalesce(func.sum(Course.revision), 0)
+    ).filter(Course.is_active == True).one()
+    return int(count), int(id_sum), int(revision_sum)
+
+
+_catalog_index: Optional[CourseCatalogIndex] = None
+_catalog_version: Optional[Tuple[int, int, int]] = None
+_catalog_lock = threading.Lock()
+
+
+def invalidate_catalog_index():
+    """Descartar o índice (chamado nas escritas de cursos deste processo)"""
+    global _catalog_index, _catalog_version
+    with _catalog_lock:
+        _catalog_index, _catalog_version = None, None
+
+
+def get_catalog_index(db: Session) -> CourseCatalogIndex:
+    """Índice do catálogo, reconstruído apenas quando o catálogo ativo muda"""
+    global _catalog_index, _catalog_version
+    version = catalog_version(db)
+    with _catalog_lock:
+        if _catalog_index is not None and _catalog_version == version:
+            return _catalog_index
+    
+    courses = db.query(Course).filter(Course.is_active == True).all()
+    index = CourseCatalogIndex(courses)
+    with _catalog_lock:
+        _catalog_index, _catalog_version = index, version
+    return index
+
+
+class EligibilityService:
+    """Serviço que avalia um documento contra todos os cursos ativos de uma vez"""
+    
+    def __init__(self):
+        self.validation_service = ValidationService()
+    
+    def evaluate_document(
+        self,
+        extractions: List[DocumentExtraction],
+        db: Session,
+        include_rejected: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Cursos para os quais o documento é elegível, do melhor para o pior resultado
+        Cada curso candidato é validado com todas as experiências do documento
+        
+        Returns:
+            Dict com courses_evaluated, candidates_scored e results (ranqueados)
+        """
+        index = get_catalog_index(db)
+        
+        scored = set()
+        for extraction in extractions:
+            scored |= index.candidates(extraction)
+        
+        # Só os cursos candidatos são carregados (dados atuais, inclusive nome e código)
+        courses = db.query(Course).filter(
+            Course.id.in_(scored),
+            Course.is_active == True
+        ).all() if scored else []
+        
+        results = []
+        for course in courses:
+            # Mesma validação do documento inteiro usada em POST /validations/
+            result = self.validation_service.validate_multiple_experiences(extractions, course)
+            if result["status"] == "rejected" and not include_rejected:
+                continue
+            details = result["details"]
+            results.append({
+                "course_id": course.id,
+                "course_name": course.name,
+                "course_code": course.code,
+                "status": result["status"],
+                "required_months": result["required_months"],
+                "found_months": result["found_months"],
+                "position_match": result.get("position_match"),
+                "similarity_score": details.get("similarity_score"),
+                "match_method": details.get("match_method"),
+                "position_found": details.get("position_found"),
+                "reason": details.get("reason")
+            })
+        results.sort(key=self._sort_key)
+        
+        return {
+            "courses_evaluated": index.course_count,
+            "candidates_scored": len(courses),
+            "results": results
+        }
+    
+    @staticmethod
+    def _sort_key(result: Dict[str, Any]):
+        """Aprovados primeiro; depois maior similaridade do cargo e mais meses"""
+        details = result.get("details", result)
+        return (
+            STATUS_RANK.get(result["status"], len(STATUS_RANK)),
+            -(details.get("similarity_score") or 0),
+            -(result.get("found_months") or 0)
+        )
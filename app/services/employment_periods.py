@@ -0,0 +1,93 @@
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.date_normalizer import parse_date
+
+# Período em índices de mês de calendário, semiaberto: [início, fim)
+Interval = Tuple[int, int]
+
+# Deslocamento entre documentos na versão vetorizada (maior que qualquer índice de mês)
+_GROUP_STRIDE = 1 << 20
+
+
+def month_index(value: date) -> int:
+    """Índice absoluto do mês (ano * 12 + mês), o dia não é considerado"""
+    return value.year * 12 + value.month - 1
+
+
+def current_month() -> int:
+    """Índice do mês atual (fim dos contratos em aberto)"""
+    return month_index(date.today())
+
+
+def employment_interval(start_date: Optional[str], end_date: Optional[str] = None) -> Optional[Interval]:
+    """
+    Período de um contrato em meses, com a mesma regra de months_worked
+    Sem data de saída conta até hoje; None se as datas não puderem ser interpretadas
+    ou o período for vazio
+    """
+    if not start_date:
+        return None
+    start = parse_date(start_date)
+    end = parse_date(end_date) if end_date is not None else date.today()
+    if not start or not end:
+        return None
+    interval = (month_index(start), month_index(end))
+    return interval if interval[1] > interval[0] else None
+
+
+def merge_intervals(intervals: Sequence[Interval]) -> List[Interval]:
+    """
+    União dos períodos (ordenar pelo início e varrer uma vez)
+    Contratos sobrepostos ou simultâneos viram um único período; contíguos também
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def merged_months(intervals: Sequence[Interval]) -> int:
+    """Meses cobertos pelos períodos, sem contar duas vezes os sobrepostos"""
+    return sum(end - start for start, end in merge_intervals(intervals))
+
+
+def merged_months_by_group(
+    groups: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    group_count: int
+) -> np.ndarray:
+    """
+    Versão vetorizada de merged_months para vários documentos de uma vez
+    groups[i] é o documento (0..group_count-1) do período [starts[i], ends[i]);
+    retorna os meses cobertos de cada documento
+    """
+    if len(groups) == 0:
+        return np.zeros(group_count, dtype=np.int64)
+    
+    # Cada documento numa faixa própria: a varredura global não mistura documentos
+    offsets = np.asarray(groups, dtype=np.int64) * _GROUP_STRIDE
+    keyed_starts = offsets + np.asarray(starts, dtype=np.int64)
+    keyed_ends = offsets + np.asarray(ends, dtype=np.int64)
+    
+    order = np.argsort(keyed_starts, kind="stable")
+    keyed_starts = keyed_starts[order]
+    keyed_ends = keyed_ends[order]
+    
+    # Maior fim já visto antes de cada período; só o trecho além dele é novo
+    covered_until = np.maximum.accumulate(keyed_ends)
+    previous_end = np.concatenate(([np.iinfo(np.int64).min], covered_until[:-1]))
+    new_months = np.maximum(keyed_ends - np.maximum(keyed_starts, previous_end), 0)
+    
+    return np.bincount(
+        np.asarray(groups, dtype=np.int64)[order],
+        weights=new_months,
+        minlength=group_count
+    ).astype(np.int64)
@@ -0,0 +1,202 @@
+import re
+from typing import Any, Dict, List, Optional, Type
+
+from app.services.date_normalizer import months_worked
+from app.services.position_matcher import normalize_cbo_code
+
+
+def compute_months_worked(experiences: List[Dict[str, Any]]):
+    """Calcular meses trabalhados de cada experiência (contratos em aberto contam até hoje)"""
+    for exp in experiences:
+        if 'start_date' in exp:
+            try:
+                months = months_worked(exp['start_date'], exp.get('end_date'))
+                if months is not None:
+                    exp['months_worked'] = months
+            except Exception as e:
+                print(f"Erro ao calcular meses: {e}")
+                exp['months_worked'] = 0
+
+
+class ExperienceParser:
+    """
+    Interface de um parser de experiências profissionais
+    Todas as versões produzem os mesmos dicionários (company_name, position,
+    cbo_code, start_date, end_date, months_worked); a versão é registrada junto às extrações
+    """
+    
+    version = "base"
+    
+    def parse(self, text: str) -> List[Dict[str, Any]]:
+        """Parsear experiências profissionais do texto extraído"""
+        raise NotImplementedError
+
+
+class RegexExperienceParser(ExperienceParser):
+    """
+    Parser original: até cinco buscas de regex (não compiladas) por linha
+    Mantido como referência de comportamento e para reproduzir extrações antigas
+    """
+    
+    version = "v1"
+    
+    def parse(self, text: str) -> List[Dict[str, Any]]:
+        experiences = []
+        
+        # Padrões para identificar informações
+        company_patterns = [
+            r'(?:empresa|empregador|razão social)[\s:]+([^\n]+)',
+            r'CNPJ[\s:]+[\d\.\/\-]+[\s]+([^\n]+)',
+        ]
+        
+        position_patterns = [
+            r'(?:cargo|função|ocupação)[\s:]+([^\n]+)',
+            r'CBO[\s:]+[\d\-]+[\s]+([^\n]+)',
+        ]
+        
+        cbo_pattern = r'CBO[\s:]+(\d[\d\.\-]*)'
+        
+        # Dividir texto em blocos (cada experiência)
+        lines = text.split('\n')
+        current_experience = {}
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                if current_experience:
+                    experiences.append(current_experience)
+                    current_experience = {}
+                continue
+            
+            # Tentar extrair empresa
+            for pattern in company_patterns:
+                match = re.search(pattern, line, re.IGNORECASE)
+                if match:
+                    current_experience['company_name'] = match.group(1).strip()
+            
+            # Tentar extrair cargo
+            for pattern in position_patterns:
+                match = re.search(pattern, line, re.IGNORECASE)
+                if match:
+                    current_experience['position'] = match.group(1).strip()
+            
+            # Tentar extrair código CBO
+            match = re.search(cbo_pattern, line, re.IGNORECASE)
+            if match and normalize_cbo_code(match.group(1)):
+                current_experience['cbo_code'] = normalize_cbo_code(match.group(1))
+            
+            # Tentar extrair datas
+            date_matches = re.findall(r'\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}', line)
+            if date_matches:
+                if 'start_date' not in current_experience and len(date_matches) > 0:
+                    current_experience['start_date'] = date_matches[0]
+                if len(date_matches) > 1:
+                    current_experience['end_date'] = date_matches[1]
+                elif 'start_date' in current_experience and len(date_matches) == 1:
+                    if 'admiss' not in line.lower() and 'entrada' not in line.lower():
+                        current_experience['end_date'] = date_matches[0]
+        
+        # Adicionar última experiência
+        if current_experience:
+            experiences.append(current_experience)
+        
+        compute_months_worked(experiences)
+        return experiences
+
+
+class CompiledExperienceParser(ExperienceParser):
+    """
+    Parser de passada única com padrões pré-compilados
+    O texto é dividido em blocos (linhas em branco) por uma única regex; blocos sem
+    nenhuma palavra-chave nem data são descartados de uma vez. Nos demais, cada linha
+    é classificada por uma alternação de todas as palavras-chave e só as linhas
+    marcadas passam pelos padrões específicos. Resultado idêntico ao da v1.
+    """
+    
+    version = "v2"
+    
+    # Separador de blocos: quebra de linha seguida de linhas só com espaços
+    BLOCK_SEPARATOR = re.compile(r'\n(?:[^\S\n]*\n)+')
+    # Todos os padrões de empresa/cargo exigem uma destas palavras
+    KEYWORDS = re.compile(r'empresa|empregador|razão social|cnpj|cargo|função|ocupação|cbo', re.IGNORECASE)
+    DATE = re.compile(r'\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}')
+    # Mesma ordem da v1: o último padrão que casar prevalece
+    COMPANY_PATTERNS = (
+        re.compile(r'(?:empresa|empregador|razão social)[\s:]+([^\n]+)', re.IGNORECASE),
+        re.compile(r'CNPJ[\s:]+[\d\.\/\-]+[\s]+([^\n]+)', re.IGNORECASE),
+    )
+    POSITION_PATTERNS = (
+        re.compile(r'(?:cargo|função|ocupação)[\s:]+([^\n]+)', re.IGNORECASE),
+        re.compile(r'CBO[\s:]+[\d\-]+[\s]+([^\n]+)', re.IGNORECASE),
+    )
+    CBO_CODE = re.compile(r'CBO[\s:]+(\d[\d\.\-]*)', re.IGNORECASE)
+    
+    def parse(self, text: str) -> List[Dict[str, Any]]:
+        experiences = []
+        keywords_search = self.KEYWORDS.search
+        date_search = self.DATE.search
+        date_findall = self.DATE.findall
+        
+        for block in self.BLOCK_SEPARATOR.split(text):
+            # Bloco sem palavra-chave nem data não gera experiência
+            has_keywords = keywords_search(block) is not None
+            if not has_keywords and date_search(block) is None:
+                continue
+            
+            experience = {}
+            for line in block.split('\n'):
+                line = line.strip()
+                if not line:
+                    # Linha com espaços não capturados pelo separador (ex.: \r ou \f)
+                    if experience:
+                        experiences.append(experience)
+                        experience = {}
+                    continue
+                
+                if has_keywords and keywords_search(line):
+                    for pattern in self.COMPANY_PATTERNS:
+                        match = pattern.search(line)
+                        if match:
+                            experience['company_name'] = match.group(1).strip()
+                    for pattern in self.POSITION_PATTERNS:
+                        match = pattern.search(line)
+                        if match:
+                            experience['position'] = match.group(1).strip()
+                    match = self.CBO_CODE.search(line)
+                    if match:
+                        cbo_code = normalize_cbo_code(match.group(1))
+                        if cbo_code:
+                            experience['cbo_code'] = cbo_code
+                
+                date_matches = date_findall(line)
+                if date_matches:
+                    if 'start_date' not in experience:
+                        experience['start_date'] = date_matches[0]
+                    if len(date_matches) > 1:
+                        experience['end_date'] = date_matches[1]
+                    elif 'start_date' in experience:
+                        lowered = line.lower()
+                        if 'admiss' not in lowered and 'entrada' not in lowered:
+                            experience['end_date'] = date_matches[0]
+            
+            if experience:
+                experiences.append(experience)
+        
+        compute_months_worked(experiences)
+        return experiences
+
+
+EXPERIENCE_PARSERS: Dict[str, Type[ExperienceParser]] = {
+    RegexExperienceParser.version: RegexExperienceParser,
+    CompiledExperienceParser.version: CompiledExperienceParser,
+}
+
+DEFAULT_PARSER_VERSION = CompiledExperienceParser.version
+
+
+def get_experience_parser(version: Optional[str] = None) -> ExperienceParser:
+    """Obter parser pela versão (None usa a padrão)"""
+    version = version or DEFAULT_PARSER_VERSION
+    if version not in EXPERIENCE_PARSERS:
+        raise ValueError(f"Versão de parser desconhecida: {version}")
+    return EXPERIENCE_PARSERS[version]()
@@ -0,0 +1,193 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.database import SessionLocal
+from app.models import Course, Document, DocumentExtraction
+from app.repositories import DocumentRepository, CourseRepository
+from app.services.ocr_service import OCRService
+from app.services.validation_service import ValidationService
+from app.services.job_service import Job
+from app.services.text_storage import compress_text, join_pages
+
+
+class ExtractionService:
+    """Serviço que executa a extração de um documento (OCR + parsing) dentro de um job"""
+    
+    def run_extraction(
+        self,
+        job: Job,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        course_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Extrair dados do documento do job e salvar as experiências encontradas
+        Executado em um worker do pool de jobs, com sessão de banco própria
+        first_page/last_page restringem o OCR a um intervalo de páginas do PDF
+        Com course_id, a extração é incremental e para quando o requisito do curso é atendido
+        Extrações anteriores do documento são substituídas
+        """
+        db = SessionLocal()
+        try:
+            repo = DocumentRepository(db)
+            document = repo.get_document(job.document_id)
+            if not document:
+                raise ValueError("Documento não encontrado")
+            
+            ocr_service = OCRService()
+            if course_id is not None:
+                course = CourseRepository(db).get_course(course_id)
+                if not course:
+                    raise ValueError("Curso não encontrado")
+                raw_text, page_offsets, experiences = self._extract_until_requirement_met(
+                    job, ocr_service, document, course, first_page, last_page
+                )
+            else:
+                # Extrair texto usando OCR
+                raw_text = ocr_service.extract_text(
+                    document.file_path,
+                    document.file_type,
+                    progress_callback=job.update_progress,
+                    first_page=first_page,
+                    last_page=last_page
+                )
+                job.result["mode"] = "full"
+                page_offsets = ocr_service.page_offsets
+                
+                # Parsear experiências profissionais
+                experiences = ocr_service.parse_work_experience(raw_text) if raw_text else []
+            
+            # Registrar o caminho de cada página (camada de texto ou OCR)
+            page_sources = ocr_service.get_page_sources()
+            job.result["page_sources"] = page_sources
+            # Estatísticas da triagem (páginas descartadas antes do OCR completo)
+            triage = ocr_service.get_triage_summary()
+            if triage:
+                job.result["triage"] = triage
+            
+            if not raw_text:
+                raise ValueError("Não foi possível extrair texto do documento")
+            
+            if not experiences:
+                message = "Não foi possível identificar experiências profissionais no documento"
+                if page_sources["skipped_pages"]:
+                    message += f" ({page_sources['skipped_pages']} página(s) descartada(s) na triagem)"
+                raise ValueError(message)
+            
+            job.result["parser_version"] = ocr_service.parser.version
+            
+            for exp in experiences:
+                exp['page_sources'] = page_sources
+                exp['extraction_mode'] = job.result["mode"]
+                if triage:
+                    # Páginas descartadas por documento, para medir o recall da triagem
+                    exp['triage'] = {key: value for key, value in triage.items() if key != "pages"}
+            
+            # Substituir extrações anteriores (ex.: extração incremental seguida da completa)
+            # e salvar as novas numa única transação: uma falha não deixa extração parcial;
+            # o texto completo é gravado uma vez por documento, comprimido
+            codec, compressed_text = compress_text(raw_text)
+            repo.save_document_text(
+                document.id,
+                codec,
+                compressed_text,
+                len(raw_text.encode("utf-8")),
+                page_offsets,
+                commit=False
+            )
+            job.extraction_ids.extend(repo.replace_extractions(
+                document.id,
+                experiences,
+                ocr_service.parser.version
+            ))
+            
+            return job.extraction_ids
+        finally:
+            db.close()
+    
+    def _extract_until_requirement_met(
+        self,
+        job: Job,
+        ocr_service: OCRService,
+        document: Document,
+        course: Course,
+        first_page: Optional[int],
+        last_page: Optional[int]
+    ):
+        """
+        Extração incremental: processa as páginas em ordem, parseando o texto acumulado,
+        e para assim que as experiências encontradas atendem ao requisito do curso;
+        se não parar antes, as páginas descartadas na triagem também passam pelo OCR
+        
+        Returns:
+            (texto extraído, início de cada página no texto, experiências)
+        """
+        validation_service = ValidationService()
+        job.result.update(mode="lazy", course_id=course.id, stopped_early=False)
+        
+        # Texto completo já em cache: não há OCR a economizar
+        cached_text = ocr_service.get_cached_text(
+            document.file_path, document.file_type, first_page, last_page
+        )
+        if cached_text is not None or document.file_type != "pdf":
+            raw_text = cached_text
+            if raw_text is None:
+                raw_text = ocr_service.extract_text(
+                    document.file_path,
+                    document.file_type,
+                    progress_callback=job.update_progress
+                )
+            # Páginas do texto em cache (o cache não reporta progresso por página)
+            job.result["pages_processed"] = len(ocr_service.page_sources) or job.pages_done
+            experiences = ocr_service.parse_work_experience(raw_text) if raw_text else []
+            return raw_text, ocr_service.page_offsets, experiences
+        
+        page_texts: List[Tuple[int, str]] = []
+        experiences: List[Dict[str, Any]] = []
+        pages = ocr_service.iter_pdf_page_texts(
+            document.file_path,
+            first_page,
+            last_page,
+            progress_callback=job.update_progress
+        )
+        for page_number, text in pages:
+            page_texts.append((page_number, text))
+            if not text:
+                continue
+            
+            # Re-parsear o texto acumulado: uma experiência pode atravessar páginas
+            experiences = ocr_service.parse_work_experience(join_pages(p for p in page_texts if p[1])[0])
+            if validation_service.meets_course_requirement(self._complete_experiences(experiences), course):
+                job.result.update(stopped_early=True, last_page_processed=page_number)
+                pages.close()
+                break
+        
+        if not job.result["stopped_early"]:
+            # Requisito não atendido: aplicar OCR também nas páginas descartadas na triagem
+            fallback_texts = ocr_service.ocr_skipped_pages(document.file_path)
+            if fallback_texts:
+                job.result["triage_fallback_pages"] = len(fallback_texts)
+                page_texts = [(n, fallback_texts.get(n, text)) for n, text in page_texts]
+                experiences = ocr_service.parse_work_experience(join_pages(p for p in page_texts if p[1])[0])
+        
+        job.result["pages_processed"] = len(page_texts)
+        raw_text, page_offsets = join_pages(p for p in page_texts if p[1])
+        return raw_text, page_offsets, experiences
+    
+    def _complete_experiences(self, experiences: List[Dict[str, Any]]) -> List[DocumentExtraction]:
+        """
+        Experiências com data de saída, como extrações transitórias para validação
+        Sem data de saída, o contrato pode continuar na próxima página ainda não lida
+        (e seria contado até hoje), então não conta para interromper a extração
+        """
+        return [
+            DocumentExtraction(
+                company_name=exp.get('company_name'),
+                position=exp.get('position'),
+                cbo_code=exp.get('cbo_code'),
+                start_date=exp.get('start_date'),
+                end_date=exp.get('end_date'),
+                months_worked=exp.get('months_worked')
+            )
+            for exp in experiences
+            if exp.get('end_date')
+        ]
@@ -0,0 +1,150 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+
+class Job:
+    """Estado de um job executado no pool de workers"""
+    
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    
+    def __init__(self, job_type: str, document_id: Optional[int] = None):
+        self.id = uuid.uuid4().hex
+        self.job_type = job_type
+        self.document_id = document_id
+        self.status = self.PENDING
+        self.pages_done = 0
+        self.pages_total = 0
+        self.extraction_ids: List[int] = []
+        self.result: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+    
+    def update_progress(self, pages_done: int, pages_total: int):
+        """Atualizar progresso (páginas processadas / total)"""
+        with self._lock:
+            self.pages_done = pages_done
+            self.pages_total = pages_total
+    
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.COMPLETED, self.FAILED)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável do job"""
+        with self._lock:
+            return {
+                "id": self.id,
+                "job_type": self.job_type,
+                "document_id": self.document_id,
+                "status": self.status,
+                "pages_done": self.pages_done,
+                "pages_total": self.pages_total,
+                "extraction_ids": list(self.extraction_ids),
+                "result": dict(self.result),
+                "error": self.error,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at
+            }
+
+
+class JobService:
+    """
+    Fila de jobs em processo
+    Executa tarefas pesadas (OCR) em um pool de threads para não bloquear o event loop
+    """
+    
+    def __init__(self, max_workers: int = 2, history_limit: int = 1000):
+        self.max_workers = max_workers
+        self.history_limit = history_limit
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="job-worker"
+                )
+            return self._executor
+    
+    def submit(
+        self,
+        job_type: str,
+        func: Callable[..., Any],
+        document_id: Optional[int] = None,
+        **kwargs
+    ) -> Job:
+        """
+        Enfileirar um job
+        A função recebe o próprio job como primeiro argumento para reportar progresso
+        """
+        job = Job(job_type=job_type, document_id=document_id)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict_finished()
+        self._get_executor().submit(self._run, job, func, kwargs)
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Buscar job por ID"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def list_jobs(self, document_id: Optional[int] = None) -> List[Job]:
+        """Listar jobs conhecidos (mais recentes primeiro)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if document_id is not None:
+            jobs = [j for j in jobs if j.document_id == document_id]
+        return list(reversed(jobs))
+    
+    def shutdown(self, wait: bool = False):
+        """Encerrar o pool de workers"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _run(self, job: Job, func: Callable[..., Any], kwargs: Dict[str, Any]):
+        job.status = Job.RUNNING
+        job.started_at = datetime.utcnow()
+        try:
+            func(job, **kwargs)
+            job.status = Job.COMPLETED
+        except Exception as e:
+            print(f"Erro ao executar job {job.id}: {e}")
+            job.error = str(e)
+            job.status = Job.FAILED
+        finally:
+            job.finished_at = datetime.utcnow()
+    
+    def _evict_finished(self):
+        """Descartar jobs finalizados mais antigos acima do limite de histórico"""
+        if len(self._jobs) <= self.history_limit:
+            return
+        for job_id in list(self._jobs.keys()):
+            if len(self._jobs) <= self.history_limit:
+                break
+            if self._jobs[job_id].is_finished:
+                del self._jobs[job_id]
+
+
+job_service = JobService(
+    max_workers=settings.JOB_WORKERS,
+    history_limit=settings.JOB_HISTORY_LIMIT
+)
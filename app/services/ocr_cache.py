@@ -0,0 +1,298 @@
+import hashlib
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.ocr_cache import OCRCacheEntry
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Calcular SHA-256 do conteúdo de um arquivo"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(file_hash: str, **params: Any) -> str:
+    """
+    Montar chave do cache a partir do hash do arquivo e das configurações do OCR
+    (engine, idioma, DPI, intervalo de páginas...). Parâmetros None são ignorados.
+    """
+    parts = [file_hash] + [f"{name}={params[name]}" for name in sorted(params) if params[name] is not None]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class OCRCacheBackend:
+    """
+    Interface do cache de resultados de OCR
+    Backends implementam _get/_set/_evict/_clear; contadores ficam na classe base
+    """
+    
+    name = "base"
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Buscar texto em cache (atualiza recência do LRU)"""
+        try:
+            text = self._get(key)
+        except Exception as e:
+            print(f"Erro ao ler cache de OCR: {e}")
+            text = None
+        with self._lock:
+            if text is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return text
+    
+    def set(self, key: str, text: str):
+        """Gravar texto no cache e aplicar limite de tamanho"""
+        try:
+            self._set(key, text)
+            evicted = self._evict()
+        except Exception as e:
+            print(f"Erro ao gravar cache de OCR: {e}")
+            return
+        with self._lock:
+            self.evictions += evicted
+    
+    def clear(self):
+        """Remover todas as entradas do cache"""
+        self._clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Estatísticas de uso do cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0,
+                "evictions": self.evictions,
+                "entries": self._entry_count(),
+                "size_bytes": self._size_bytes(),
+                "max_bytes": self.max_bytes
+            }
+    
+    def _get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+    
+    def _set(self, key: str, text: str):
+        raise NotImplementedError
+    
+    def _evict(self) -> int:
+        raise NotImplementedError
+    
+    def _clear(self):
+        raise NotImplementedError
+    
+    def _entry_count(self) -> int:
+        raise NotImplementedError
+    
+    def _size_bytes(self) -> int:
+        raise NotImplementedError
+
+
+class DiskOCRCache(OCRCacheBackend):
+    """Cache de OCR em disco local: um arquivo por chave, LRU pelo horário de acesso (mtime)"""
+    
+    name = "disk"
+    
+    def __init__(self, directory: str, max_bytes: int):
+        super().__init__(max_bytes)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # Tamanho total mantido em memória; o diretório só é varrido ao despejar
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.txt")
+    
+    def _get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+        # Marcar como usado recentemente
+        os.utime(path)
+        return text
+    
+    def _set(self, key: str, text: str):
+        path = self._path(key)
+        try:
+            previous_size = os.path.getsize(path)
+        except FileNotFoundError:
+            previous_size = 0
+        # Processo + thread: workers diferentes podem compartilhar OCR_CACHE_DIR
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._total_bytes += os.path.getsize(path) - previous_size
+    
+    def _entries(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".txt"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _evict(self) -> int:
+        if self._total_bytes <= self.max_bytes:
+            return 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._total_bytes = total
+        return evicted
+    
+    def _clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._total_bytes = 0
+    
+    def _entry_count(self) -> int:
+        return len(self._entries())
+    
+    def _size_bytes(self) -> int:
+        return self._total_bytes
+
+
+class DatabaseOCRCache(OCRCacheBackend):
+    """Cache de OCR na tabela ocr_cache_entries, LRU por last_accessed_at"""
+    
+    name = "database"
+    
+    def _get(self, key: str) -> Optional[str]:
+        db = SessionLocal()
+        try:
+            entry = db.query(OCRCacheEntry).filter(OCRCacheEntry.cache_key == key).first()
+            if not entry:
+                return None
+            text = entry.text
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+            return text
+        finally:
+            db.close()
+    
+    def _set(self, key: str, text: str):
+        db = SessionLocal()
+        try:
+            entry = db.query(OCRCacheEntry).filter(OCRCacheEntry.cache_key == key).first()
+            if not entry:
+                entry = OCRCacheEntry(cache_key=key)
+                db.add(entry)
+            entry.text = text
+            entry.size_bytes = len(text.encode("utf-8"))
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+        finally:
+            db.close()
+    
+    def _evict(self) -> int:
+        db = SessionLocal()
+        try:
+            total = db.query(func.coalesce(func.sum(OCRCacheEntry.size_bytes), 0)).scalar()
+            if total <= self.max_bytes:
+                return 0
+            
+            # Percorrer do menos usado para o mais usado até caber no limite
+            to_delete = []
+            rows = db.query(OCRCacheEntry.cache_key, OCRCacheEntry.size_bytes).order_by(
+                OCRCacheEntry.last_accessed_at
+            ).yield_per(500)
+            for cache_key, size_bytes in rows:
+                if total <= self.max_bytes:
+                    break
+                to_delete.append(cache_key)
+                total -= size_bytes
+            
+            if to_delete:
+                db.query(OCRCacheEntry).filter(
+                    OCRCacheEntry.cache_key.in_(to_delete)
+                ).delete(synchronize_session=False)
+                db.commit()
+            return len(to_delete)
+        finally:
+            db.close()
+    
+    def _clear(self):
+        db = SessionLocal()
+        try:
+            db.query(OCRCacheEntry).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    def _entry_count(self) -> int:
+        db = SessionLocal()
+        try:
+            return db.query(OCRCacheEntry).count()
+        finally:
+            db.close()
+    
+    def _size_bytes(self) -> int:
+        db = SessionLocal()
+        try:
+            return db.query(func.coalesce(func.sum(OCRCacheEntry.size_bytes), 0)).scalar()
+        finally:
+            db.close()
+
+
+_ocr_cache: Optional[OCRCacheBackend] = None
+_ocr_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> Optional[OCRCacheBackend]:
+    """
+    Obter instância compartilhada do cache de OCR conforme OCR_CACHE_BACKEND
+    Retorna None quando o cache está desativado ("none")
+    """
+    global _ocr_cache
+    backend = settings.OCR_CACHE_BACKEND
+    if backend == "none":
+        return None
+    
+    with _ocr_cache_lock:
+        if _ocr_cache is None or _ocr_cache.name != backend:
+            if backend == "disk":
+                _ocr_cache = DiskOCRCache(settings.OCR_CACHE_DIR, settings.OCR_CACHE_MAX_BYTES)
+            elif backend == "database":
+                _ocr_cache = DatabaseOCRCache(settings.OCR_CACHE_MAX_BYTES)
+            else:
+                raise ValueError(f"Backend de cache de OCR desconhecido: {backend}")
+        return _ocr_cache
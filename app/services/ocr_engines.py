@@ -0,0 +1,148 @@
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple, Type
+
+import pytesseract
+from PIL import Image
+
+
+class OCREngine:
+    """
+    Interface de um engine de OCR
+    Instâncias são reutilizadas (ver get_ocr_engine) para manter recursos carregados
+    """
+    
+    name = "base"
+    
+    def __init__(self, lang: str = "por"):
+        self.lang = lang
+    
+    def image_to_string(self, image: Image.Image) -> str:
+        """Extrair texto de uma imagem"""
+        raise NotImplementedError
+    
+    def images_to_strings(self, images: List[Image.Image]) -> List[str]:
+        """Extrair texto de várias páginas (engines podem processá-las numa única chamada)"""
+        return [self.image_to_string(image) for image in images]
+    
+    def close(self):
+        """Liberar recursos do engine"""
+
+
+class TesseractSubprocessEngine(OCREngine):
+    """
+    Tesseract via pytesseract: um processo tesseract por chamada
+    Em lote, as páginas vão para um único processo através de um arquivo de lista,
+    carregando os dados do idioma uma vez só
+    """
+    
+    name = "tesseract"
+    
+    def image_to_string(self, image: Image.Image) -> str:
+        return pytesseract.image_to_string(image, lang=self.lang)
+    
+    def images_to_strings(self, images: List[Image.Image]) -> List[str]:
+        if len(images) <= 1:
+            return [self.image_to_string(image) for image in images]
+        
+        with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp_dir:
+            paths = []
+            for index, image in enumerate(images):
+                path = os.path.join(tmp_dir, f"page_{index}.png")
+                image.save(path, "PNG")
+                paths.append(path)
+            
+            list_path = os.path.join(tmp_dir, "pages.txt")
+            with open(list_path, "w") as f:
+                f.write("\n".join(paths))
+            
+            # O tesseract separa as páginas da saída com form feed
+            text = pytesseract.image_to_string(list_path, lang=self.lang)
+        
+        pages = text.split("\f")[:len(images)]
+        return pages + [""] * (len(images) - len(pages))
+
+
+class TesseractAPIEngine(OCREngine):
+    """
+    Tesseract em processo via tesserocr (dependência opcional)
+    Mantém um handle da API carregado por thread, evitando fork e recarga do idioma a cada página
+    """
+    
+    name = "tesserocr"
+    
+    def __init__(self, lang: str = "por"):
+        super().__init__(lang)
+        try:
+            import tesserocr
+        except ImportError as e:
+            raise RuntimeError("Engine 'tesserocr' requer o pacote tesserocr instalado") from e
+        self._tesserocr = tesserocr
+        self._local = threading.local()
+        self._apis = []
+        self._apis_lock = threading.Lock()
+    
+    def _get_api(self):
+        api = getattr(self._local, "api", None)
+        if api is None:
+            api = self._tesserocr.PyTessBaseAPI(lang=self.lang)
+            self._local.api = api
+            with self._apis_lock:
+                self._apis.append(api)
+        return api
+    
+    def image_to_string(self, image: Image.Image) -> str:
+        api = self._get_api()
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    
+    def close(self):
+        with self._apis_lock:
+            apis, self._apis = self._apis, []
+        for api in apis:
+            api.End()
+
+
+OCR_ENGINES: Dict[str, Type[OCREngine]] = {
+    TesseractSubprocessEngine.name: TesseractSubprocessEngine,
+    TesseractAPIEngine.name: TesseractAPIEngine,
+}
+
+DEFAULT_OCR_ENGINE = TesseractSubprocessEngine.name
+
+_engines: Dict[Tuple[str, str], OCREngine] = {}
+_engines_lock = threading.Lock()
+_warned_names = set()
+
+
+def resolve_engine_name(name: Optional[str]) -> str:
+    """Nome efetivo do engine (engines desconhecidos caem no padrão)"""
+    if name in OCR_ENGINES:
+        return name
+    if name not in _warned_names:
+        _warned_names.add(name)
+        print(f"⚠️ Engine de OCR desconhecido '{name}', usando '{DEFAULT_OCR_ENGINE}'")
+    return DEFAULT_OCR_ENGINE
+
+
+def get_ocr_engine(name: Optional[str] = None, lang: str = "por") -> OCREngine:
+    """
+    Obter instância compartilhada (aquecida) do engine de OCR neste processo
+    """
+    name = resolve_engine_name(name)
+    with _engines_lock:
+        engine = _engines.get((name, lang))
+        if engine is None:
+            engine = OCR_ENGINES[name](lang=lang)
+            _engines[(name, lang)] = engine
+        return engine
+
+
+def close_ocr_engines():
+    """Liberar todos os engines carregados neste processo"""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.close()
@@ -1,153 +1,536 @@
+import json
+import multiprocessing
 import os
-import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from dateutil import parser as date_parser
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable, Union, Iterator, Tuple
 from PIL import Image
 from pdf2image import convert_from_path
-import pytesseract
 
 from app.core.config import settings
+from app.services.pdf_rasterizer import get_page_count, resolve_page_range, iter_pdf_page_list
+from app.services.pdf_text_layer import extract_text_layer, has_text_layer
+from app.services.image_preprocessing import ImagePreprocessor
+from app.services.ocr_engines import get_ocr_engine, resolve_engine_name
+from app.services.page_triage import PageTriage, summarize_triage
+from app.services.ocr_cache import get_ocr_cache, build_cache_key, hash_file
+from app.services.experience_parser import get_experience_parser
+from app.services.text_storage import join_pages
+
+
+# Páginas em baixa resolução rasterizadas por chamada durante a triagem
+TRIAGE_WINDOW = 10
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _init_ocr_worker(omp_thread_limit: int):
+    """
+    Inicializar processo do pool de OCR
+    Limita as threads OpenMP do Tesseract para não competir com o paralelismo entre páginas
+    """
+    if omp_thread_limit > 0:
+        os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+
+
+def _ocr_pdf_page(
+    pdf_path: str,
+    page_number: int,
+    dpi: int,
+    engine_name: str,
+    lang: str,
+    preprocessor: ImagePreprocessor
+) -> str:
+    """Rasterizar, pré-processar e aplicar OCR em uma única página do PDF (executado no pool de processos)"""
+    # Engine fica carregado no processo do pool entre as páginas
+    engine = get_ocr_engine(engine_name, lang)
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=page_number, last_page=page_number)
+    return "\n".join(engine.images_to_strings([preprocessor.process(image) for image in images]))
+
+
+def _triage_pdf_page(
+    pdf_path: str,
+    page_number: int,
+    triage: PageTriage,
+    engine_name: str,
+    lang: str
+) -> Dict[str, Any]:
+    """Triagem de uma página em baixa resolução (executado no pool de processos)"""
+    engine = get_ocr_engine(engine_name, lang)
+    images = convert_from_path(pdf_path, dpi=triage.dpi, first_page=page_number, last_page=page_number)
+    return triage.evaluate(images[0], engine)
+
+
+def process_pool_size() -> int:
+    """Processos do pool compartilhado (OCR_PROCESS_WORKERS; 0 = número de CPUs)"""
+    return settings.OCR_PROCESS_WORKERS or os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Obter pool de processos compartilhado para OCR por página
+    Processos iniciados com spawn: o pool é criado a partir das threads dos jobs, e um
+    fork do processo do uvicorn (multi-thread) pode herdar locks presos por outras threads
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=process_pool_size(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_ocr_worker,
+                initargs=(settings.OCR_OMP_THREAD_LIMIT,)
+            )
+        return _process_pool
+
+
+def shutdown_process_pool():
+    """Encerrar pool de processos de OCR"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 class OCRService:
     """Serviço para extração de texto via OCR"""
     
-    def __init__(self):
-        self.ocr_engine = "tesseract"
+    def __init__(
+        self,
+        execution_mode: Optional[str] = None,
+        use_cache: bool = True,
+        engine_name: Optional[str] = None
+    ):
+        self.ocr_engine = resolve_engine_name(engine_name or settings.OCR_ENGINE)
+        self.lang = "por"
+        # Instância reutilizada entre requisições (ver ocr_engines)
+        self.engine = get_ocr_engine(self.ocr_engine, self.lang)
+        self.dpi = settings.OCR_DPI
+        # Pré-processamento (orientação, inclinação, escala...) antes do Tesseract
+        self.preprocessor = ImagePreprocessor.from_settings(settings)
+        # sequential: páginas uma a uma; process: páginas em paralelo no pool de processos
+        self.execution_mode = execution_mode or settings.OCR_EXECUTION_MODE
+        # Cache de resultados (chave: SHA-256 do arquivo + configurações do OCR)
+        self.cache = get_ocr_cache() if use_cache else None
+        # Triagem de páginas em baixa resolução antes do OCR completo (None se desativada)
+        self.triage = PageTriage.from_settings(settings)
+        # Origem do texto de cada página na última extração: text_layer, ocr ou skipped
+        self.page_sources: Dict[int, str] = {}
+        # Início de cada página no texto retornado ([[página, offset], ...])
+        self.page_offsets: List[List[int]] = []
+        self.triage_results: Dict[int, Dict[str, Any]] = {}
+        self.triage_fallback = False
+        # Parser de experiências (versão registrada no resultado da extração)
+        self.parser = get_experience_parser(settings.EXPERIENCE_PARSER_VERSION)
     
-    def extract_text_from_image(self, image_path: str) -> str:
-        """Extrair texto de uma imagem"""
+    def extract_text_from_image(self, image: Union[str, Image.Image]) -> str:
+        """
+        Extrair texto de uma imagem
+        Aceita o caminho do arquivo ou a imagem já decodificada (páginas de PDF)
+        """
         try:
-            # Usar Tesseract
-            image = Image.open(image_path)
-            text = pytesseract.image_to_string(image, lang='por')
-            return text
+            if isinstance(image, str):
+                image = Image.open(image)
+            image = self.preprocessor.process(image)
+            return self.engine.image_to_string(image)
         except Exception as e:
             print(f"Erro ao extrair texto da imagem: {e}")
             return ""
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extrair texto de um PDF"""
+    def extract_text_from_pdf(
+        self,
+        pdf_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None
+    ) -> str:
+        """
+        Extrair texto de um PDF
+        Páginas com camada de texto embutida são lidas diretamente; as demais passam pelo OCR
+        first_page/last_page (1-indexados, inclusivos) restringem as páginas processadas
+        """
+        # Intervalo inválido é erro do chamador, não falha de OCR
+        page_count = get_page_count(pdf_path)
+        first, last = resolve_page_range(page_count, first_page, last_page)
+        page_numbers = list(range(first, last + 1))
+        
         try:
-            # Converter PDF para imagens
-            images = convert_from_path(pdf_path, dpi=300)
-            all_text = []
+            page_texts: Dict[int, str] = {}
+            if settings.OCR_TEXT_LAYER_ENABLED:
+                page_texts = self._read_text_layer(pdf_path, first, last)
+            for page_number in page_texts:
+                self.page_sources[page_number] = "text_layer"
+            
+            def on_page_done():
+                if progress_callback:
+                    progress_callback(len(page_texts), len(page_numbers))
             
-            for i, image in enumerate(images):
-                # Salvar temporariamente
-                temp_image_path = f"/tmp/page_{i}.jpg"
-                image.save(temp_image_path, 'JPEG')
-                
-                # Extrair texto
-                text = self.extract_text_from_image(temp_image_path)
-                all_text.append(text)
-                
-                # Remover arquivo temporário
-                os.remove(temp_image_path)
+            on_page_done()
             
-            return "\n\n".join(all_text)
+            # Somente páginas sem texto embutido vão para o OCR
+            ocr_pages = [n for n in page_numbers if n not in page_texts]
+            
+            # Triagem: páginas sem indício de contrato não passam pelo OCR completo
+            if self.triage and ocr_pages:
+                ocr_pages = self._triage_pdf_pages(pdf_path, ocr_pages)
+                for page_number, result in self.triage_results.items():
+                    if page_number not in ocr_pages:
+                        page_texts[page_number] = ""
+                        self.page_sources[page_number] = "skipped"
+                on_page_done()
+            
+            if self.execution_mode == "process":
+                self._ocr_pdf_pages_parallel(pdf_path, ocr_pages, page_texts, on_page_done)
+            else:
+                self._ocr_pdf_pages_sequential(pdf_path, ocr_pages, page_texts, on_page_done)
+            
+            text, self.page_offsets = join_pages(
+                (n, page_texts[n]) for n in page_numbers
+                if self.page_sources.get(n) != "skipped"
+            )
+            return text
         except Exception as e:
             print(f"Erro ao extrair texto do PDF: {e}")
             return ""
     
-    def extract_text(self, file_path: str, file_type: str) -> str:
-        """Extrair texto de um arquivo (imagem ou PDF)"""
-        if file_type == "pdf":
-            return self.extract_text_from_pdf(file_path)
-        else:
-            return self.extract_text_from_image(file_path)
+    def iter_pdf_page_texts(
+        self,
+        pdf_path: str,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Extrair texto página a página, em ordem (modo incremental)
+        Permite ao chamador interromper a extração assim que tiver o que precisa;
+        as páginas seguintes não são rasterizadas nem processadas
+        
+        Yields:
+            (número da página, texto) — texto vazio para páginas descartadas na triagem
+        """
+        self._reset_run()
+        page_count = get_page_count(pdf_path)
+        first, last = resolve_page_range(page_count, first_page, last_page)
+        
+        text_layer: Dict[int, str] = {}
+        if settings.OCR_TEXT_LAYER_ENABLED:
+            text_layer = self._read_text_layer(pdf_path, first, last)
+        
+        total = last - first + 1
+        for page_number in range(first, last + 1):
+            text = self._page_text(pdf_path, page_number, text_layer)
+            if progress_callback:
+                progress_callback(page_number - first + 1, total)
+            yield page_number, text
     
-    def parse_work_experience(self, text: str) -> List[Dict[str, Any]]:
+    def _page_text(self, pdf_path: str, page_number: int, text_layer: Dict[int, str]) -> str:
+        """Texto de uma página: camada de texto, triagem e, se necessário, OCR completo"""
+        if page_number in text_layer:
+            self.page_sources[page_number] = "text_layer"
+            return text_layer[page_number]
+        
+        if self.triage:
+            _, thumbnail = next(iter_pdf_page_list(pdf_path, [page_number], dpi=self.triage.dpi))
+            result = self.triage.evaluate(thumbnail, self.engine)
+            self.triage_results[page_number] = result
+            if result["decision"] == "skip":
+                self.page_sources[page_number] = "skipped"
+                return ""
+        
+        _, image = next(iter_pdf_page_list(pdf_path, [page_number], dpi=self.dpi))
+        self.page_sources[page_number] = "ocr"
+        return self.extract_text_from_image(image)
+    
+    def ocr_skipped_pages(self, pdf_path: str) -> Dict[int, str]:
         """
-        Parsear experiências profissionais do texto extraído
-        Procura por padrões comuns em carteiras de trabalho
+        OCR completo das páginas descartadas na triagem da última extração incremental
+        Fallback quando as páginas aceitas não bastaram (evita perder contratos por falso negativo)
         """
-        experiences = []
+        skipped = [n for n, source in sorted(self.page_sources.items()) if source == "skipped"]
+        page_texts: Dict[int, str] = {}
+        if not skipped:
+            return page_texts
         
-        # Padrões para identificar informações
-        company_patterns = [
-            r'(?:empresa|empregador|razão social)[\s:]+([^\n]+)',
-            r'CNPJ[\s:]+[\d\.\/\-]+[\s]+([^\n]+)',
-        ]
+        if self.execution_mode == "process":
+            self._ocr_pdf_pages_parallel(pdf_path, skipped, page_texts, lambda: None)
+        else:
+            self._ocr_pdf_pages_sequential(pdf_path, skipped, page_texts, lambda: None)
+        self.triage_fallback = True
+        return page_texts
+    
+    def _read_text_layer(self, pdf_path: str, first_page: int, last_page: int) -> Dict[int, str]:
+        """Ler a camada de texto das páginas que a possuem (PDFs gerados digitalmente)"""
+        try:
+            texts = extract_text_layer(pdf_path, first_page, last_page)
+        except Exception as e:
+            print(f"Erro ao ler camada de texto do PDF: {e}")
+            return {}
         
-        position_patterns = [
-            r'(?:cargo|função|ocupação)[\s:]+([^\n]+)',
-            r'CBO[\s:]+[\d\-]+[\s]+([^\n]+)',
-        ]
+        return {
+            first_page + offset: text
+            for offset, text in enumerate(texts)
+            if has_text_layer(text, settings.OCR_TEXT_LAYER_MIN_CHARS)
+        }
+    
+    def _triage_pdf_pages(self, pdf_path: str, page_numbers: List[int]) -> List[int]:
+        """
+        Avaliar páginas em baixa resolução e retornar as que devem passar pelo OCR completo
+        Se a triagem descartar todas, todas seguem para o OCR (evita extração vazia por falso negativo)
+        """
+        if self.execution_mode == "process":
+            pool = get_process_pool()
+            futures = {
+                pool.submit(
+                    _triage_pdf_page,
+                    pdf_path,
+                    page_number,
+                    self.triage,
+                    self.ocr_engine,
+                    self.lang
+                ): page_number
+                for page_number in page_numbers
+            }
+            for future in as_completed(futures):
+                self.triage_results[futures[future]] = future.result()
+        else:
+            pages = iter_pdf_page_list(pdf_path, page_numbers, dpi=self.triage.dpi, window=TRIAGE_WINDOW)
+            for page_number, image in pages:
+                self.triage_results[page_number] = self.triage.evaluate(image, self.engine)
         
-        date_patterns = [
-            r'(?:admissão|entrada|início|data de entrada)[\s:]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'(?:saída|desligamento|término|data de saída)[\s:]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-        ]
+        selected = [n for n in page_numbers if self.triage_results[n]["decision"] == "ocr"]
+        if not selected:
+            self.triage_fallback = True
+            return page_numbers
+        return selected
+    
+    def get_triage_summary(self) -> Optional[Dict[str, Any]]:
+        """Estatísticas da triagem da última extração (None se não houve triagem)"""
+        if not self.triage_results:
+            return None
+        return summarize_triage(self.triage_results, fallback=self.triage_fallback)
+    
+    def _ocr_pdf_pages_sequential(
+        self,
+        pdf_path: str,
+        page_numbers: List[int],
+        page_texts: Dict[int, str],
+        on_page_done: Callable[[], None]
+    ):
+        """
+        Aplicar OCR nas páginas rasterizando em streaming
+        Páginas são enviadas ao engine em lotes de até OCR_ENGINE_BATCH_PAGES por chamada
+        """
+        # Apenas uma janela de páginas em memória por vez
+        pages = iter_pdf_page_list(
+            pdf_path,
+            page_numbers,
+            dpi=self.dpi,
+            window=settings.OCR_RASTER_WINDOW
+        )
+        batch_size = max(1, settings.OCR_ENGINE_BATCH_PAGES)
+        batch_numbers: List[int] = []
+        batch_images: List[Image.Image] = []
+        for page_number, image in pages:
+            # Página segue em memória direto para o OCR (sem JPEG intermediário)
+            batch_numbers.append(page_number)
+            batch_images.append(self.preprocessor.process(image))
+            if len(batch_images) >= batch_size:
+                self._ocr_batch(batch_numbers, batch_images, page_texts, on_page_done)
+                batch_numbers, batch_images = [], []
+        if batch_images:
+            self._ocr_batch(batch_numbers, batch_images, page_texts, on_page_done)
+    
+    def _ocr_batch(
+        self,
+        page_numbers: List[int],
+        images: List[Image.Image],
+        page_texts: Dict[int, str],
+        on_page_done: Callable[[], None]
+    ):
+        """Aplicar OCR em um lote de páginas já pré-processadas"""
+        try:
+            texts = self.engine.images_to_strings(images)
+        except Exception as e:
+            print(f"Erro ao extrair texto das páginas {page_numbers}: {e}")
+            texts = [""] * len(images)
+        for page_number, text in zip(page_numbers, texts):
+            page_texts[page_number] = text
+            self.page_sources[page_number] = "ocr"
+            on_page_done()
+    
+    def _ocr_pdf_pages_parallel(
+        self,
+        pdf_path: str,
+        page_numbers: List[int],
+        page_texts: Dict[int, str],
+        on_page_done: Callable[[], None]
+    ):
+        """
+        Aplicar OCR nas páginas em paralelo no pool de processos
+        Cada processo rasteriza a própria página; o texto é remontado na ordem original
+        """
+        if not page_numbers:
+            return
         
-        # Dividir texto em blocos (cada experiência)
-        lines = text.split('\n')
-        current_experience = {}
+        pool = get_process_pool()
+        futures = {
+            pool.submit(
+                _ocr_pdf_page,
+                pdf_path,
+                page_number,
+                self.dpi,
+                self.ocr_engine,
+                self.lang,
+                self.preprocessor
+            ): page_number
+            for page_number in page_numbers
+        }
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_experience:
-                    experiences.append(current_experience)
-                    current_experience = {}
-                continue
-            
-            # Tentar extrair empresa
-            for pattern in company_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    current_experience['company_name'] = match.group(1).strip()
-            
-            # Tentar extrair cargo
-            for pattern in position_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    current_experience['position'] = match.group(1).strip()
-            
-            # Tentar extrair datas
-            date_matches = re.findall(r'\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}', line)
-            if date_matches:
-                if 'start_date' not in current_experience and len(date_matches) > 0:
-                    current_experience['start_date'] = date_matches[0]
-                if len(date_matches) > 1:
-                    current_experience['end_date'] = date_matches[1]
-                elif 'start_date' in current_experience and len(date_matches) == 1:
-                    if 'admiss' not in line.lower() and 'entrada' not in line.lower():
-                        current_experience['end_date'] = date_matches[0]
+        for future in as_completed(futures):
+            page_number = futures[future]
+            page_texts[page_number] = future.result()
+            self.page_sources[page_number] = "ocr"
+            on_page_done()
+    
+    def get_page_sources(self) -> Dict[str, Any]:
+        """
+        Caminho usado por página na última extração (text_layer ou ocr)
+        Armazenado em extracted_data para medir quanto OCR foi evitado
+        """
+        pages = [
+            {"page": page_number, "source": source}
+            for page_number, source in sorted(self.page_sources.items())
+        ]
+        return {
+            "pages": pages,
+            "text_layer_pages": sum(1 for p in pages if p["source"] == "text_layer"),
+            "ocr_pages": sum(1 for p in pages if p["source"] == "ocr"),
+            "skipped_pages": sum(1 for p in pages if p["source"] == "skipped")
+        }
+    
+    def extract_text(
+        self,
+        file_path: str,
+        file_type: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None
+    ) -> str:
+        """
+        Extrair texto de um arquivo (imagem ou PDF)
+        progress_callback(pages_done, pages_total) é chamado a cada página processada
+        first_page/last_page se aplicam apenas a PDFs
+        """
+        self._reset_run()
         
-        # Adicionar última experiência
-        if current_experience:
-            experiences.append(current_experience)
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(file_path, file_type, first_page, last_page)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback(1, 1)
+                return self._load_cached(cached)
         
-        # Calcular meses trabalhados
-        for exp in experiences:
-            if 'start_date' in exp:
-                try:
-                    start = self._parse_date(exp['start_date'])
-                    end = self._parse_date(exp.get('end_date', datetime.now().strftime('%d/%m/%Y')))
-                    
-                    if start and end:
-                        months = (end.year - start.year) * 12 + (end.month - start.month)
-                        exp['months_worked'] = max(0, months)
-                except Exception as e:
-                    print(f"Erro ao calcular meses: {e}")
-                    exp['months_worked'] = 0
+        if file_type == "pdf":
+            text = self.extract_text_from_pdf(
+                file_path,
+                progress_callback=progress_callback,
+                first_page=first_page,
+                last_page=last_page
+            )
+        else:
+            if progress_callback:
+                progress_callback(0, 1)
+            text = self.extract_text_from_image(file_path)
+            self.page_sources[1] = "ocr"
+            self.page_offsets = [[1, 0]]
+            if progress_callback:
+                progress_callback(1, 1)
         
-        return experiences
+        # Falhas (texto vazio) não são armazenadas
+        if cache_key and text:
+            self.cache.set(cache_key, json.dumps({
+                "text": text,
+                "page_sources": sorted(self.page_sources.items()),
+                "page_offsets": self.page_offsets,
+                "triage": self.get_triage_summary()
+            }))
+        return text
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parsear string de data para datetime"""
-        try:
-            # Tentar diferentes formatos
-            formats = ['%d/%m/%Y', '%d-%m-%Y', '%d/%m/%y', '%d-%m-%y']
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str.strip(), fmt)
-                except ValueError:
-                    continue
-            
-            # Tentar parser automático
-            return date_parser.parse(date_str, dayfirst=True)
-        except Exception:
+    def get_cached_text(
+        self,
+        file_path: str,
+        file_type: str,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None
+    ) -> Optional[str]:
+        """Buscar texto completo já extraído no cache, sem executar OCR (None se ausente)"""
+        if not self.cache:
+            return None
+        self._reset_run()
+        cached = self.cache.get(self._cache_key(file_path, file_type, first_page, last_page))
+        if cached is None:
             return None
+        return self._load_cached(cached)
+    
+    def _reset_run(self):
+        """Limpar metadados da extração anterior"""
+        self.page_sources = {}
+        self.page_offsets = []
+        self.triage_results = {}
+        self.triage_fallback = False
+    
+    def _load_cached(self, cached: str) -> str:
+        """Restaurar texto e origem das páginas a partir de uma entrada do cache"""
+        try:
+            data = json.loads(cached)
+        except ValueError:
+            # Entrada antiga: apenas o texto
+            return cached
+        if not isinstance(data, dict):
+            return cached
+        self.page_sources = {page: source for page, source in data.get("page_sources", [])}
+        self.page_offsets = data.get("page_offsets", [])
+        triage = data.get("triage")
+        if triage:
+            self.triage_results = {
+                item["page"]: {key: value for key, value in item.items() if key != "page"}
+                for item in triage["pages"]
+            }
+            self.triage_fallback = triage["fallback_full_ocr"]
+        return data.get("text", "")
+    
+    def _cache_key(
+        self,
+        file_path: str,
+        file_type: str,
+        first_page: Optional[int],
+        last_page: Optional[int]
+    ) -> str:
+        """Chave do cache: conteúdo do arquivo + engine, idioma, DPI e páginas"""
+        params = {
+            "engine": self.ocr_engine,
+            "lang": self.lang,
+            "preprocess": self.preprocessor.cache_signature()
+        }
+        if file_type == "pdf":
+            params.update(
+                dpi=self.dpi,
+                first_page=first_page,
+                last_page=last_page,
+                text_layer=settings.OCR_TEXT_LAYER_ENABLED,
+                # O limiar decide quais páginas passam pelo OCR
+                text_layer_min_chars=settings.OCR_TEXT_LAYER_MIN_CHARS,
+                triage=self.triage.cache_signature() if self.triage else None
+            )
+        return build_cache_key(hash_file(file_path), **params)
+    
+    def parse_work_experience(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Parsear experiências profissionais do texto extraído
+        Procura por padrões comuns em carteiras de trabalho (ver experience_parser)
+        """
+        return self.parser.parse(text)
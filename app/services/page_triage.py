@@ -0,0 +1,86 @@
+import re
+from typing import Any, Dict, Optional
+
+import numpy as np
+from PIL import Image
+
+from app.services.ocr_engines import OCREngine
+
+# Termos que indicam página com registro de contrato de trabalho
+CONTRACT_KEYWORDS = re.compile(
+    r"admiss|sa[ií]da|desligamento|\bcbo\b|cnpj|empregador|raz[aã]o social|"
+    r"cargo|fun[cç][aã]o|ocupa[cç][aã]o|data de entrada|remunera[cç][aã]o",
+    re.IGNORECASE
+)
+
+
+class PageTriage:
+    """
+    Triagem barata de páginas antes do OCR completo
+    Em uma versão de baixa resolução da página: descarta páginas em branco pela densidade
+    de tinta e, nas demais, faz um OCR rápido procurando termos de contrato de trabalho
+    """
+    
+    def __init__(
+        self,
+        dpi: int = 100,
+        min_ink_ratio: float = 0.003,
+        keyword_check: bool = True
+    ):
+        self.dpi = dpi
+        self.min_ink_ratio = min_ink_ratio
+        self.keyword_check = keyword_check
+    
+    @classmethod
+    def from_settings(cls, settings) -> Optional["PageTriage"]:
+        """Criar triagem a partir das configurações (None se desativada)"""
+        if not settings.OCR_TRIAGE_ENABLED:
+            return None
+        return cls(
+            dpi=settings.OCR_TRIAGE_DPI,
+            min_ink_ratio=settings.OCR_TRIAGE_MIN_INK_RATIO,
+            keyword_check=settings.OCR_TRIAGE_KEYWORD_CHECK
+        )
+    
+    def cache_signature(self) -> str:
+        """Identificador da configuração (entra na chave do cache de OCR)"""
+        return f"{self.dpi}/{self.min_ink_ratio}/{int(self.keyword_check)}"
+    
+    def evaluate(self, image: Image.Image, engine: OCREngine) -> Dict[str, Any]:
+        """
+        Decidir se a página (renderizada em baixa resolução) deve passar pelo OCR completo
+        
+        Returns:
+            Dict com decision (ocr, skip), reason e métricas da página
+        """
+        pixels = np.asarray(image.convert("L"))
+        ink_ratio = float((pixels < 128).mean())
+        result: Dict[str, Any] = {"ink_ratio": round(ink_ratio, 4)}
+        
+        if ink_ratio < self.min_ink_ratio:
+            return {**result, "decision": "skip", "reason": "blank"}
+        
+        if not self.keyword_check:
+            return {**result, "decision": "ocr", "reason": "ink"}
+        
+        text = engine.image_to_string(image)
+        keywords = sorted({match.lower() for match in CONTRACT_KEYWORDS.findall(text)})
+        if keywords:
+            return {**result, "decision": "ocr", "reason": "keywords", "keywords": keywords}
+        return {**result, "decision": "skip", "reason": "no_keywords"}
+
+
+def summarize_triage(results: Dict[int, Dict[str, Any]], fallback: bool = False) -> Dict[str, Any]:
+    """Estatísticas da triagem para o resultado do job"""
+    skipped_by_reason: Dict[str, int] = {}
+    for result in results.values():
+        if result["decision"] == "skip":
+            skipped_by_reason[result["reason"]] = skipped_by_reason.get(result["reason"], 0) + 1
+    
+    return {
+        "pages_evaluated": len(results),
+        "pages_skipped": 0 if fallback else sum(skipped_by_reason.values()),
+        "skipped_by_reason": {} if fallback else skipped_by_reason,
+        "fallback_full_ocr": fallback,
+        "pages": [{"page": page, **result} for page, result in sorted(results.items())]
+    }
@@ -0,0 +1,91 @@
+import base64
+import binascii
+import json
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+def encode_cursor(last_id: int, filters: Optional[Dict[str, Any]] = None) -> str:
+    """Cursor opaco da próxima página: último ID entregue e filtros da listagem"""
+    payload = json.dumps({"after": last_id, "filters": filters or {}}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], filters: Optional[Dict[str, Any]] = None) -> Optional[int]:
+    """
+    ID a partir do qual continuar a listagem (None sem cursor)
+    ValueError se o cursor for inválido ou tiver sido gerado com outros filtros
+    """
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor de paginação inválido")
+    if not isinstance(payload, dict) or not isinstance(payload.get("after"), int):
+        raise ValueError("Cursor de paginação inválido")
+    if payload.get("filters") != (filters or {}):
+        raise ValueError("Cursor de paginação gerado com outros filtros")
+    return payload["after"]
+
+
+def keyset_page(items: List[Any], limit: int, filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Any], Optional[str]]:
+    """
+    Recortar a página a partir de limit + 1 itens buscados
+    Retorna os itens e o cursor da próxima página (None na última)
+    """
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(items[-1].id, filters)
+
+
+class TotalCountCache:
+    """
+    Totais das listagens por recurso e filtros, válidos por LIST_TOTAL_CACHE_SECONDS
+    Escritas neste processo invalidam o recurso; em outros processos o total
+    fica defasado no máximo pelo tempo de validade
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        # Incrementada a cada invalidação: contagem iniciada antes dela não é guardada
+        self._generations: Dict[str, int] = {}
+    
+    @staticmethod
+    def _key(resource: str, filters: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        return resource, json.dumps(filters or {}, sort_keys=True)
+    
+    async def get_or_count(
+        self,
+        resource: str,
+        filters: Optional[Dict[str, Any]],
+        count: Callable[[], Awaitable[int]]
+    ) -> int:
+        """Total em cache ou, se expirado, contado de novo"""
+        key = self._key(resource, filters)
+        with self._lock:
+            cached = self._totals.get(key)
+            generation = self._generations.get(resource, 0)
+        if cached and time.monotonic() - cached[0] < settings.LIST_TOTAL_CACHE_SECONDS:
+            return cached[1]
+        total = await count()
+        with self._lock:
+            if self._generations.get(resource, 0) == generation:
+                self._totals[key] = (time.monotonic(), total)
+        return total
+    
+    def invalidate(self, resource: str):
+        """Descartar os totais do recurso (todas as combinações de filtros)"""
+        with self._lock:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+            for key in [key for key in self._totals if key[0] == resource]:
+                del self._totals[key]
+
+
+# Instância global (compartilhada pelas rotas)
+total_count_cache = TotalCountCache()
@@ -0,0 +1,75 @@
+from typing import Iterator, List, Optional, Tuple
+from PIL import Image
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+
+def get_page_count(pdf_path: str) -> int:
+    """Obter número de páginas de um PDF sem rasterizá-lo"""
+    return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+
+def resolve_page_range(
+    page_count: int,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Normalizar intervalo de páginas (1-indexado, inclusivo) para os limites do documento
+    """
+    first = max(1, first_page or 1)
+    last = min(page_count, last_page or page_count)
+    if first > last:
+        raise ValueError(
+            f"Intervalo de páginas inválido: {first_page}-{last_page} (documento possui {page_count} páginas)"
+        )
+    return first, last
+
+
+def iter_pdf_pages(
+    pdf_path: str,
+    dpi: int = 300,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+    window: int = 1,
+    page_count: Optional[int] = None
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Rasterizar um PDF em streaming, uma janela de páginas por vez
+    O pico de memória depende do tamanho da janela, não do número de páginas
+    
+    Yields:
+        (número da página, imagem PIL)
+    """
+    if page_count is None:
+        page_count = get_page_count(pdf_path)
+    first, last = resolve_page_range(page_count, first_page, last_page)
+    yield from iter_pdf_page_list(pdf_path, list(range(first, last + 1)), dpi=dpi, window=window)
+
+
+def iter_pdf_page_list(
+    pdf_path: str,
+    page_numbers: List[int],
+    dpi: int = 300,
+    window: int = 1
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Rasterizar em streaming apenas as páginas informadas
+    Páginas consecutivas são agrupadas em janelas de até `window` páginas
+    """
+    window = max(1, window)
+    run: List[int] = []
+    for page_number in sorted(page_numbers):
+        if run and (page_number != run[-1] + 1 or len(run) >= window):
+            yield from _rasterize_run(pdf_path, run, dpi)
+            run = []
+        run.append(page_number)
+    if run:
+        yield from _rasterize_run(pdf_path, run, dpi)
+
+
+def _rasterize_run(pdf_path: str, run: List[int], dpi: int) -> Iterator[Tuple[int, Image.Image]]:
+    """Rasterizar uma sequência de páginas consecutivas e liberá-la em seguida"""
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=run[0], last_page=run[-1])
+    for page_number, image in zip(run, images):
+        yield page_number, image
+    del images
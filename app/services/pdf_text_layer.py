@@ -0,0 +1,30 @@
+import subprocess
+from typing import List
+
+
+def extract_text_layer(pdf_path: str, first_page: int, last_page: int, timeout: int = 60) -> List[str]:
+    """
+    Ler a camada de texto embutida de um intervalo de páginas (pdftotext / poppler)
+    Uma única chamada para todo o intervalo; as páginas vêm separadas por form feed
+    
+    Returns:
+        Lista com o texto de cada página (vazio para páginas só com imagem)
+    """
+    result = subprocess.run(
+        ["pdftotext", "-f", str(first_page), "-l", str(last_page), "-enc", "UTF-8", pdf_path, "-"],
+        capture_output=True,
+        timeout=timeout,
+        check=True
+    )
+    pages = result.stdout.decode("utf-8", errors="replace").split("\f")
+    
+    page_count = last_page - first_page + 1
+    # pdftotext termina cada página com \f, gerando um item vazio no final
+    pages = pages[:page_count]
+    pages += [""] * (page_count - len(pages))
+    return pages
+
+
+def has_text_layer(text: str, min_chars: int) -> bool:
+    """Verificar se o texto de uma página tem conteúdo suficiente para dispensar o OCR"""
+    return sum(1 for char in text if char.isalnum()) >= min_chars
@@ -0,0 +1,187 @@
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Tamanhos dos n-gramas de caracteres (por palavra, com as bordas marcadas)
+NGRAM_SIZES = (2, 3)
+# Cargo contido no aceito (ou vice-versa) vale no mínimo esta similaridade
+CONTAINMENT_SIMILARITY = 0.85
+# Cursos com matcher compilado mantidos em memória
+MATCHER_CACHE_SIZE = 4096
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Códigos CBO: família com 4 dígitos, ocupação com 6 (ex.: 3171-10); tabela antiga com 5
+CBO_CODE_LENGTHS = range(4, 7)
+
+
+def normalize_cbo_code(value: Optional[str]) -> Optional[str]:
+    """Código CBO somente com dígitos ("3171-10" → "317110"), None se não parecer um código"""
+    if not value:
+        return None
+    digits = "".join(c for c in value if c.isdigit())
+    return digits if len(digits) in CBO_CODE_LENGTHS else None
+
+
+def fold_text(text: str) -> str:
+    """Normalizar texto para comparação: sem acentos, minúsculo, só letras e dígitos"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_TOKEN_PATTERN.findall(without_accents.lower()))
+
+
+def char_ngrams(folded: str, sizes: Sequence[int] = NGRAM_SIZES) -> Counter:
+    """Contagem de n-gramas de caracteres de cada palavra (" tecnico " → " t", "te", ...)"""
+    grams = Counter()
+    for token in folded.split():
+        padded = f" {token} "
+        for size in sizes:
+            grams.update(padded[i:i + size] for i in range(len(padded) - size + 1))
+    return grams
+
+
+class CBOCodeIndex:
+    """
+    Índice dos códigos CBO aceitos por um curso
+    Códigos completos e prefixos (família, subgrupo...) ficam num conjunto; um código
+    extraído é testado por cada um dos seus prefixos (no máximo 6 consultas de hash)
+    """
+    
+    def __init__(self, accepted_codes: Sequence[str]):
+        self.codes = frozenset(code for code in accepted_codes if code)
+        self.prefix_lengths = sorted({len(code) for code in self.codes}, reverse=True)
+    
+    def __bool__(self) -> bool:
+        return bool(self.codes)
+    
+    def lookup(self, code: str) -> Optional[str]:
+        """Código ou prefixo aceito mais específico que cobre o código (None se nenhum)"""
+        for length in self.prefix_lengths:
+            if length <= len(code) and code[:length] in self.codes:
+                return code[:length]
+        return None
+
+
+class PositionMatcher:
+    """
+    Matcher compilado dos cargos aceitos de um curso
+    Cada cargo vira um vetor normalizado de n-gramas de caracteres (sem acentos);
+    um cargo extraído é comparado com todos os aceitos numa única multiplicação
+    (similaridade de cosseno)
+    """
+    
+    def __init__(self, accepted_positions: Sequence[str], accepted_cbo_codes: Sequence[str] = ()):
+        self.cbo_index = CBOCodeIndex(accepted_cbo_codes)
+        self.accepted_positions: List[str] = [p for p in accepted_positions if p]
+        self.folded_positions: List[str] = [fold_text(p) for p in self.accepted_positions]
+        
+        self.vocabulary: Dict[str, int] = {}
+        rows: List[Counter] = []
+        for folded in self.folded_positions:
+            grams = char_ngrams(folded)
+            for gram in grams:
+                self.vocabulary.setdefault(gram, len(self.vocabulary))
+            rows.append(grams)
+        
+        # (cargos aceitos x vocabulário), linhas com norma 1
+        self.matrix = np.zeros((len(rows), len(self.vocabulary)), dtype=np.float32)
+        for row, grams in enumerate(rows):
+            for gram, count in grams.items():
+                self.matrix[row, self.vocabulary[gram]] = count
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self.matrix /= np.where(norms > 0, norms, 1)
+    
+    def scores(self, position: str) -> np.ndarray:
+        """Similaridade do cargo com cada um dos cargos aceitos"""
+        folded = fold_text(position)
+        similarities = np.zeros(len(self.accepted_positions), dtype=np.float32)
+        grams = char_ngrams(folded)
+        if not grams or not self.vocabulary:
+            return similarities
+        
+        query = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for gram, count in grams.items():
+            column = self.vocabulary.get(gram)
+            if column is not None:
+                query[column] = count
+        # A norma inclui n-gramas fora do vocabulário (penalizam a similaridade)
+        query_norm = np.sqrt(sum(count * count for count in grams.values()))
+        similarities = self.matrix @ query / query_norm
+        
+        # Cargo contido no aceito (ou vice-versa)
+        contained = np.fromiter(
+            (bool(accepted) and (accepted in folded or folded in accepted) for accepted in self.folded_positions),
+            dtype=bool,
+            count=len(self.folded_positions)
+        )
+        return np.where(contained, np.maximum(similarities, CONTAINMENT_SIMILARITY), similarities)
+    
+    def match_code(self, cbo_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Casamento exato do código CBO extraído com os códigos aceitos
+        
+        Returns:
+            {"matched_position", "similarity", "matched_cbo_code"} ou None se não aceito
+        """
+        matched_code = self.cbo_index.lookup(cbo_code)
+        if matched_code is None:
+            return None
+        return {
+            "matched_position": f"CBO {matched_code}",
+            "similarity": 1.0,
+            "matched_cbo_code": matched_code
+        }
+    
+    def match(self, position: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Melhor cargo aceito para o cargo extraído
+        
+        Returns:
+            {"matched_position", "similarity"} ou None se nenhum for minimamente similar
+        """
+        if not position or not self.accepted_positions:
+            return None
+        
+        similarities = self.scores(position)
+        best = int(np.argmax(similarities))
+        best_similarity = float(similarities[best])
+        if best_similarity <= 0:
+            return None
+        
+        return {
+            "matched_position": self.accepted_positions[best],
+            "similarity": round(min(best_similarity, 1.0), 4)
+        }
+
+
+_matchers: "OrderedDict[Hashable, Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], PositionMatcher]]" = OrderedDict()
+_matchers_lock = threading.Lock()
+
+
+def get_position_matcher(
+    course_id: Hashable,
+    accepted_positions: Optional[Sequence[str]],
+    accepted_cbo_codes: Optional[Sequence[str]] = None
+) -> PositionMatcher:
+    """
+    Obter o matcher compilado de um curso
+    Reconstruído apenas quando os cargos ou códigos CBO aceitos do curso mudam
+    """
+    fingerprint = (tuple(accepted_positions or ()), tuple(accepted_cbo_codes or ()))
+    with _matchers_lock:
+        cached = _matchers.get(course_id)
+        if cached and cached[0] == fingerprint:
+            _matchers.move_to_end(course_id)
+            return cached[1]
+    
+    matcher = PositionMatcher(*fingerprint)
+    with _matchers_lock:
+        _matchers[course_id] = (fingerprint, matcher)
+        _matchers.move_to_end(course_id)
+        while len(_matchers) > MATCHER_CACHE_SIZE:
+            _matchers.popitem(last=False)
+    return matcher
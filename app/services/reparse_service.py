@@ -0,0 +1,195 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import func, or_
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import DocumentExtraction, DocumentText
+from app.repositories import DocumentRepository
+from app.services.experience_parser import get_experience_parser
+from app.services.job_service import Job
+from app.services.ocr_service import get_process_pool, process_pool_size
+from app.services.text_storage import compress_text, decompress_text
+
+# Documentos lidos e regravados por transação
+REPARSE_CHUNK_SIZE = 500
+# Metadados da extração original preservados nas novas (não vêm do parser)
+PRESERVED_FIELDS = ("page_sources", "extraction_mode", "triage")
+
+
+def _reparse_text(args: Tuple[Optional[str], Union[bytes, str], str]) -> List[Dict[str, Any]]:
+    """
+    Parsear o texto de um documento (executado no pool de processos)
+    Recebe o texto comprimido (codec, bytes) ou, em extrações antigas, o texto puro (None, str)
+    """
+    codec, text, parser_version = args
+    if codec:
+        text = decompress_text(codec, text)
+    return get_experience_parser(parser_version).parse(text)
+
+
+class ReparseService:
+    """
+    Reprocessamento em massa das extrações a partir do texto já armazenado (sem OCR)
+    Lê o texto completo (comprimido) por lotes de documentos, parseia no pool de processos
+    compartilhado com o OCR (spawn, tamanho OCR_PROCESS_WORKERS): o paralelismo é o do pool,
+    disputado com os jobs de OCR em andamento
+    e substitui as extrações de cada documento numa transação (savepoint) própria;
+    documentos antigos, com o texto repetido nas extrações, passam a tê-lo em DocumentText
+    """
+    
+    def __init__(
+        self,
+        parser_version: Optional[str] = None,
+        chunk_size: int = REPARSE_CHUNK_SIZE,
+        use_process_pool: bool = True,
+        force: bool = False
+    ):
+        # Valida a versão (ValueError se desconhecida)
+        self.parser_version = get_experience_parser(parser_version or settings.EXPERIENCE_PARSER_VERSION).version
+        self.chunk_size = chunk_size
+        # False (ou pool de um processo só): parsear no próprio processo
+        self.use_process_pool = use_process_pool and process_pool_size() > 1
+        # force: reprocessar também documentos já extraídos com esta versão
+        self.force = force
+    
+    def run(self, job: Optional[Job] = None) -> Dict[str, Any]:
+        """
+        Reprocessar todos os documentos pendentes
+        
+        Returns:
+            Estatísticas: documentos processados, atualizados, sem experiências, com erro
+        """
+        stats = {
+            "parser_version": self.parser_version,
+            "documents_total": 0,
+            "documents_processed": 0,
+            "documents_updated": 0,
+            "documents_empty": 0,
+            "documents_failed": 0,
+            "extractions_written": 0
+        }
+        pool = get_process_pool() if self.use_process_pool else None
+        db = SessionLocal()
+        try:
+            repo = DocumentRepository(db)
+            stats["documents_total"] = self._pending_query(db, DocumentExtraction.document_id).distinct().count()
+            if job:
+                job.result = stats
+                job.update_progress(0, stats["documents_total"])
+            
+            last_document_id = 0
+            while True:
+                rows = self._next_chunk(db, last_document_id)
+                if not rows:
+                    break
+                last_document_id = rows[-1].document_id
+                
+                args = [
+                    (row.codec, row.compressed_text, self.parser_version) if row.codec
+                    else (None, row.raw_text or "", self.parser_version)
+                    for row in rows
+                ]
+                if pool:
+                    parsed = list(pool.map(_reparse_text, args, chunksize=max(1, len(args) // (process_pool_size() * 4))))
+                else:
+                    parsed = [_reparse_text(arg) for arg in args]
+                
+                for row, experiences in zip(rows, parsed):
+                    stats["documents_processed"] += 1
+                    if not experiences:
+                        # Manter as extrações atuais: nova versão não encontrou nada
+                        stats["documents_empty"] += 1
+                        continue
+                    
+                    preserved = {
+                        field: (row.extracted_data or {}).get(field)
+                        for field in PRESERVED_FIELDS
+                        if (row.extracted_data or {}).get(field) is not None
+                    }
+                    for exp in experiences:
+                        exp.update(preserved)
+                    
+                    try:
+                        with db.begin_nested():
+                            if not row.codec:
+                                # Texto ainda nas extrações antigas: gravar uma vez, comprimido
+                                codec, compressed_text = compress_text(row.raw_text)
+                                repo.save_document_text(
+                                    row.document_id,
+                                    codec,
+                                    compressed_text,
+                                    len(row.raw_text.encode("utf-8")),
+                                    None,
+                                    commit=False
+                                )
+                            repo.replace_extractions(
+                                row.document_id,
+                                experiences,
+                                self.parser_version,
+                                commit=False
+                            )
+                    except SQLAlchemyError as e:
+                        print(f"Erro ao reprocessar documento {row.document_id}: {e}")
+                        stats["documents_failed"] += 1
+                        continue
+                    stats["documents_updated"] += 1
+                    stats["extractions_written"] += len(experiences)
+                
+                db.commit()
+                # Objetos do lote não são mais necessários
+                db.expunge_all()
+                if job:
+                    job.update_progress(stats["documents_processed"], stats["documents_total"])
+            
+            return stats
+        finally:
+            db.close()
+    
+    def _pending_query(self, db, *columns):
+        """
+        Extrações que precisam ser reprocessadas (de outra versão do parser, ou todas com force)
+        e cujo documento tem texto armazenado (em DocumentText ou, se antigo, na própria extração)
+        """
+        query = db.query(*columns).outerjoin(
+            DocumentText,
+            DocumentText.document_id == DocumentExtraction.document_id
+        ).filter(or_(
+            DocumentText.document_id.isnot(None),
+            DocumentExtraction.raw_text.isnot(None)
+        ))
+        if not self.force:
+            query = query.filter(or_(
+                DocumentExtraction.parser_version.is_(None),
+                DocumentExtraction.parser_version != self.parser_version
+            ))
+        return query
+    
+    def _next_chunk(self, db, after_document_id: int):
+        """Próximo lote de documentos (paginação por document_id): texto e metadados de uma extração de cada"""
+        first_ids = self._pending_query(
+            db,
+            func.min(DocumentExtraction.id)
+        ).filter(
+            DocumentExtraction.document_id > after_document_id
+        ).group_by(
+            DocumentExtraction.document_id
+        ).order_by(
+            DocumentExtraction.document_id
+        ).limit(self.chunk_size).all()
+        if not first_ids:
+            return []
+        
+        return db.query(
+            DocumentExtraction.document_id,
+            DocumentExtraction.raw_text,
+            DocumentExtraction.extracted_data,
+            DocumentText.codec,
+            DocumentText.compressed_text
+        ).outerjoin(
+            DocumentText,
+            DocumentText.document_id == DocumentExtraction.document_id
+        ).filter(
+            DocumentExtraction.id.in_([row[0] for row in first_ids])
+        ).order_by(DocumentExtraction.document_id).all()
@@ -1,9 +1,141 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from app.models import Document, DocumentExtraction, Validation, Course
 
 
+def _document_report(
+    document: Document,
+    extractions: List[DocumentExtraction],
+    validations: List[Validation]
+) -> Dict[str, Any]:
+    """Montar o relatório do documento a partir dos dados já carregados"""
+    # Calcular estatísticas
+    total_months = sum(e.months_worked or 0 for e in extractions)
+    approved_validations = [v for v in validations if v.status == "approved"]
+    rejected_validations = [v for v in validations if v.status == "rejected"]
+    manual_review_validations = [v for v in validations if v.status == "manual_review"]
+    
+    # Montar relatório
+    report = {
+        "document": {
+            "id": document.id,
+            "filename": document.filename,
+            "file_type": document.file_type,
+            "uploaded_at": document.uploaded_at.isoformat()
+        },
+        "extractions": [
+            {
+                "id": e.id,
+                "company_name": e.company_name,
+                "position": e.position,
+                "start_date": e.start_date,
+                "end_date": e.end_date,
+                "months_worked": e.months_worked,
+                "extracted_at": e.extracted_at.isoformat()
+            }
+            for e in extractions
+        ],
+        "validations": [
+            {
+                "id": v.id,
+                "course_id": v.course_id,
+                "course_name": v.course.name if v.course else None,
+                "status": v.status,
+                "required_months": v.required_months,
+                "found_months": v.found_months,
+                "position_match": v.position_match,
+                "validation_details": v.validation_details,
+                "validated_at": v.validated_at.isoformat()
+            }
+            for v in validations
+        ],
+        "summary": {
+            "total_experiences": len(extractions),
+            "total_months_worked": total_months,
+            "total_validations": len(validations),
+            "approved_validations": len(approved_validations),
+            "rejected_validations": len(rejected_validations),
+            "manual_review_validations": len(manual_review_validations),
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    }
+    
+    return report
+
+
+def _validation_summary(
+    validation: Validation,
+    extraction: Optional[DocumentExtraction]
+) -> Dict[str, Any]:
+    """Montar o resumo da validação (documento e curso já carregados)"""
+    document = validation.document
+    course = validation.course
+    summary = {
+        "validation_id": validation.id,
+        "status": validation.status,
+        "document": {
+            "id": document.id,
+            "filename": document.filename
+        },
+        "course": {
+            "id": course.id,
+            "name": course.name,
+            "code": course.code,
+            "minimum_months": course.minimum_months,
+            "accepted_positions": course.accepted_positions
+        },
+        "experience": {
+            "company_name": extraction.company_name if extraction else None,
+            "position": extraction.position if extraction else None,
+            "months_worked": extraction.months_worked if extraction else None
+        },
+        "validation_result": {
+            "required_months": validation.required_months,
+            "found_months": validation.found_months,
+            "position_match": validation.position_match,
+            "details": validation.validation_details
+        },
+        "validated_at": validation.validated_at.isoformat()
+    }
+    
+    return summary
+
+
+def _course_statistics(course: Course, status_counts: Dict[str, int]) -> Dict[str, Any]:
+    """Montar as estatísticas de validações do curso a partir da contagem por status"""
+    total = sum(status_counts.values())
+    approved = status_counts.get("approved", 0)
+    
+    statistics = {
+        "course": {
+            "id": course.id,
+            "name": course.name,
+            "code": course.code,
+            "minimum_months": course.minimum_months
+        },
+        "validations": {
+            "total": total,
+            "approved": approved,
+            "rejected": status_counts.get("rejected", 0),
+            "manual_review": status_counts.get("manual_review", 0),
+            "approval_rate": approved / total * 100 if total else 0
+        },
+        "generated_at": datetime.utcnow().isoformat()
+    }
+    
+    return statistics
+
+
+def _status_counts_query(course_id: int):
+    """Contagem de validações do curso por status (agregada no banco, índice ix_validations_course_status)"""
+    return select(Validation.status, func.count()).where(
+        Validation.course_id == course_id
+    ).group_by(Validation.status)
+
+
 class ReportService:
     """Serviço para geração de relatórios"""
     
@@ -30,58 +162,7 @@ class ReportService:
             Validation.document_id == document_id
         ).all()
         
-        # Calcular estatísticas
-        total_months = sum(e.months_worked or 0 for e in extractions)
-        approved_validations = [v for v in validations if v.status == "approved"]
-        rejected_validations = [v for v in validations if v.status == "rejected"]
-        manual_review_validations = [v for v in validations if v.status == "manual_review"]
-        
-        # Montar relatório
-        report = {
-            "document": {
-                "id": document.id,
-                "filename": document.filename,
-                "file_type": document.file_type,
-                "uploaded_at": document.uploaded_at.isoformat()
-            },
-            "extractions": [
-                {
-                    "id": e.id,
-                    "company_name": e.company_name,
-                    "position": e.position,
-                    "start_date": e.start_date,
-                    "end_date": e.end_date,
-                    "months_worked": e.months_worked,
-                    "extracted_at": e.extracted_at.isoformat()
-                }
-                for e in extractions
-            ],
-            "validations": [
-                {
-                    "id": v.id,
-                    "course_id": v.course_id,
-                    "course_name": v.course.name if v.course else None,
-                    "status": v.status,
-                    "required_months": v.required_months,
-                    "found_months": v.found_months,
-                    "position_match": v.position_match,
-                    "validation_details": v.validation_details,
-                    "validated_at": v.validated_at.isoformat()
-                }
-                for v in validations
-            ],
-            "summary": {
-                "total_experiences": len(extractions),
-                "total_months_worked": total_months,
-                "total_validations": len(validations),
-                "approved_validations": len(approved_validations),
-                "rejected_validations": len(rejected_validations),
-                "manual_review_validations": len(manual_review_validations),
-                "generated_at": datetime.utcnow().isoformat()
-            }
-        }
-        
-        return report
+        return _document_report(document, extractions, validations)
     
     def generate_validation_summary(
         self,
@@ -96,41 +177,11 @@ class ReportService:
             return {"error": "Validação não encontrada"}
         
         # Buscar informações relacionadas
-        document = validation.document
-        course = validation.course
         extraction = db.query(DocumentExtraction).filter(
-            DocumentExtraction.document_id == document.id
+            DocumentExtraction.document_id == validation.document_id
         ).first()
         
-        summary = {
-            "validation_id": validation.id,
-            "status": validation.status,
-            "document": {
-                "id": document.id,
-                "filename": document.filename
-            },
-            "course": {
-                "id": course.id,
-                "name": course.name,
-                "code": course.code,
-                "minimum_months": course.minimum_months,
-                "accepted_positions": course.accepted_positions
-            },
-            "experience": {
-                "company_name": extraction.company_name if extraction else None,
-                "position": extraction.position if extraction else None,
-                "months_worked": extraction.months_worked if extraction else None
-            },
-            "validation_result": {
-                "required_months": validation.required_months,
-                "found_months": validation.found_months,
-                "position_match": validation.position_match,
-                "details": validation.validation_details
-            },
-            "validated_at": validation.validated_at.isoformat()
-        }
-        
-        return summary
+        return _validation_summary(validation, extraction)
     
     def generate_course_statistics(
         self,
@@ -144,27 +195,76 @@ class ReportService:
         if not course:
             return {"error": "Curso não encontrado"}
         
-        validations = db.query(Validation).filter(Validation.course_id == course_id).all()
+        status_counts = dict(db.execute(_status_counts_query(course_id)).all())
+        
+        return _course_statistics(course, status_counts)
+
+
+class AsyncReportService:
+    """
+    Versão assíncrona do ReportService (usada pelas rotas)
+    Relacionamentos usados nos relatórios são carregados junto (sem lazy load no event loop)
+    """
+    
+    async def generate_document_report(
+        self,
+        document_id: int,
+        db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Gerar relatório completo de um documento
+        """
+        document = await db.get(Document, document_id)
+        if not document:
+            return {"error": "Documento não encontrado"}
+        
+        extractions = await db.scalars(
+            select(DocumentExtraction).where(DocumentExtraction.document_id == document_id)
+        )
+        validations = await db.scalars(
+            select(Validation).where(
+                Validation.document_id == document_id
+            ).options(selectinload(Validation.course))
+        )
         
-        approved = [v for v in validations if v.status == "approved"]
-        rejected = [v for v in validations if v.status == "rejected"]
-        manual_review = [v for v in validations if v.status == "manual_review"]
+        return _document_report(document, list(extractions), list(validations))
+    
+    async def generate_validation_summary(
+        self,
+        validation_id: int,
+        db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Gerar resumo de uma validação específica
+        """
+        validation = await db.scalar(
+            select(Validation).where(
+                Validation.id == validation_id
+            ).options(selectinload(Validation.document), selectinload(Validation.course))
+        )
+        if not validation:
+            return {"error": "Validação não encontrada"}
         
-        statistics = {
-            "course": {
-                "id": course.id,
-                "name": course.name,
-                "code": course.code,
-                "minimum_months": course.minimum_months
-            },
-            "validations": {
-                "total": len(validations),
-                "approved": len(approved),
-                "rejected": len(rejected),
-                "manual_review": len(manual_review),
-                "approval_rate": len(approved) / len(validations) * 100 if validations else 0
-            },
-            "generated_at": datetime.utcnow().isoformat()
-        }
+        extraction = await db.scalar(
+            select(DocumentExtraction).where(
+                DocumentExtraction.document_id == validation.document_id
+            ).limit(1)
+        )
+        
+        return _validation_summary(validation, extraction)
+    
+    async def generate_course_statistics(
+        self,
+        course_id: int,
+        db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Gerar estatísticas de validações de um curso
+        """
+        course = await db.get(Course, course_id)
+        if not course:
+            return {"error": "Curso não encontrado"}
+        
+        status_counts = dict((await db.execute(_status_counts_query(course_id))).all())
         
-        return statistics
+        return _course_statistics(course, status_counts)
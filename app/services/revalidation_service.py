@@ -0,0 +1,163 @@
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories import DocumentRepository, CourseRepository
+from app.services.job_service import Job
+from app.services.validation_service import ValidationService
+
+# Campos que definem o resultado de uma validação
+OUTCOME_FIELDS = ("status", "required_months", "found_months", "position_match")
+
+
+class RevalidationService:
+    """
+    Revalidação em background dos documentos já validados para um curso alterado
+    Processa a validação mais recente de cada documento em lotes, com pausa entre eles;
+    só regrava as validações cujo resultado mudou (as demais ficam como estão)
+    """
+    
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        throttle_seconds: Optional[float] = None
+    ):
+        self.chunk_size = chunk_size or settings.REVALIDATION_CHUNK_SIZE
+        self.throttle_seconds = (
+            settings.REVALIDATION_THROTTLE_SECONDS if throttle_seconds is None else throttle_seconds
+        )
+        self.validation_service = ValidationService()
+    
+    def run(self, job: Job, course_id: int) -> Dict[str, Any]:
+        """
+        Revalidar os documentos do curso
+        
+        Returns:
+            Estatísticas: documentos processados, alterados, inalterados, já atualizados, sem extração
+        """
+        stats = {
+            "course_id": course_id,
+            "documents_total": 0,
+            "documents_processed": 0,
+            "changed": 0,
+            "unchanged": 0,
+            "up_to_date": 0,
+            "without_extractions": 0,
+            "failed": 0
+        }
+        job.result = stats
+        db = SessionLocal()
+        try:
+            course = CourseRepository(db).get_course(course_id)
+            if not course:
+                raise ValueError("Curso não encontrado")
+            stats["course_revision"] = course.revision
+            
+            repo = DocumentRepository(db)
+            stats["documents_total"] = repo.count_validated_documents(course_id)
+            job.update_progress(0, stats["documents_total"])
+            
+            last_document_id = 0
+            while True:
+                validations = repo.get_latest_validations_for_course(
+                    course_id,
+                    after_document_id=last_document_id,
+                    limit=self.chunk_size
+                )
+                if not validations:
+                    break
+                
+                chunk_stats = self._revalidate_chunk(repo, course, validations)
+                if chunk_stats is None:
+                    # Validação criada durante a revalidação: reler o lote (ela passa a ser a mais recente)
+                    validations = repo.get_latest_validations_for_course(
+                        course_id,
+                        after_document_id=last_document_id,
+                        limit=len(validations)
+                    )
+                    if not validations:
+                        break
+                    chunk_stats = self._revalidate_chunk(repo, course, validations)
+                if chunk_stats is None:
+                    chunk_stats = Counter(failed=len(validations))
+                stats.update({key: stats[key] + count for key, count in chunk_stats.items()})
+                
+                last_document_id = validations[-1].document_id
+                stats["documents_processed"] += len(validations)
+                job.update_progress(stats["documents_processed"], stats["documents_total"])
+                
+                if self.throttle_seconds:
+                    time.sleep(self.throttle_seconds)
+            
+            return stats
+        finally:
+            db.close()
+    
+    def _revalidate_chunk(self, repo: DocumentRepository, course, validations) -> Optional[Counter]:
+        """
+        Recalcular um lote e gravar as alterações numa transação
+        Retorna a contagem do lote, ou None se outra validação com a chave atual foi gravada no meio
+        """
+        stats = Counter()
+        extractions_by_document = repo.get_extractions_by_documents(
+            [validation.document_id for validation in validations]
+        )
+        
+        pending = {}
+        for validation in validations:
+            extractions = extractions_by_document[validation.document_id]
+            if not extractions:
+                stats["without_extractions"] += 1
+                continue
+            
+            input_hash = self.validation_service.input_hash(extractions, course)
+            if validation.input_hash == input_hash:
+                stats["up_to_date"] += 1
+                continue
+            pending[validation.document_id] = (validation, input_hash)
+        
+        # Mesma regra da validação individual, com a união dos períodos calculada para o lote todo
+        results = self.validation_service.validate_documents(
+            {document_id: extractions_by_document[document_id] for document_id in pending},
+            course
+        )
+        
+        rewritten = []
+        unchanged = 0
+        for document_id, result in results.items():
+            validation, input_hash = pending[document_id]
+            new_outcome = {
+                "status": result["status"],
+                "required_months": result["required_months"],
+                "found_months": result["found_months"],
+                "position_match": result.get("position_match")
+            }
+            if all(getattr(validation, field) == new_outcome[field] for field in OUTCOME_FIELDS):
+                # Mesmo resultado: não regravar só para trocar a chave
+                unchanged += 1
+            else:
+                rewritten.append({
+                    "id": validation.id,
+                    **new_outcome,
+                    "validation_details": result.get("details"),
+                    "input_hash": input_hash,
+                    "validated_at": datetime.utcnow()
+                })
+        
+        try:
+            repo.bulk_update_validations(rewritten, commit=False)
+            repo.db.commit()
+        except IntegrityError as e:
+            # Outra validação do documento já tem a chave atual (criada durante a revalidação)
+            repo.db.rollback()
+            print(f"Erro ao revalidar lote do curso {course.id}: {e}")
+            return None
+        
+        stats["changed"] += len(rewritten)
+        stats["unchanged"] += unchanged
+        return stats
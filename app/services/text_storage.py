@@ -0,0 +1,72 @@
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Separador entre as páginas no texto completo do documento
+PAGE_SEPARATOR = "\n\n"
+
+# Nível de compressão (texto de OCR comprime bem já em níveis médios)
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+try:
+    import zstandard
+except ImportError:  # dependência opcional
+    zstandard = None
+
+
+def join_pages(pages: Iterable[Tuple[int, str]]) -> Tuple[str, List[List[int]]]:
+    """
+    Juntar os textos das páginas no texto completo do documento
+    Retorna o texto e o início de cada página nele ([[página, offset], ...])
+    """
+    parts: List[str] = []
+    offsets: List[List[int]] = []
+    position = 0
+    for page_number, text in pages:
+        if parts:
+            position += len(PAGE_SEPARATOR)
+        offsets.append([page_number, position])
+        parts.append(text)
+        position += len(text)
+    return PAGE_SEPARATOR.join(parts), offsets
+
+
+def page_text(text: str, page_offsets: List[List[int]], page_number: int) -> Optional[str]:
+    """Texto de uma página a partir dos offsets (None se a página não estiver no texto)"""
+    for index, (number, start) in enumerate(page_offsets):
+        if number == page_number:
+            end = page_offsets[index + 1][1] - len(PAGE_SEPARATOR) if index + 1 < len(page_offsets) else len(text)
+            return text[start:end]
+    return None
+
+
+def resolve_codec(codec: Optional[str] = None) -> str:
+    """Codec de compressão configurado; zstd sem o pacote zstandard instalado usa zlib"""
+    codec = codec or settings.RAW_TEXT_CODEC
+    if codec == "zstd" and zstandard is None:
+        return "zlib"
+    if codec not in ("zlib", "zstd"):
+        raise ValueError(f"Codec de texto desconhecido: {codec}")
+    return codec
+
+
+def compress_text(text: str, codec: Optional[str] = None) -> Tuple[str, bytes]:
+    """Comprimir o texto (UTF-8); retorna o codec usado e os bytes"""
+    codec = resolve_codec(codec)
+    data = text.encode("utf-8")
+    if codec == "zstd":
+        return codec, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return codec, zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    """Descomprimir um texto gravado por compress_text"""
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Texto comprimido com zstd requer o pacote zstandard instalado")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    if codec == "zlib":
+        return zlib.decompress(data).decode("utf-8")
+    raise ValueError(f"Codec de texto desconhecido: {codec}")
@@ -1,14 +1,68 @@
+import hashlib
+import json
 from typing import Dict, Any, List, Optional
-from difflib import SequenceMatcher
+
+import numpy as np
+
 from app.models import Course, DocumentExtraction
+from app.services.date_normalizer import months_worked
+from app.services.employment_periods import current_month, employment_interval, merged_months, merged_months_by_group
+from app.services.position_matcher import get_position_matcher
 
 
 class ValidationService:
     """Serviço para validação de experiência profissional"""
     
+    # Incrementar quando as regras de validação mudarem (invalida os resultados salvos)
+    # 2: união dos períodos de todas as experiências; 3: similaridade de cargo por n-gramas;
+    # 4: contratos em aberto medidos até o mês atual (inclusive o cargo, sem meses salvos)
+    RULES_VERSION = 4
+    
     def __init__(self):
         self.similarity_threshold = 0.7  # 70% de similaridade
     
+    def input_hash(self, extractions: List[DocumentExtraction], course: Course) -> str:
+        """
+        Chave da validação: conteúdo das extrações + curso, revisão do curso e versão das regras
+        Mesma chave = mesmo resultado, então a validação existente pode ser reaproveitada
+        Contrato em aberto conta até hoje: o mês atual entra na chave (o resultado muda com o tempo)
+        """
+        payload = {
+            "rules": self.RULES_VERSION,
+            "threshold": self.similarity_threshold,
+            "course": [course.id, course.revision or 1],
+            "as_of": current_month() if any(self._is_open_ended(e) for e in extractions) else None,
+            "extractions": [
+                [
+                    extraction.company_name,
+                    extraction.position,
+                    extraction.cbo_code,
+                    extraction.start_date,
+                    extraction.end_date,
+                    extraction.months_worked
+                ]
+                for extraction in extractions
+            ]
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _is_open_ended(extraction: DocumentExtraction) -> bool:
+        """Contrato sem data de saída (conta até hoje, como em employment_interval)"""
+        return bool(extraction.start_date) and extraction.end_date is None
+    
+    def _months_worked(self, extraction: DocumentExtraction) -> int:
+        """
+        Meses da experiência: contratos em aberto são recalculados até hoje
+        (months_worked salvo na extração vale para a data da extração)
+        """
+        if self._is_open_ended(extraction):
+            months = months_worked(extraction.start_date)
+            if months is not None:
+                return months
+        return extraction.months_worked or 0
+    
     def validate_experience(
         self,
         extraction: DocumentExtraction,
@@ -20,13 +74,15 @@ class ValidationService:
         Returns:
             Dict com status (approved, rejected, manual_review) e detalhes
         """
+        months = self._months_worked(extraction)
         validation_result = {
             "status": "manual_review",
             "required_months": course.minimum_months,
-            "found_months": extraction.months_worked or 0,
+            "found_months": months,
             "position_match": None,
             "details": {
                 "position_found": extraction.position,
+                "cbo_code": extraction.cbo_code,
                 "accepted_positions": course.accepted_positions,
                 "company": extraction.company_name,
                 "dates": {
@@ -36,24 +92,22 @@ class ValidationService:
             }
         }
         
+        # Verificar cargo (também sem meses: o período pode entrar na união do documento)
+        position_match = self._check_position_match(extraction, course)
+        
+        if position_match:
+            validation_result["position_match"] = position_match["matched_position"]
+            validation_result["details"]["similarity_score"] = position_match["similarity"]
+            validation_result["details"]["match_method"] = position_match["method"]
+        
         # Verificar se há meses trabalhados
-        if not extraction.months_worked or extraction.months_worked <= 0:
+        if months <= 0:
             validation_result["status"] = "manual_review"
             validation_result["details"]["reason"] = "Não foi possível calcular o tempo de experiência"
             return validation_result
         
         # Verificar tempo mínimo
-        meets_time_requirement = extraction.months_worked >= course.minimum_months
-        
-        # Verificar cargo
-        position_match = self._check_position_match(
-            extraction.position,
-            course.accepted_positions
-        )
-        
-        if position_match:
-            validation_result["position_match"] = position_match["matched_position"]
-            validation_result["details"]["similarity_score"] = position_match["similarity"]
+        meets_time_requirement = months >= course.minimum_months
         
         # Determinar status final
         if meets_time_requirement and position_match and position_match["similarity"] >= self.similarity_threshold:
@@ -61,7 +115,7 @@ class ValidationService:
             validation_result["details"]["reason"] = "Atende a todos os requisitos"
         elif not meets_time_requirement:
             validation_result["status"] = "rejected"
-            validation_result["details"]["reason"] = f"Tempo de experiência insuficiente. Requerido: {course.minimum_months} meses, Encontrado: {extraction.months_worked} meses"
+            validation_result["details"]["reason"] = f"Tempo de experiência insuficiente. Requerido: {course.minimum_months} meses, Encontrado: {months} meses"
         elif not position_match or position_match["similarity"] < self.similarity_threshold:
             validation_result["status"] = "manual_review"
             validation_result["details"]["reason"] = "Cargo não corresponde exatamente aos aceitos. Requer análise manual."
@@ -73,41 +127,41 @@ class ValidationService:
     
     def _check_position_match(
         self,
-        position: Optional[str],
-        accepted_positions: List[str]
+        extraction: DocumentExtraction,
+        course: Course
     ) -> Optional[Dict[str, Any]]:
         """
         Verificar se o cargo corresponde a algum dos aceitos
-        Usa similaridade de strings para match flexível
-        """
-        if not position or not accepted_positions:
-            return None
-        
-        position_lower = position.lower().strip()
-        best_match = None
-        best_similarity = 0.0
-        
-        for accepted in accepted_positions:
-            accepted_lower = accepted.lower().strip()
-            
-            # Calcular similaridade
-            similarity = SequenceMatcher(None, position_lower, accepted_lower).ratio()
-            
-            # Verificar se contém a palavra
-            if accepted_lower in position_lower or position_lower in accepted_lower:
-                similarity = max(similarity, 0.85)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = accepted
-        
-        if best_match:
-            return {
-                "matched_position": best_match,
-                "similarity": best_similarity
-            }
+        Com código CBO lido e códigos aceitos no curso, o casamento é exato pelo código;
+        sem código, usa o matcher compilado do curso (n-gramas sem acentos) para match flexível
+        """
+        matcher = get_position_matcher(
+            course.id,
+            course.accepted_positions,
+            course.accepted_cbo_codes
+        )
+        
+        if extraction.cbo_code and matcher.cbo_index:
+            code_match = matcher.match_code(extraction.cbo_code)
+            if code_match:
+                code_match["method"] = "cbo_code"
+            return code_match
         
-        return None
+        position_match = matcher.match(extraction.position)
+        if position_match:
+            position_match["method"] = "fuzzy"
+        return position_match
+    
+    def meets_course_requirement(
+        self,
+        extractions: List[DocumentExtraction],
+        course: Course
+    ) -> bool:
+        """
+        Verificar se as experiências já garantem aprovação no curso
+        Usado pela extração incremental para interromper o OCR
+        """
+        return bool(extractions) and self.validate_multiple_experiences(extractions, course)["status"] == "approved"
     
     def validate_multiple_experiences(
         self,
@@ -115,41 +169,141 @@ class ValidationService:
         course: Course
     ) -> Dict[str, Any]:
         """
-        Validar múltiplas experiências e consolidar resultado
+        Validar o documento considerando todas as experiências
+        Os períodos dos contratos com cargo aceito são unidos (sobrepostos ou simultâneos
+        contam uma vez só) e o total é comparado ao mínimo do curso
+        
+        Returns:
+            Dict no mesmo formato de validate_experience, com o resultado de cada experiência em details
         """
-        if not extractions:
-            return {
-                "status": "rejected",
-                "reason": "Nenhuma experiência encontrada",
-                "total_months": 0,
-                "required_months": course.minimum_months
-            }
+        experiences = self._assess_experiences(extractions, course)
+        return self._consolidate(
+            course,
+            experiences,
+            merged_months([exp["interval"] for exp in experiences if exp["interval"] and exp["qualifies"]]),
+            merged_months([exp["interval"] for exp in experiences if exp["interval"]])
+        )
+    
+    def validate_documents(
+        self,
+        extractions_by_document: Dict[int, List[DocumentExtraction]],
+        course: Course
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Validar vários documentos para o curso (validação em lote)
+        Mesmo resultado de validate_multiple_experiences; a união dos períodos de todos
+        os documentos é calculada de uma vez (NumPy)
+        """
+        document_ids = list(extractions_by_document)
+        assessed = [self._assess_experiences(extractions_by_document[document_id], course) for document_id in document_ids]
         
-        # Validar cada experiência
-        individual_validations = []
-        total_months = 0
-        approved_count = 0
+        periods = [
+            (group, exp["interval"][0], exp["interval"][1], exp["qualifies"])
+            for group, experiences in enumerate(assessed)
+            for exp in experiences
+            if exp["interval"]
+        ]
+        table = np.array(periods, dtype=np.int64).reshape(-1, 4)
+        qualifying = table[:, 3].astype(bool)
+        all_months = merged_months_by_group(table[:, 0], table[:, 1], table[:, 2], len(document_ids))
+        qualifying_months = merged_months_by_group(
+            table[qualifying, 0],
+            table[qualifying, 1],
+            table[qualifying, 2],
+            len(document_ids)
+        )
         
+        return {
+            document_id: self._consolidate(course, experiences, int(qualifying_months[group]), int(all_months[group]))
+            for group, (document_id, experiences) in enumerate(zip(document_ids, assessed))
+        }
+    
+    def _assess_experiences(
+        self,
+        extractions: List[DocumentExtraction],
+        course: Course
+    ) -> List[Dict[str, Any]]:
+        """Resultado individual, período (meses) e cargo aceito de cada experiência"""
+        experiences = []
         for extraction in extractions:
-            validation = self.validate_experience(extraction, course)
-            individual_validations.append(validation)
-            
-            if validation["status"] == "approved":
-                approved_count += 1
-                total_months += extraction.months_worked or 0
-        
-        # Determinar status consolidado
-        consolidated_status = "rejected"
-        if total_months >= course.minimum_months and approved_count > 0:
-            consolidated_status = "approved"
-        elif total_months >= course.minimum_months * 0.8:  # 80% do requisito
-            consolidated_status = "manual_review"
+            result = self.validate_experience(extraction, course)
+            similarity = result["details"].get("similarity_score")
+            experiences.append({
+                "result": result,
+                "interval": employment_interval(extraction.start_date, extraction.end_date),
+                "months": result["found_months"],
+                "qualifies": similarity is not None and similarity >= self.similarity_threshold
+            })
+        return experiences
+    
+    def _consolidate(
+        self,
+        course: Course,
+        experiences: List[Dict[str, Any]],
+        merged_qualifying_months: int,
+        merged_all_months: int
+    ) -> Dict[str, Any]:
+        """
+        Resultado do documento a partir das experiências e dos meses já unidos
+        Experiências com meses mas sem datas legíveis não podem ser unidas e somam à parte;
+        sem meses calculáveis, a experiência só pode levar à análise manual
+        """
+        undated_qualifying = sum(exp["months"] for exp in experiences if not exp["interval"] and exp["qualifies"])
+        undated_all = sum(exp["months"] for exp in experiences if not exp["interval"])
+        qualifying_months = merged_qualifying_months + undated_qualifying
+        all_months = merged_all_months + undated_all
+        unknown = sum(1 for exp in experiences if not exp["interval"] and exp["months"] <= 0)
+        overlap_months = sum(
+            exp["interval"][1] - exp["interval"][0]
+            for exp in experiences
+            if exp["interval"] and exp["qualifies"]
+        ) - merged_qualifying_months
         
-        return {
-            "status": consolidated_status,
-            "total_months": total_months,
+        # Experiência com o cargo mais parecido com os aceitos
+        matched = [exp["result"] for exp in experiences if exp["result"]["details"].get("similarity_score") is not None]
+        best = max(matched, key=lambda result: result["details"]["similarity_score"], default=None)
+        
+        individual_validations = []
+        for exp in experiences:
+            result = dict(exp["result"])
+            result["details"] = {key: value for key, value in result["details"].items() if key != "accepted_positions"}
+            individual_validations.append(result)
+        
+        validation_result = {
+            "status": "manual_review",
             "required_months": course.minimum_months,
-            "approved_experiences": approved_count,
-            "total_experiences": len(extractions),
-            "individual_validations": individual_validations
+            "found_months": all_months,
+            "position_match": best["position_match"] if best else None,
+            "details": {
+                "accepted_positions": course.accepted_positions,
+                "months_matching_position": qualifying_months,
+                "months_all_positions": all_months,
+                "overlap_months": overlap_months,
+                "total_experiences": len(experiences),
+                "approved_experiences": sum(1 for exp in experiences if exp["result"]["status"] == "approved"),
+                "experiences": individual_validations
+            }
         }
+        if best:
+            for key in ("position_found", "cbo_code", "company", "similarity_score", "match_method"):
+                validation_result["details"][key] = best["details"].get(key)
+        
+        # Determinar status final
+        if not experiences:
+            validation_result["status"] = "rejected"
+            validation_result["details"]["reason"] = "Nenhuma experiência encontrada"
+        elif qualifying_months > 0 and qualifying_months >= course.minimum_months:
+            validation_result["status"] = "approved"
+            validation_result["found_months"] = qualifying_months
+            validation_result["details"]["reason"] = "Atende a todos os requisitos"
+        elif all_months < course.minimum_months and not unknown:
+            validation_result["status"] = "rejected"
+            validation_result["details"]["reason"] = f"Tempo de experiência insuficiente. Requerido: {course.minimum_months} meses, Encontrado: {all_months} meses"
+        elif all_months < course.minimum_months:
+            validation_result["status"] = "manual_review"
+            validation_result["details"]["reason"] = "Não foi possível calcular o tempo de experiência"
+        else:
+            validation_result["status"] = "manual_review"
+            validation_result["details"]["reason"] = "Cargo não corresponde exatamente aos aceitos. Requer análise manual."
+        
+        return validation_result
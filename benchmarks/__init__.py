@@ -0,0 +1 @@
+# Benchmarks de desempenho (executar a partir da raiz: python -m benchmarks.<nome>)
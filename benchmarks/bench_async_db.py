@@ -0,0 +1,174 @@
+"""
+Benchmark: carga concorrente nas rotas de leitura — sessão síncrona vs. assíncrona
+
+Popula o banco da DATABASE_URL com cursos, documentos e extrações e dispara
+requisições concorrentes (em processo, pelo transporte ASGI do httpx) contra duas
+versões das mesmas rotas: a anterior (async def com Session síncrona, bloqueando o
+event loop a cada consulta) e as rotas atuais (AsyncSession). Mostra requisições
+por segundo e latências p50/p99. Os dados criados são removidos no final.
+
+Uso:
+    python -m benchmarks.bench_async_db [--requests 5000] [--concurrency 50] [--documents 200]
+
+Os números só são representativos com PostgreSQL (ida e volta de rede a cada consulta).
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import List
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.api import course_router, document_router, validation_router
+from app.core.database import SessionLocal, async_engine, get_db, init_db
+from app.models import Course, Document, DocumentExtraction
+from app.repositories import CourseRepository, DocumentRepository
+from app.schemas import CourseResponse, DocumentExtractionResponse
+
+
+def legacy_app() -> FastAPI:
+    """Rotas como eram antes: async def, mas com a sessão e os repositórios síncronos"""
+    router = APIRouter()
+    
+    @router.get("/courses/{course_id}", response_model=CourseResponse)
+    async def get_course(course_id: int, db: Session = Depends(get_db)):
+        return CourseRepository(db).get_course(course_id)
+    
+    @router.get("/documents/{document_id}/extractions", response_model=List[DocumentExtractionResponse])
+    async def get_document_extractions(document_id: int, db: Session = Depends(get_db)):
+        repo = DocumentRepository(db)
+        repo.get_document(document_id)
+        return repo.get_extractions_by_document(document_id)
+    
+    @router.get("/validations/document/{document_id}")
+    async def get_document_validations(document_id: int, db: Session = Depends(get_db)):
+        repo = DocumentRepository(db)
+        repo.get_document(document_id)
+        return [validation.id for validation in repo.get_validations_by_document(document_id)]
+    
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def async_app() -> FastAPI:
+    """Rotas atuais (AsyncSession), sem os eventos de inicialização da aplicação"""
+    app = FastAPI()
+    app.include_router(course_router.router)
+    app.include_router(document_router.router)
+    app.include_router(validation_router.router)
+    return app
+
+
+def seed(documents: int, extractions_per_document: int):
+    """Criar os dados do benchmark; retorna (ids dos cursos, ids dos documentos)"""
+    tag = uuid.uuid4().hex[:8]
+    db = SessionLocal()
+    try:
+        courses = [
+            Course(
+                name=f"Curso {i}",
+                code=f"BENCH-{tag}-{i}",
+                minimum_months=12,
+                accepted_positions=["Técnico em Informática"]
+            )
+            for i in range(10)
+        ]
+        docs = [
+            Document(filename=f"bench-{tag}-{i}.pdf", file_path=f"/tmp/bench-{tag}-{i}.pdf", file_type="pdf")
+            for i in range(documents)
+        ]
+        db.add_all(courses + docs)
+        db.flush()
+        db.add_all(
+            DocumentExtraction(
+                document_id=document.id,
+                company_name=f"Empresa {j}",
+                position="Técnico em Informática",
+                start_date="01/02/2019",
+                end_date="01/06/2021",
+                months_worked=28,
+                raw_text="texto " * 200
+            )
+            for document in docs
+            for j in range(extractions_per_document)
+        )
+        db.commit()
+        return [course.id for course in courses], [document.id for document in docs]
+    finally:
+        db.close()
+
+
+def cleanup(course_ids: List[int], document_ids: List[int]):
+    db = SessionLocal()
+    try:
+        for document in db.query(Document).filter(Document.id.in_(document_ids)):
+            db.delete(document)
+        db.query(Course).filter(Course.id.in_(course_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_load(app: FastAPI, paths: List[str], total: int, concurrency: int):
+    """Disparar `total` requisições com `concurrency` clientes; retorna (req/s, latências em s)"""
+    latencies: List[float] = []
+    queue = iter(range(total))
+    
+    async def client_loop(client: httpx.AsyncClient):
+        for i in queue:
+            start = time.perf_counter()
+            response = await client.get(paths[i % len(paths)])
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Aquecer pools de conexão
+        await asyncio.gather(*(client.get(paths[i % len(paths)]) for i in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return total / elapsed, sorted(latencies)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--extractions", type=int, default=3, help="extrações por documento")
+    args = parser.parse_args()
+    
+    init_db()
+    course_ids, document_ids = seed(args.documents, args.extractions)
+    paths = []
+    for i, document_id in enumerate(document_ids):
+        paths.append(f"/courses/{course_ids[i % len(course_ids)]}")
+        paths.append(f"/documents/{document_id}/extractions")
+        paths.append(f"/validations/document/{document_id}")
+    
+    try:
+        rows = []
+        for name, app in (("síncrona (anterior)", legacy_app()), ("assíncrona", async_app())):
+            rate, latencies = asyncio.run(run_load(app, paths, args.requests, args.concurrency))
+            rows.append((name, rate, _percentile(latencies, 0.5), _percentile(latencies, 0.99)))
+            asyncio.run(async_engine.dispose())
+    finally:
+        cleanup(course_ids, document_ids)
+    
+    print(f"{args.requests} requisições, {args.concurrency} clientes concorrentes, {args.documents} documentos\n")
+    print(f"{'sessão':<22} {'req/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for name, rate, p50, p99 in rows:
+        print(f"{name:<22} {rate:>10,.0f} {p50 * 1000:>10.1f} {p99 * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: parser de experiências profissionais — v1 (regex por linha) vs. v2 (compilado)
+
+Gera textos sintéticos grandes no formato de saída do OCR (blocos de contrato
+intercalados com linhas de ruído: cabeçalhos, anotações, linhas em branco) e mede
+o tempo de cada versão do parser, verificando que ambas produzem o mesmo resultado.
+
+Uso:
+    python -m benchmarks.bench_experience_parser [--entries 2000] [--noise 6] [--repeat 5]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.experience_parser import EXPERIENCE_PARSERS
+from benchmarks.fixtures import contract_entry
+
+NOISE_LINES = [
+    "CARTEIRA DE TRABALHO E PREVIDÊNCIA SOCIAL",
+    "ANOTAÇÕES GERAIS",
+    "Ministério do Trabalho e Emprego",
+    "Assinatura do empregado",
+    "Remuneração especificada R$ 1.850,00 (mil oitocentos e cinquenta reais)",
+    "Alterações de salário conforme convenção coletiva",
+    "Férias 2019/2020 gozadas no período regular",
+    "~ ;. ' ,, |",
+    "Página 12",
+]
+
+
+def make_text(entries: int, noise: int, seed: int = 42) -> str:
+    """Texto com `entries` contratos e até `noise` linhas de ruído entre eles"""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(entries):
+        noise_block = "\n".join(rng.choice(NOISE_LINES) for _ in range(rng.randint(0, noise)))
+        if noise_block:
+            parts.append(noise_block)
+        parts.append(contract_entry(rng))
+    return "\n\n".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--noise", type=int, default=6, help="máximo de linhas de ruído entre contratos")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    text = make_text(args.entries, args.noise)
+    print(f"Texto: {len(text) / 1024:.0f} KB, {text.count(chr(10)) + 1} linhas, {args.entries} contratos")
+    
+    results = {}
+    timings = {}
+    for version, parser_class in EXPERIENCE_PARSERS.items():
+        experience_parser = parser_class()
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[version] = experience_parser.parse(text)
+            samples.append(time.perf_counter() - start)
+        timings[version] = statistics.median(samples)
+    
+    reference = next(iter(results.values()))
+    baseline = timings["v1"]
+    print(f"\n{'versão':<8} {'mediana (ms)':>13} {'speedup':>8} {'experiências':>13} {'igual à v1':>11}")
+    for version, elapsed in timings.items():
+        same = "sim" if results[version] == reference else "NÃO"
+        print(
+            f"{version:<8} {elapsed * 1000:>13.1f} {baseline / elapsed:>7.2f}x "
+            f"{len(results[version]):>13} {same:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
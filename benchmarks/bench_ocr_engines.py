@@ -0,0 +1,76 @@
+"""
+Benchmark: engines de OCR — custo de inicialização e overhead por página
+
+Para cada engine registrado (ver app/services/ocr_engines.py) mede:
+  - inicialização: criação do engine + primeira chamada (carga do idioma)
+  - overhead por página: chamada em uma imagem mínima (quase sem trabalho de OCR)
+  - página real: tempo por página chamando uma a uma vs. em lote
+
+Uso:
+    python -m benchmarks.bench_ocr_engines [--pages 8] [--repeat 10]
+
+Requer tesseract (com idioma por); o engine tesserocr é medido se o pacote estiver instalado.
+"""
+import argparse
+import shutil
+import statistics
+import time
+
+from PIL import Image
+
+from app.services import ocr_engines
+from benchmarks.fixtures import make_pages
+
+
+def _median_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    
+    if not shutil.which("tesseract"):
+        raise SystemExit("❌ tesseract é necessário para este benchmark")
+    
+    tiny = Image.new("L", (64, 24), color=255)
+    pages = [page for page, _ in make_pages(args.pages)]
+    
+    print(f"🔬 Engines de OCR ({args.pages} páginas A4 @ 300 DPI)\n")
+    print(f"{'engine':<10} {'inicialização (ms)':>19} {'overhead/página (ms)':>21} "
+          f"{'página única (ms)':>18} {'em lote (ms/pág)':>17}")
+    
+    for name, engine_class in ocr_engines.OCR_ENGINES.items():
+        start = time.perf_counter()
+        try:
+            engine = engine_class(lang="por")
+            engine.image_to_string(tiny)
+        except RuntimeError as e:
+            print(f"{name:<10} indisponível: {e}")
+            continue
+        startup_ms = (time.perf_counter() - start) * 1000
+        
+        overhead_ms = _median_ms(lambda: engine.image_to_string(tiny), args.repeat)
+        
+        start = time.perf_counter()
+        for page in pages:
+            engine.image_to_string(page)
+        single_ms = (time.perf_counter() - start) * 1000 / len(pages)
+        
+        start = time.perf_counter()
+        engine.images_to_strings(pages)
+        batch_ms = (time.perf_counter() - start) * 1000 / len(pages)
+        
+        engine.close()
+        print(f"{name:<10} {startup_ms:>19.1f} {overhead_ms:>21.1f} {single_ms:>18.0f} {batch_ms:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
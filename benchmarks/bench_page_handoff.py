@@ -0,0 +1,76 @@
+"""
+Benchmark: entrega da página ao OCR em memória vs. ida e volta por JPEG em /tmp
+
+Mede o custo por página do caminho antigo (salvar JPEG, reabrir, decodificar, remover)
+contra a entrega direta da imagem decodificada. Com --ocr, mede também o tempo total
+incluindo o Tesseract.
+
+Uso:
+    python -m benchmarks.bench_page_handoff [--pages 10] [--ocr]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from PIL import Image
+
+from benchmarks.fixtures import make_pages
+
+
+def _jpeg_round_trip(image: Image.Image, tmp_dir: str, index: int) -> Image.Image:
+    path = os.path.join(tmp_dir, f"page_{index}.jpg")
+    image.save(path, "JPEG")
+    reopened = Image.open(path)
+    reopened.load()
+    os.remove(path)
+    return reopened
+
+
+def _in_memory(image: Image.Image, tmp_dir: str, index: int) -> Image.Image:
+    return image
+
+
+def _measure(handoff, images, tmp_dir, ocr=None):
+    timings = []
+    for index, image in enumerate(images):
+        start = time.perf_counter()
+        page = handoff(image, tmp_dir, index)
+        if ocr:
+            ocr(page)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--ocr", action="store_true", help="incluir o OCR (requer tesseract)")
+    args = parser.parse_args()
+    
+    ocr = None
+    if args.ocr:
+        if not shutil.which("tesseract"):
+            raise SystemExit("❌ tesseract é necessário para --ocr")
+        from app.services.ocr_service import OCRService
+        ocr = OCRService().extract_text_from_image
+    
+    # Páginas RGB a 300 DPI, como entregues pelo pdf2image
+    images = [page.convert("RGB") for page, _ in make_pages(args.pages)]
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jpeg = _measure(_jpeg_round_trip, images, tmp_dir, ocr)
+        memory = _measure(_in_memory, images, tmp_dir, ocr)
+    
+    jpeg_ms = statistics.median(jpeg) * 1000
+    memory_ms = statistics.median(memory) * 1000
+    print(f"🔬 Entrega de página ao OCR ({args.pages} páginas A4 @ 300 DPI{', com OCR' if ocr else ''})\n")
+    print(f"  JPEG em /tmp : {jpeg_ms:9.2f} ms/página (mediana)")
+    print(f"  Em memória   : {memory_ms:9.2f} ms/página (mediana)")
+    print(f"  Economia     : {jpeg_ms - memory_ms:9.2f} ms/página")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: listagem paginada de documentos — OFFSET vs. cursor (keyset) e total contado vs. em cache
+
+Gera num banco próprio (--database-url) uma tabela de documentos e mede, em várias
+profundidades, o tempo de buscar uma página com skip (OFFSET) e com after_id (o que
+GET /documents faz a partir do cursor), além do custo do total a cada chamada
+(COUNT) vs. em cache (TotalCountCache). Os dados são reaproveitados entre execuções.
+
+Uso:
+    python -m benchmarks.bench_pagination [--database-url sqlite:///./bench_pagination.db]
+        [--documents 500000] [--limit 100] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models import Document
+from app.repositories import DocumentRepository
+from app.services.pagination import TotalCountCache
+
+INSERT_BATCH = 50_000
+
+
+def seed(engine, documents: int):
+    """Recriar as tabelas e inserir os documentos em lotes"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    started = datetime(2023, 1, 1)
+    for offset in range(0, documents, INSERT_BATCH):
+        with engine.begin() as conn:
+            conn.execute(insert(Document), [
+                {"filename": f"doc-{i}.pdf", "file_path": f"/uploads/doc-{i}.pdf", "file_type": "pdf",
+                 "uploaded_at": started + timedelta(minutes=i)}
+                for i in range(offset, min(offset + INSERT_BATCH, documents))
+            ])
+
+
+def median_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./bench_pagination.db")
+    parser.add_argument("--documents", type=int, default=500_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        existing = conn.scalar(select(func.count()).select_from(Document))
+    if existing != args.documents:
+        start = time.perf_counter()
+        seed(engine, args.documents)
+        print(f"Dados gerados em {time.perf_counter() - start:.0f}s")
+    
+    depths = sorted({0, 10_000, 100_000, args.documents // 2, args.documents - args.limit} & set(range(args.documents)))
+    print(f"{args.documents:,} documentos, páginas de {args.limit}\n")
+    print(f"{'profundidade':>12} {'OFFSET (ms)':>12} {'cursor (ms)':>12} {'ganho':>8}")
+    with Session(engine) as db:
+        repo = DocumentRepository(db)
+        for depth in depths:
+            # ID do último documento da página anterior (o que o cursor carrega)
+            after_id = db.scalar(select(Document.id).order_by(Document.id).offset(depth - 1).limit(1)) if depth else None
+            offset_page = repo.get_all_documents(skip=depth, limit=args.limit)
+            keyset_page = repo.get_all_documents(after_id=after_id, limit=args.limit + 1)[:args.limit]
+            assert [d.id for d in offset_page] == [d.id for d in keyset_page]
+            db.expunge_all()
+            
+            offset_time = median_time(lambda: repo.get_all_documents(skip=depth, limit=args.limit), args.repeat)
+            keyset_time = median_time(
+                lambda: repo.get_all_documents(after_id=after_id, limit=args.limit + 1),
+                args.repeat
+            )
+            db.expunge_all()
+            print(f"{depth:>12,} {offset_time * 1000:>12.2f} {keyset_time * 1000:>12.2f} {offset_time / keyset_time:>7.1f}x")
+        
+        async def count():
+            return repo.count_documents()
+        
+        cache = TotalCountCache()
+        count_time = median_time(repo.count_documents, args.repeat)
+        asyncio.run(cache.get_or_count("documents", None, count))
+        cached_time = median_time(lambda: asyncio.run(cache.get_or_count("documents", None, count)), args.repeat)
+    
+    print(f"\n{'total':<12} {'por chamada (ms)':>17}")
+    print(f"{'COUNT':<12} {count_time * 1000:>17.2f}")
+    print(f"{'em cache':<12} {cached_time * 1000:>17.3f}  (inclui asyncio.run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: OCR de PDF sequencial vs. paralelo por página (pool de processos)
+
+Uso:
+    python -m benchmarks.bench_parallel_ocr [--pages 1 2 4 8 16 20] [--workers N]
+
+Requer tesseract (com idioma por) e poppler instalados.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from app.services import ocr_service
+from app.services.ocr_service import OCRService
+from benchmarks.fixtures import make_pdf
+
+
+def _time_extraction(service: OCRService, pdf_path: str) -> float:
+    start = time.perf_counter()
+    text = service.extract_text(pdf_path, "pdf")
+    elapsed = time.perf_counter() - start
+    if not text:
+        raise RuntimeError("OCR não retornou texto")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4, 8, 16, 20])
+    parser.add_argument("--workers", type=int, default=0, help="0 = número de CPUs")
+    args = parser.parse_args()
+    
+    if not shutil.which("tesseract") or not shutil.which("pdftoppm"):
+        raise SystemExit("❌ tesseract e poppler (pdftoppm) são necessários para este benchmark")
+    
+    ocr_service.settings.OCR_PROCESS_WORKERS = args.workers
+    workers = args.workers or os.cpu_count()
+    sequential = OCRService(execution_mode="sequential")
+    parallel = OCRService(execution_mode="process")
+    
+    # Aquecer o pool (fork dos processos não entra na medição)
+    ocr_service.get_process_pool().submit(os.getpid).result()
+    
+    print(f"🔬 OCR por página: sequencial vs. pool de processos ({workers} workers)\n")
+    print(f"{'páginas':>8} {'sequencial (s)':>15} {'paralelo (s)':>13} {'speedup':>8}")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page_count in args.pages:
+            pdf_path = os.path.join(tmp_dir, f"booklet_{page_count}.pdf")
+            make_pdf(pdf_path, page_count)
+            
+            seq_time = _time_extraction(sequential, pdf_path)
+            par_time = _time_extraction(parallel, pdf_path)
+            print(f"{page_count:>8} {seq_time:>15.2f} {par_time:>13.2f} {seq_time / par_time:>7.2f}x")
+    
+    ocr_service.shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Benchmark: planos e tempos das consultas de relatórios e repositórios — sem vs. com os índices da migração 5
+
+Gera num banco próprio (--database-url; NÃO use o banco da aplicação: os índices são
+removidos e recriados) milhões de linhas de documentos, extrações e validações,
+executa cada consulta do ReportService e dos repositórios (as versões assíncronas
+emitem o mesmo SQL) e mostra a mediana do tempo e o plano de cada instrução
+(EXPLAIN QUERY PLAN no SQLite, EXPLAIN no PostgreSQL), primeiro sem os índices
+compostos e depois com eles. Os dados são reaproveitados entre execuções (--reseed
+para gerar de novo).
+
+Uso:
+    python -m benchmarks.bench_query_plans [--database-url sqlite:///./bench_query_plans.db]
+        [--documents 200000] [--validations 5] [--extractions 3] [--repeat 5]
+"""
+import argparse
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models import Course, Document, DocumentExtraction, DocumentText, Validation
+from app.repositories import CourseRepository, DocumentRepository
+from app.services.reparse_service import ReparseService
+from app.services.report_service import ReportService
+from app.services.text_storage import compress_text
+
+# Índices criados pela migração 5 (app/core/migrations.py)
+QUERY_INDEXES = [
+    (DocumentExtraction.__table__, "ix_document_extractions_document_id"),
+    (Validation.__table__, "ix_validations_course_status"),
+    (Validation.__table__, "ix_validations_course_document"),
+]
+STATUSES = ["approved", "approved", "rejected", "manual_review"]
+INSERT_BATCH = 50_000
+
+
+def seed(engine, documents: int, courses: int, validations: int, extractions: int, rng: random.Random):
+    """Recriar as tabelas e inserir os dados em lotes"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    started = datetime(2023, 1, 1)
+    
+    def batches(rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == INSERT_BATCH:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    with engine.begin() as conn:
+        conn.execute(insert(Course), [
+            {
+                "name": f"Curso {i}",
+                "code": f"C{i:04d}",
+                "minimum_months": 12,
+                "accepted_positions": ["Técnico em Informática"],
+                "is_active": i % 5 != 0,
+                "revision": 1
+            }
+            for i in range(courses)
+        ])
+        for batch in batches(
+            {"filename": f"doc-{i}.pdf", "file_path": f"/uploads/doc-{i}.pdf", "file_type": "pdf",
+             "uploaded_at": started + timedelta(minutes=i)}
+            for i in range(documents)
+        ):
+            conn.execute(insert(Document), batch)
+        # Texto armazenado (o mesmo para todos: só o reparse lê a tabela)
+        codec, compressed = compress_text("Empregador: ACME LTDA\nCargo: Técnico em Informática", "zlib")
+        for batch in batches(
+            {"document_id": i, "codec": codec, "compressed_text": compressed, "original_size": 52,
+             "created_at": started + timedelta(minutes=i)}
+            for i in range(1, documents + 1)
+        ):
+            conn.execute(insert(DocumentText), batch)
+    
+    # Extrações e validações intercaladas entre documentos (como em produção: ids não agrupados por documento)
+    def extraction_rows():
+        for round_number in range(extractions):
+            for document_id in range(1, documents + 1):
+                yield {
+                    "document_id": document_id,
+                    "company_name": f"Empresa {rng.randint(1, 5000)}",
+                    "position": "Técnico em Informática",
+                    "start_date": "01/02/2019",
+                    "end_date": "01/06/2021",
+                    "months_worked": 28,
+                    "parser_version": "v2" if rng.random() < 0.9 else "v1",
+                    "extracted_at": started + timedelta(minutes=document_id, seconds=round_number)
+                }
+    
+    def validation_rows():
+        for round_number in range(validations):
+            for document_id in range(1, documents + 1):
+                yield {
+                    "document_id": document_id,
+                    "course_id": rng.randint(1, courses),
+                    "status": rng.choice(STATUSES),
+                    "required_months": 12,
+                    "found_months": rng.randint(0, 120),
+                    "position_match": "Técnico em Informática",
+                    "input_hash": f"{rng.getrandbits(256):064x}",
+                    "validated_at": started + timedelta(minutes=document_id, hours=round_number)
+                }
+    
+    for table, rows in ((DocumentExtraction, extraction_rows()), (Validation, validation_rows())):
+        for batch in batches(rows):
+            with engine.begin() as conn:
+                conn.execute(insert(table), batch)
+
+
+def set_query_indexes(engine, enabled: bool):
+    """Criar ou remover os índices da migração 5 e atualizar as estatísticas do planejador"""
+    with engine.begin() as conn:
+        for table, name in QUERY_INDEXES:
+            index = next(i for i in table.indexes if i.name == name)
+            if enabled:
+                index.create(conn, checkfirst=True)
+            else:
+                index.drop(conn, checkfirst=True)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+
+@contextmanager
+def capture_statements(engine):
+    """Instruções SQL (com parâmetros) executadas no bloco"""
+    statements: List[Tuple[str, object]] = []
+    
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+    
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def explain(engine, statement: str, parameters) -> str:
+    """Plano da instrução resumido numa linha"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            return "; ".join(row[-1] for row in rows)
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+        return "; ".join(row[0].strip().lstrip("-> ").split("  (")[0] for row in rows if "Scan" in row[0] or "Aggregate" in row[0])
+
+
+def sample_ids(engine, rng: random.Random) -> dict:
+    """Documento, curso e validação usados nas consultas"""
+    with engine.connect() as conn:
+        documents = conn.scalar(select(func.max(Document.id)))
+        busiest_course = conn.execute(
+            select(Validation.course_id).group_by(Validation.course_id).order_by(func.count().desc()).limit(1)
+        ).scalar()
+        document_id = rng.randint(1, documents)
+        validation = conn.execute(
+            select(Validation.id, Validation.input_hash, Validation.course_id).where(
+                Validation.document_id == document_id
+            ).limit(1)
+        ).first()
+    batch = rng.sample(range(1, documents + 1), min(200, documents))
+    return {
+        "documents": documents,
+        "document_id": document_id,
+        "course_id": busiest_course,
+        "validation": validation,
+        "batch": batch
+    }
+
+
+def cases(ids: dict) -> List[Tuple[str, Callable[[Session], object]]]:
+    report = ReportService()
+    validation = ids["validation"]
+    return [
+        ("ReportService.generate_document_report",
+         lambda db: report.generate_document_report(ids["document_id"], db)),
+        ("ReportService.generate_validation_summary",
+         lambda db: report.generate_validation_summary(validation.id, db)),
+        ("ReportService.generate_course_statistics",
+         lambda db: report.generate_course_statistics(ids["course_id"], db)),
+        ("DocumentRepository.get_extractions_by_document",
+         lambda db: DocumentRepository(db).get_extractions_by_document(ids["document_id"])),
+        ("DocumentRepository.get_extractions_by_documents",
+         lambda db: DocumentRepository(db).get_extractions_by_documents(ids["batch"])),
+        ("DocumentRepository.get_validations_by_document",
+         lambda db: DocumentRepository(db).get_validations_by_document(ids["document_id"])),
+        ("DocumentRepository.get_validation_by_input_hash",
+         lambda db: DocumentRepository(db).get_validation_by_input_hash(
+             ids["document_id"], validation.course_id, validation.input_hash)),
+        ("DocumentRepository.get_validations_by_input_hashes",
+         lambda db: DocumentRepository(db).get_validations_by_input_hashes(
+             ids["course_id"], {document_id: "0" * 64 for document_id in ids["batch"]})),
+        ("DocumentRepository.count_validated_documents",
+         lambda db: DocumentRepository(db).count_validated_documents(ids["course_id"])),
+        ("DocumentRepository.get_latest_validations_for_course",
+         lambda db: DocumentRepository(db).get_latest_validations_for_course(
+             ids["course_id"], after_document_id=ids["documents"] // 2)),
+        ("CourseRepository.get_all_courses",
+         lambda db: CourseRepository(db).get_all_courses(active_only=True)),
+        ("ReparseService._next_chunk",
+         lambda db: ReparseService(parser_version="v2", chunk_size=200, use_process_pool=False)._next_chunk(db, 0)),
+    ]
+
+
+def run_cases(engine, case_list, repeat: int) -> dict:
+    """Mediana do tempo (s) e planos das instruções de cada caso"""
+    results = {}
+    for name, case in case_list:
+        timings = []
+        plans = []
+        for attempt in range(repeat + 1):
+            with Session(engine) as db, capture_statements(engine) as statements:
+                start = time.perf_counter()
+                case(db)
+                elapsed = time.perf_counter() - start
+            # Primeira execução aquece o cache de páginas e coleta os planos
+            if attempt == 0:
+                plans = [explain(engine, statement, parameters) for statement, parameters in statements]
+            else:
+                timings.append(elapsed)
+        results[name] = (statistics.median(timings), plans)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./bench_query_plans.db")
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--validations", type=int, default=5, help="validações por documento")
+    parser.add_argument("--extractions", type=int, default=3, help="extrações por documento")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reseed", action="store_true")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        existing = conn.scalar(select(func.count()).select_from(Document))
+    if args.reseed or existing != args.documents:
+        start = time.perf_counter()
+        seed(engine, args.documents, args.courses, args.validations, args.extractions, rng)
+        print(f"Dados gerados em {time.perf_counter() - start:.0f}s")
+    
+    with engine.connect() as conn:
+        counts = {
+            table.__tablename__: conn.scalar(select(func.count()).select_from(table))
+            for table in (Document, DocumentExtraction, Validation)
+        }
+    print(", ".join(f"{name}: {count:,}" for name, count in counts.items()) + "\n")
+    
+    case_list = cases(sample_ids(engine, rng))
+    set_query_indexes(engine, enabled=False)
+    before = run_cases(engine, case_list, args.repeat)
+    set_query_indexes(engine, enabled=True)
+    after = run_cases(engine, case_list, args.repeat)
+    
+    print(f"{'consulta':<52} {'sem (ms)':>10} {'com (ms)':>10} {'ganho':>8}")
+    for name, _ in case_list:
+        old, new = before[name][0], after[name][0]
+        print(f"{name:<52} {old * 1000:>10.2f} {new * 1000:>10.2f} {old / new:>7.1f}x")
+    
+    print("\nPlanos (sem → com os índices):")
+    for name, _ in case_list:
+        print(f"\n{name}")
+        for old_plan, new_plan in zip(before[name][1], after[name][1]):
+            print(f"  - {old_plan}")
+            print(f"  + {new_plan}")
+
+
+if __name__ == "__main__":
+    main()
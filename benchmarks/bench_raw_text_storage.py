@@ -0,0 +1,133 @@
+"""
+Benchmark: armazenamento do texto extraído — cópia por extração vs. um registro comprimido por documento
+
+Gera carteiras de trabalho sintéticas (várias páginas, contratos intercalados com
+ruído de OCR), parseia as experiências e compara:
+- bytes gravados: texto completo repetido em cada extração vs. texto comprimido
+  uma vez por documento (zlib e, se instalado, zstd) com os offsets das páginas;
+- tamanho da resposta de GET /documents/{id}/extractions com e sem o texto;
+- vazão de compressão e descompressão.
+
+Uso:
+    python -m benchmarks.bench_raw_text_storage [--documents 500] [--pages 8] [--contracts 10]
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+
+from app.services.experience_parser import get_experience_parser
+from app.services.text_storage import compress_text, decompress_text, join_pages, zstandard
+from benchmarks.bench_experience_parser import NOISE_LINES
+from benchmarks.fixtures import contract_entry
+
+
+def make_document(pages: int, contracts: int, rng: random.Random):
+    """Páginas de uma carteira: contratos distribuídos entre elas, com ruído de OCR"""
+    page_texts = []
+    remaining = contracts
+    for page_number in range(1, pages + 1):
+        lines = [rng.choice(NOISE_LINES) for _ in range(rng.randint(3, 10))]
+        blocks = ["\n".join(lines)]
+        # Distribuir os contratos entre as páginas restantes
+        on_page = -(-remaining // (pages - page_number + 1)) if remaining else 0
+        for _ in range(on_page):
+            blocks.append(contract_entry(rng))
+            blocks.append("\n".join(rng.choice(NOISE_LINES) for _ in range(rng.randint(0, 4))))
+        remaining -= on_page
+        page_texts.append((page_number, "\n\n".join(block for block in blocks if block)))
+    return page_texts
+
+
+def extraction_response(document_id: int, index: int, exp: dict, raw_text=None) -> dict:
+    """Item de DocumentExtractionResponse como serializado pela API"""
+    item = {
+        "id": index,
+        "document_id": document_id,
+        "company_name": exp.get("company_name"),
+        "position": exp.get("position"),
+        "cbo_code": exp.get("cbo_code"),
+        "start_date": exp.get("start_date"),
+        "end_date": exp.get("end_date"),
+        "months_worked": exp.get("months_worked"),
+        "extracted_data": exp,
+        "parser_version": "v2",
+        "extracted_at": datetime(2024, 1, 1).isoformat()
+    }
+    if raw_text is not None:
+        item["raw_text"] = raw_text
+    return item
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--contracts", type=int, default=10)
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    experience_parser = get_experience_parser("v2")
+    codecs = ["zlib"] + (["zstd"] if zstandard is not None else [])
+    
+    texts = []
+    per_extraction_bytes = 0
+    extractions = 0
+    response_before = 0
+    response_after = 0
+    offsets_bytes = 0
+    for document_id in range(args.documents):
+        text, offsets = join_pages(make_document(args.pages, args.contracts, rng))
+        experiences = experience_parser.parse(text)
+        size = len(text.encode("utf-8"))
+        texts.append((text, offsets))
+        extractions += len(experiences)
+        per_extraction_bytes += size * len(experiences)
+        offsets_bytes += len(json.dumps(offsets))
+        response_before += len(json.dumps([
+            extraction_response(document_id, i, exp, text) for i, exp in enumerate(experiences)
+        ]))
+        response_after += len(json.dumps([
+            extraction_response(document_id, i, exp) for i, exp in enumerate(experiences)
+        ]))
+    
+    raw_bytes = sum(len(text.encode("utf-8")) for text, _ in texts)
+    print(
+        f"{args.documents} documentos, {extractions} extrações "
+        f"({extractions / args.documents:.1f} por documento), texto médio {raw_bytes / args.documents / 1024:.1f} KB\n"
+    )
+    print(f"{'armazenamento':<32} {'total (KB)':>12} {'por doc (KB)':>13} {'redução':>8}")
+    print(f"{'texto em cada extração':<32} {per_extraction_bytes / 1024:>12,.0f} "
+          f"{per_extraction_bytes / args.documents / 1024:>13.1f} {'1.0x':>8}")
+    print(f"{'texto uma vez por documento':<32} {raw_bytes / 1024:>12,.0f} "
+          f"{raw_bytes / args.documents / 1024:>13.1f} {per_extraction_bytes / raw_bytes:>7.1f}x")
+    
+    timings = {}
+    for codec in codecs:
+        start = time.perf_counter()
+        compressed = [compress_text(text, codec)[1] for text, _ in texts]
+        compress_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for data in compressed:
+            decompress_text(codec, data)
+        decompress_time = time.perf_counter() - start
+        timings[codec] = (compress_time, decompress_time)
+        
+        stored = sum(len(data) for data in compressed) + offsets_bytes
+        label = f"{codec} por documento + offsets"
+        print(f"{label:<32} {stored / 1024:>12,.0f} "
+              f"{stored / args.documents / 1024:>13.1f} {per_extraction_bytes / stored:>7.1f}x")
+    
+    print(f"\n{'resposta de /extractions':<32} {'total (KB)':>12} {'por doc (KB)':>13}")
+    print(f"{'com raw_text':<32} {response_before / 1024:>12,.0f} {response_before / args.documents / 1024:>13.1f}")
+    print(f"{'sem raw_text':<32} {response_after / 1024:>12,.0f} {response_after / args.documents / 1024:>13.1f}")
+    
+    print(f"\n{'codec':<8} {'compressão (MB/s)':>18} {'descompressão (MB/s)':>21}")
+    megabytes = raw_bytes / 1024 / 1024
+    for codec, (compress_time, decompress_time) in timings.items():
+        print(f"{codec:<8} {megabytes / compress_time:>18,.0f} {megabytes / decompress_time:>21,.0f}")
+
+
+if __name__ == "__main__":
+    main()
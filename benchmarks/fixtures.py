@@ -0,0 +1,71 @@
+"""
+Geração de documentos sintéticos para os benchmarks
+Páginas no formato de carteira de trabalho com texto conhecido (permite medir acurácia)
+"""
+import os
+import random
+from typing import List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+PAGE_SIZE_300_DPI = (2480, 3508)  # A4 a 300 DPI
+
+COMPANIES = [
+    "ACME Comercio LTDA", "Beta Servicos SA", "Gama Tecnologia ME",
+    "Delta Logistica LTDA", "Hospital Santa Clara", "Contabil Alfa EIRELI"
+]
+POSITIONS = [
+    "Tecnico em Informatica", "Auxiliar Administrativo", "Auxiliar de Enfermagem",
+    "Assistente Contabil", "Estoquista", "Programador"
+]
+
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    for candidate in ("DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"):
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def contract_entry(rng: random.Random) -> str:
+    """Gerar um bloco de contrato de trabalho"""
+    start_year = rng.randint(2005, 2020)
+    end_year = start_year + rng.randint(1, 4)
+    return "\n".join([
+        f"Empregador: {rng.choice(COMPANIES)}",
+        f"CNPJ: {rng.randint(10, 99)}.{rng.randint(100, 999)}.{rng.randint(100, 999)}/0001-{rng.randint(10, 99)}",
+        f"Cargo: {rng.choice(POSITIONS)}",
+        f"CBO {rng.randint(1000, 9999)}-{rng.randint(10, 99)}",
+        f"Admissao: {rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{start_year}",
+        f"Saida: {rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{end_year}",
+    ])
+
+
+def render_page(text: str, size: Tuple[int, int] = PAGE_SIZE_300_DPI, font_size: int = 42) -> Image.Image:
+    """Renderizar texto em uma página branca"""
+    image = Image.new("L", size, color=255)
+    draw = ImageDraw.Draw(image)
+    font = _load_font(font_size)
+    draw.multiline_text((160, 200), text, fill=0, font=font, spacing=font_size // 2)
+    return image
+
+
+def make_pages(page_count: int, entries_per_page: int = 2, seed: int = 42) -> List[Tuple[Image.Image, str]]:
+    """Gerar páginas sintéticas e o texto esperado de cada uma"""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(page_count):
+        text = "\n\n".join(contract_entry(rng) for _ in range(entries_per_page))
+        pages.append((render_page(text), text))
+    return pages
+
+
+def make_pdf(path: str, page_count: int, seed: int = 42) -> List[str]:
+    """Gerar PDF sintético (somente imagem) com page_count páginas; retorna o texto esperado"""
+    pages = make_pages(page_count, seed=seed)
+    images = [page.convert("RGB") for page, _ in pages]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    images[0].save(path, "PDF", resolution=300, save_all=True, append_images=images[1:])
+    return [text for _, text in pages]
@@ -0,0 +1,45 @@
+"""
+Script para reprocessar extrações a partir do texto já armazenado (sem OCR)
+Use após melhorias no parser de experiências profissionais
+"""
+import argparse
+import time
+
+from app.core.database import init_db
+from app.services.ocr_service import shutdown_process_pool
+from app.services.reparse_service import ReparseService, REPARSE_CHUNK_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parser-version", default=None, help="versão do parser (padrão: EXPERIENCE_PARSER_VERSION)")
+    parser.add_argument("--chunk-size", type=int, default=REPARSE_CHUNK_SIZE, help="documentos por transação")
+    parser.add_argument("--in-process", action="store_true",
+                        help="parsear no próprio processo (padrão: pool compartilhado, OCR_PROCESS_WORKERS processos)")
+    parser.add_argument("--force", action="store_true", help="reprocessar também documentos já na versão")
+    args = parser.parse_args()
+    
+    init_db()
+    service = ReparseService(
+        parser_version=args.parser_version,
+        chunk_size=args.chunk_size,
+        use_process_pool=not args.in_process,
+        force=args.force
+    )
+    
+    print(f"🔄 Reprocessando extrações com o parser {service.parser_version}...")
+    start = time.perf_counter()
+    try:
+        stats = service.run()
+    finally:
+        shutdown_process_pool()
+    elapsed = time.perf_counter() - start
+    
+    print(f"✅ {stats['documents_processed']} documento(s) em {elapsed:.1f}s")
+    print(f"  - atualizados: {stats['documents_updated']} ({stats['extractions_written']} extrações)")
+    print(f"  - sem experiências (mantidos): {stats['documents_empty']}")
+    print(f"  - com erro: {stats['documents_failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Configuração dos testes: banco SQLite temporário e sem cache de OCR
+As variáveis precisam existir antes de importar app (settings e engines são criados no import)
+"""
+import os
+import tempfile
+from datetime import date
+
+import pytest
+
+_test_dir = tempfile.mkdtemp(prefix="validacao-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_test_dir, 'test.db')}")
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_test_dir, "uploads"))
+os.environ.setdefault("OCR_CACHE_BACKEND", "none")
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """Fixar date.today() nos módulos que medem contratos em aberto: today(date(2027, 6, 1))"""
+    from app.services import date_normalizer, employment_periods
+    
+    def pin(value: date):
+        class FixedDate(date):
+            @classmethod
+            def today(cls):
+                return value
+        monkeypatch.setattr(date_normalizer, "date", FixedDate)
+        monkeypatch.setattr(employment_periods, "date", FixedDate)
+    return pin
@@ -0,0 +1,55 @@
+"""Índice do catálogo: todo curso que o matcher pode aprovar precisa ser candidato"""
+import random
+
+from app.models import Course, DocumentExtraction
+from app.services.eligibility_service import CourseCatalogIndex
+from app.services.validation_service import ValidationService
+
+POSITIONS = [
+    "Eletricista", "Técnico em Informática", "Auxiliar Administrativo", "Cozinheiro",
+    "Assistente Contábil", "Técnico de Enfermagem", "Mecânico de Manutenção", "Soldador",
+    "Programador", "Estoquista", "Auxiliar de Enfermagem", "Gestão de TI",
+]
+OCR_CONFUSIONS = {"i": "l", "l": "1", "o": "0", "e": "c", "m": "rn", "a": "o"}
+
+
+def make_catalog():
+    return [
+        Course(id=course_id, accepted_positions=[position], accepted_cbo_codes=[])
+        for course_id, position in enumerate(POSITIONS, start=1)
+    ]
+
+
+def ocr_typo(text: str, rng: random.Random) -> str:
+    chars = list(text)
+    for _ in range(rng.randint(1, 2)):
+        index = rng.randrange(len(chars))
+        chars[index] = OCR_CONFUSIONS.get(chars[index].lower(), chars[index])
+    return "".join(chars)
+
+
+def test_ocr_typo_reaches_scoring():
+    index = CourseCatalogIndex(make_catalog())
+    assert 1 in index.candidates(DocumentExtraction(position="Eletrlcista"))
+
+
+def test_cbo_prefix_is_candidate():
+    course = Course(id=99, accepted_positions=[], accepted_cbo_codes=["3171"])
+    index = CourseCatalogIndex([course])
+    assert index.candidates(DocumentExtraction(position="", cbo_code="317110")) == {99}
+
+
+def test_every_course_the_matcher_approves_is_a_candidate():
+    rng = random.Random(3)
+    catalog = make_catalog()
+    index = CourseCatalogIndex(catalog)
+    service = ValidationService()
+    
+    for _ in range(500):
+        position = ocr_typo(rng.choice(POSITIONS), rng)
+        extraction = DocumentExtraction(position=position)
+        candidates = index.candidates(extraction)
+        for course in catalog:
+            match = service._check_position_match(extraction, course)
+            if match and match["similarity"] >= service.similarity_threshold:
+                assert course.id in candidates, (position, course.accepted_positions)
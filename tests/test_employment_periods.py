@@ -0,0 +1,70 @@
+"""União vetorizada dos períodos (merged_months_by_group) deve bater com a varredura (merged_months)"""
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.services.employment_periods import (
+    employment_interval,
+    merged_months,
+    merged_months_by_group,
+    month_index
+)
+
+
+def merge_cohort(cohort):
+    groups = np.fromiter((g for g, intervals in enumerate(cohort) for _ in intervals), dtype=np.int64)
+    starts = np.fromiter((s for intervals in cohort for s, _ in intervals), dtype=np.int64)
+    ends = np.fromiter((e for intervals in cohort for _, e in intervals), dtype=np.int64)
+    return merged_months_by_group(groups, starts, ends, len(cohort)).tolist()
+
+
+@pytest.mark.parametrize("intervals, expected", [
+    ([], 0),
+    ([(0, 12)], 12),
+    # Sobrepostos
+    ([(0, 12), (6, 18)], 18),
+    # Contíguos
+    ([(0, 12), (12, 24)], 24),
+    # Contido em outro
+    ([(0, 24), (3, 6)], 24),
+    # Simultâneos
+    ([(5, 10), (5, 10)], 5),
+    # Com intervalo entre eles
+    ([(0, 6), (10, 16)], 12),
+    # Fora de ordem
+    ([(30, 40), (0, 10), (5, 35)], 40),
+])
+def test_merge_edge_cases(intervals, expected):
+    assert merged_months(intervals) == expected
+    assert merge_cohort([intervals]) == [expected]
+
+
+def test_open_ended_period_counts_until_today():
+    interval = employment_interval("01/01/2020")
+    assert interval == (month_index(date(2020, 1, 1)), month_index(date.today()))
+    closed = employment_interval("01/06/2019", "01/03/2020")
+    cohort = [[interval, closed]]
+    assert merge_cohort(cohort) == [merged_months([interval, closed])]
+
+
+def test_documents_do_not_mix():
+    cohort = [[(0, 12)], [], [(6, 18), (0, 3)], [(0, 12)]]
+    assert merge_cohort(cohort) == [12, 0, 15, 12]
+
+
+def test_vectorized_matches_sweep_on_random_cohorts():
+    rng = random.Random(7)
+    for _ in range(200):
+        cohort = []
+        for _ in range(rng.randint(1, 20)):
+            intervals = []
+            for _ in range(rng.randint(0, 8)):
+                start = rng.randint(2000 * 12, 2024 * 12)
+                # Inclui contíguos e idênticos ao período anterior
+                if intervals and rng.random() < 0.3:
+                    start = rng.choice(intervals)[rng.randint(0, 1)]
+                intervals.append((start, start + rng.randint(1, 60)))
+            cohort.append(intervals)
+        assert merge_cohort(cohort) == [merged_months(intervals) for intervals in cohort]
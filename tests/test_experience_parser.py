@@ -0,0 +1,83 @@
+"""O parser compilado (v2) deve produzir exatamente o mesmo resultado do original (v1)"""
+import random
+
+import pytest
+
+from app.services.experience_parser import CompiledExperienceParser, RegexExperienceParser
+
+COMPANY_LINES = [
+    "Empregador: ACME Comercio LTDA",
+    "EMPRESA: Beta Servicos SA",
+    "Razão Social: Hospital Santa Clara",
+    "CNPJ: 12.345.678/0001-90 Gama Tecnologia ME",
+    "cnpj 12345678000190",
+]
+POSITION_LINES = [
+    "Cargo: Tecnico em Informatica",
+    "Função: Auxiliar Administrativo",
+    "OCUPAÇÃO: Assistente Contabil",
+    "CBO 3171-10 Programador",
+    "CBO: 4110.10",
+    "CBO 41",
+    "Cargo:",
+]
+DATE_LINES = [
+    "Admissão: 01/02/2015",
+    "Data de entrada 5-3-19",
+    "Saída: 30/11/2018",
+    "Desligamento 15-06-2020",
+    "Período 01/02/2015 a 30/11/2018",
+    "Em 1/1/2019 e 2/2/2020 e 3/3/2021",
+    "Data: 99/99/9999",
+]
+NOISE_LINES = [
+    "CARTEIRA DE TRABALHO E PREVIDÊNCIA SOCIAL",
+    "ANOTAÇÕES GERAIS",
+    "Remuneração especificada R$ 1.850,00",
+    "Férias 2019/2020 gozadas",
+    "~ ;. ' ,, |",
+    "Página 12",
+]
+SEPARATORS = ["\n", "\n\n", "\n   \n", "\n\t\n\n", "\r\n", "\n\r\n", "\n\f\n", "\n \r \n"]
+
+CONTRACT = """Empregador: ACME Comercio LTDA
+CNPJ: 12.345.678/0001-90
+Cargo: Auxiliar Administrativo
+CBO 4110-10
+Admissao: 01/02/2015
+Saida: 30/11/2018"""
+
+
+def random_text(rng: random.Random) -> str:
+    """Texto no formato do OCR: linhas de contrato e ruído com separadores variados"""
+    pools = [COMPANY_LINES, POSITION_LINES, DATE_LINES, NOISE_LINES]
+    parts = []
+    for _ in range(rng.randint(0, 30)):
+        line = rng.choice(rng.choice(pools))
+        if rng.random() < 0.2:
+            line = "  " + line.lower() + "  "
+        parts.append(line)
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "\n\n\n",
+    CONTRACT,
+    CONTRACT + "\n\n" + CONTRACT.replace("Saida: 30/11/2018", ""),
+    CONTRACT.replace("\n", "\n  \n"),
+    CONTRACT.replace("\n", "\r\n"),
+    "Admissão: 01/02/2015\nCargo: Estoquista",
+    "Ruído sem contrato\nOutra linha\n\nMais ruído",
+])
+def test_v2_matches_v1_on_fixed_samples(text):
+    assert CompiledExperienceParser().parse(text) == RegexExperienceParser().parse(text)
+
+
+def test_v2_matches_v1_on_random_corpus():
+    rng = random.Random(42)
+    v1, v2 = RegexExperienceParser(), CompiledExperienceParser()
+    for _ in range(2000):
+        text = random_text(rng)
+        assert v2.parse(text) == v1.parse(text), text
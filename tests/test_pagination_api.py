@@ -0,0 +1,108 @@
+"""Paginação por cursor das listagens de cursos e documentos"""
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.main import app
+from app.models import Document
+from app.services.pagination import encode_cursor
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        for number in range(5):
+            response = client.post("/courses/", json={
+                "name": f"Curso de Paginação {number}",
+                "code": f"PAG-{number}",
+                "accepted_positions": ["Auxiliar Administrativo"],
+                "is_active": number % 2 == 0
+            })
+            assert response.status_code == 201
+        
+        db = SessionLocal()
+        try:
+            db.add_all(
+                Document(filename=f"doc{number}.pdf", file_path=f"/tmp/doc{number}.pdf", file_type="pdf")
+                for number in range(5)
+            )
+            db.commit()
+        finally:
+            db.close()
+        yield client
+
+
+def _all_course_pages(client, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/courses/", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.json()
+        ids.extend(course["id"] for course in body["courses"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids, body["total"], pages
+
+
+def test_course_cursor_round_trip(client):
+    all_ids = [course["id"] for course in client.get("/courses/", params={"limit": 100}).json()["courses"]]
+    ids, total, pages = _all_course_pages(client, limit=2)
+    
+    assert ids == all_ids == sorted(all_ids)
+    assert total == len(all_ids)
+    assert pages == -(-len(all_ids) // 2)
+
+
+def test_course_cursor_keeps_filters(client):
+    ids, total, _ = _all_course_pages(client, limit=1, active_only=True)
+    
+    active = client.get("/courses/", params={"active_only": True}).json()["courses"]
+    assert ids == [course["id"] for course in active]
+    assert total == len(active) == 3
+
+
+def test_course_cursor_with_other_filters_is_rejected(client):
+    cursor = client.get("/courses/", params={"limit": 1}).json()["next_cursor"]
+    assert cursor
+    
+    response = client.get("/courses/", params={"limit": 1, "active_only": True, "cursor": cursor})
+    assert response.status_code == 400
+    assert "outros filtros" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "%%%", encode_cursor(1)[:-3], "eyJmb28iOjF9"])
+def test_invalid_course_cursor_is_rejected(client, cursor):
+    response = client.get("/courses/", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_document_cursor_round_trip(client):
+    all_ids = [document["id"] for document in client.get("/documents/", params={"limit": 100}).json()]
+    
+    ids, cursor = [], None
+    while True:
+        response = client.get("/documents/", params={"limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == str(len(all_ids))
+        ids.extend(document["id"] for document in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    
+    assert ids == all_ids == sorted(all_ids)
+
+
+def test_document_cursor_with_filters_is_rejected(client):
+    cursor = encode_cursor(1, {"active_only": True})
+    response = client.get("/documents/", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_invalid_document_cursor_is_rejected(client):
+    response = client.get("/documents/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
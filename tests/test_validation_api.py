@@ -0,0 +1,198 @@
+"""Regras com estado da validação: idempotência, revisões do curso, casamento por CBO e lote"""
+import time
+from datetime import date
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.main import app
+from app.models import Document, DocumentExtraction
+from app.repositories import DocumentRepository
+from app.services.job_service import job_service
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def create_course(client, code: str, **fields) -> dict:
+    response = client.post("/courses/", json={
+        "name": f"Curso {code}",
+        "code": code,
+        "minimum_months": 12,
+        "accepted_positions": ["Eletricista"],
+        **fields
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def create_document(*extractions: dict) -> int:
+    """Documento já extraído, com uma linha de DocumentExtraction por experiência"""
+    db = SessionLocal()
+    try:
+        document = Document(filename="ctps.pdf", file_path="/tmp/ctps.pdf", file_type="pdf")
+        document.extractions = [
+            DocumentExtraction(company_name="Empresa", **extraction)
+            for extraction in extractions
+        ]
+        db.add(document)
+        db.commit()
+        return document.id
+    finally:
+        db.close()
+
+
+def validate(client, document_id: int, course_id: int):
+    return client.post("/validations/", json={"document_id": document_id, "course_id": course_id})
+
+
+def wait_for_job(job_id: str, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    job = job_service.get(job_id)
+    while not job.is_finished:
+        assert time.monotonic() < deadline, "job de revalidação não terminou"
+        time.sleep(0.05)
+    return job
+
+
+def test_resubmit_returns_existing_validation(client):
+    course = create_course(client, "IDEM-1")
+    document_id = create_document(
+        {"position": "Eletricista", "start_date": "01/01/2015", "end_date": "01/01/2018", "months_worked": 36}
+    )
+
+    first = validate(client, document_id, course["id"])
+    second = validate(client, document_id, course["id"])
+
+    assert first.status_code == 201
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert len(client.get(f"/validations/document/{document_id}").json()) == 1
+
+
+def test_open_contract_resubmit_depends_on_current_month(client, today):
+    course = create_course(client, "IDEM-2")
+    document_id = create_document(
+        {"position": "Eletricista", "start_date": "01/01/2026", "end_date": None, "months_worked": 0}
+    )
+
+    today(date(2026, 4, 10))
+    early = validate(client, document_id, course["id"])
+    same_month = validate(client, document_id, course["id"])
+    today(date(2027, 6, 1))
+    later = validate(client, document_id, course["id"])
+
+    assert early.status_code == 201
+    assert early.json()["status"] == "rejected"
+    assert same_month.status_code == 200
+    assert same_month.json()["id"] == early.json()["id"]
+    assert later.status_code == 201
+    assert later.json()["id"] != early.json()["id"]
+    assert later.json()["status"] == "approved"
+
+
+def test_revision_bumps_only_on_requirement_fields(client):
+    course = create_course(client, "REV-1")
+    document_id = create_document(
+        {"position": "Eletricista", "start_date": "01/01/2015", "end_date": "01/01/2018", "months_worked": 36}
+    )
+    validation = validate(client, document_id, course["id"]).json()
+    assert validation["status"] == "approved"
+
+    response = client.put(f"/courses/{course['id']}", json={"description": "Nova descrição"})
+    assert response.status_code == 200
+    assert response.json()["revision"] == course["revision"]
+    assert "X-Revalidation-Job" not in response.headers
+    assert validate(client, document_id, course["id"]).status_code == 200
+
+    response = client.put(f"/courses/{course['id']}", json={"minimum_months": 48})
+    assert response.status_code == 200
+    assert response.json()["revision"] == course["revision"] + 1
+    job = wait_for_job(response.headers["X-Revalidation-Job"])
+    assert job.status == "completed"
+
+    # A revalidação reescreveu a validação com o hash da nova revisão
+    revalidated = validate(client, document_id, course["id"])
+    assert revalidated.status_code == 200
+    assert revalidated.json()["id"] == validation["id"]
+    assert revalidated.json()["status"] == "rejected"
+    assert revalidated.json()["required_months"] == 48
+
+
+@pytest.mark.parametrize("extraction, status, method", [
+    # Código lido e aceito: aprova mesmo com o cargo ilegível
+    ({"position": "Xxxx", "cbo_code": "715615"}, "approved", "cbo_code"),
+    # Código lido e não aceito: não cai no casamento por nome (tempo suficiente, cargo a conferir)
+    ({"position": "Eletricista", "cbo_code": "999999"}, "manual_review", None),
+    # Sem código: casamento aproximado pelo nome, tolerante a erro de OCR
+    ({"position": "Eletrlcista", "cbo_code": None}, "approved", "fuzzy"),
+])
+def test_cbo_code_versus_fuzzy_fallback(client, extraction, status, method):
+    course = create_course(client, f"CBO-{status}-{method}", accepted_cbo_codes=["7156"])
+    document_id = create_document(
+        {"start_date": "01/01/2015", "end_date": "01/01/2018", "months_worked": 36, **extraction}
+    )
+
+    validation = validate(client, document_id, course["id"]).json()
+
+    assert validation["status"] == status
+    assert validation["validation_details"].get("match_method") == method
+
+
+def test_batch_reuses_existing_validations(client):
+    course = create_course(client, "LOTE-1")
+    document_ids = [
+        create_document(
+            {"position": "Eletricista", "start_date": "01/01/2015", "end_date": "01/01/2018", "months_worked": 36}
+        )
+        for _ in range(3)
+    ]
+    single = validate(client, document_ids[0], course["id"]).json()
+
+    first = client.post("/validations/batch", json={"course_id": course["id"], "document_ids": document_ids})
+    second = client.post("/validations/batch", json={"course_id": course["id"], "document_ids": document_ids})
+
+    assert first.status_code == second.status_code == 201
+    first_results = first.json()["results"]
+    second_results = second.json()["results"]
+    assert [item["reused"] for item in first_results] == [True, False, False]
+    assert first_results[0]["validation_id"] == single["id"]
+    assert all(item["reused"] for item in second_results)
+    assert [item["validation_id"] for item in second_results] == [item["validation_id"] for item in first_results]
+
+
+def test_batch_retries_after_concurrent_insert(client, monkeypatch):
+    course = create_course(client, "LOTE-2")
+    document_ids = [
+        create_document(
+            {"position": "Eletricista", "start_date": "01/01/2015", "end_date": "01/01/2018", "months_worked": 36}
+        )
+        for _ in range(2)
+    ]
+    existing = client.post("/validations/batch", json={"course_id": course["id"], "document_ids": document_ids}).json()
+
+    # Primeira leitura não enxerga as validações (como se outra requisição as gravasse em paralelo):
+    # a inserção viola a restrição única e o lote é relido na segunda tentativa
+    original = DocumentRepository.get_validations_by_input_hashes
+    calls = []
+
+    def stale_first_read(self, course_id, input_hashes):
+        calls.append(course_id)
+        return {} if len(calls) == 1 else original(self, course_id, input_hashes)
+
+    monkeypatch.setattr(DocumentRepository, "get_validations_by_input_hashes", stale_first_read)
+    response = client.post("/validations/batch", json={"course_id": course["id"], "document_ids": document_ids})
+
+    assert response.status_code == 201
+    assert len(calls) == 2
+    results = response.json()["results"]
+    assert all(item["reused"] for item in results)
+    assert [item["validation_id"] for item in results] == [item["validation_id"] for item in existing["results"]]
@@ -0,0 +1,72 @@
+"""Regras de validação que dependem da data atual (contratos em aberto)"""
+from datetime import date
+
+from app.models import Course, DocumentExtraction
+from app.services.validation_service import ValidationService
+
+
+def make_course(course_id: int) -> Course:
+    return Course(
+        id=course_id,
+        name="Eletrotécnica",
+        code=f"ELT-{course_id}",
+        minimum_months=12,
+        accepted_positions=["Eletricista"],
+        accepted_cbo_codes=[],
+        revision=1
+    )
+
+
+def open_contract(months_worked: int) -> DocumentExtraction:
+    return DocumentExtraction(
+        company_name="ACME",
+        position="Eletricista",
+        start_date="01/01/2026",
+        end_date=None,
+        months_worked=months_worked
+    )
+
+
+def test_open_contract_is_measured_until_today(today):
+    service = ValidationService()
+    course = make_course(9001)
+    extractions = [open_contract(months_worked=3)]
+    
+    today(date(2026, 4, 10))
+    early_hash = service.input_hash(extractions, course)
+    early = service.validate_multiple_experiences(extractions, course)
+    
+    today(date(2027, 6, 10))
+    late_hash = service.input_hash(extractions, course)
+    late = service.validate_multiple_experiences(extractions, course)
+    
+    assert early["status"] == "rejected"
+    assert early["found_months"] == 3
+    assert late["status"] == "approved"
+    assert late["found_months"] == 17
+    assert late["details"]["experiences"][0]["found_months"] == 17
+    # Resultado mudou com o tempo: a chave de idempotência também
+    assert early_hash != late_hash
+
+
+def test_closed_contract_hash_does_not_depend_on_today(today):
+    service = ValidationService()
+    course = make_course(9002)
+    extraction = open_contract(months_worked=12)
+    extraction.end_date = "01/01/2027"
+    
+    today(date(2027, 2, 1))
+    first = service.input_hash([extraction], course)
+    today(date(2030, 2, 1))
+    assert service.input_hash([extraction], course) == first
+
+
+def test_open_contract_saved_with_zero_months_counts_for_position(today):
+    service = ValidationService()
+    course = make_course(9003)
+    
+    today(date(2027, 3, 1))
+    result = service.validate_multiple_experiences([open_contract(months_worked=0)], course)
+    
+    assert result["status"] == "approved"
+    assert result["details"]["months_matching_position"] == 14